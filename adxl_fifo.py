@@ -0,0 +1,155 @@
+# ============================================================
+#   ADXL345 with FIFO + on-chip gesture detection
+#   register-level driver on a busio.I2C-like bus
+# ============================================================
+
+# registers
+_DEVID = 0x00
+_THRESH_TAP = 0x1D
+_DUR = 0x21
+_THRESH_ACT = 0x24
+_ACT_INACT_CTL = 0x27
+_TAP_AXES = 0x2A
+_BW_RATE = 0x2C
+_POWER_CTL = 0x2D
+_INT_ENABLE = 0x2E
+_INT_SOURCE = 0x30
+_DATA_FORMAT = 0x31
+_DATAX0 = 0x32
+_FIFO_CTL = 0x38
+_FIFO_STATUS = 0x39
+
+# INT_SOURCE / INT_ENABLE bits
+INT_DATA_READY = 0x80
+INT_SINGLE_TAP = 0x40
+INT_ACTIVITY = 0x10
+GESTURES = INT_SINGLE_TAP | INT_ACTIVITY
+
+# output data rate codes (BW_RATE)
+RATE_25HZ = 0x08
+RATE_50HZ = 0x09
+RATE_100HZ = 0x0A
+
+# full resolution: 4 mg per LSB (same factor as adafruit_adxl34x)
+MS2_PER_LSB = 0.004 * 9.80665
+_G_PER_THRESH = 0.0625     # THRESH_TAP / THRESH_ACT: 62.5 mg per LSB
+
+
+def _s16(lo, hi):
+    v = lo | (hi << 8)
+    return v - 65536 if v & 0x8000 else v
+
+
+class FifoADXL345:
+    """
+    fifo=True : stream mode, drain() returns every sample taken
+                since the last call (32 deep, ~1.3 s at 25 Hz);
+                one more 6 byte read per sample after the first:
+                2.5 I2C reads per 100 ms frame at 25 Hz, 10 at 100 Hz
+    fifo=False: bypass mode, only the latest sample, one burst
+                read per frame
+
+    Shakes too short for the frame rate are still caught by the
+    chip: ACTIVITY (AC-coupled, shake_g) and SINGLE_TAP (tap_g)
+    latch in INT_SOURCE until drain() reads it.
+    """
+
+    def __init__(self, i2c, address=0x53, rate=RATE_25HZ, fifo=True,
+                 shake_g=2.0, tap_g=3.0):
+        self.i2c = i2c
+        self.address = address
+        self.fifo = fifo
+
+        self._reg = bytearray(2)
+        self._buf = bytearray(10)
+        self._raw = [0] * (3 * 33)     # FIFO + output registers
+        self.events = 0
+        self.transactions = 0
+
+        self._write(_POWER_CTL, 0x00)            # standby while configuring
+        self._write(_DATA_FORMAT, 0x0B)          # full resolution, +-16 g
+        self._write(_BW_RATE, rate)
+        self._write(_THRESH_TAP, int(tap_g / _G_PER_THRESH))
+        self._write(_DUR, 0x20)                  # tap shorter than 20 ms
+        self._write(_TAP_AXES, 0x07)             # tap on x, y, z
+        self._write(_THRESH_ACT, int(shake_g / _G_PER_THRESH))
+        self._write(_ACT_INACT_CTL, 0xF0)        # AC-coupled activity on x, y, z
+        self._write(_INT_ENABLE, GESTURES)
+        self._write(_FIFO_CTL, 0x9F if fifo else 0x00)   # stream, 31 watermark
+        self._write(_POWER_CTL, 0x08)            # measure
+
+    # -------------------------------------------------
+    # bus
+    # -------------------------------------------------
+    def _write(self, reg, value):
+        self._reg[0] = reg
+        self._reg[1] = value
+        while not self.i2c.try_lock():
+            pass
+        try:
+            self.i2c.writeto(self.address, self._reg)
+        finally:
+            self.i2c.unlock()
+        self.transactions += 1
+
+    def _read(self, reg, n):
+        self._reg[0] = reg
+        while not self.i2c.try_lock():
+            pass
+        try:
+            self.i2c.writeto_then_readfrom(self.address, self._reg, self._buf,
+                                           out_end=1, in_end=n)
+        finally:
+            self.i2c.unlock()
+        self.transactions += 1
+        return self._buf
+
+    def _sample(self, buf, i):
+        return (_s16(buf[i], buf[i + 1]) * MS2_PER_LSB,
+                _s16(buf[i + 2], buf[i + 3]) * MS2_PER_LSB,
+                _s16(buf[i + 4], buf[i + 5]) * MS2_PER_LSB)
+
+    # -------------------------------------------------
+    # data
+    # -------------------------------------------------
+    @property
+    def acceleration(self):
+        """one (x, y, z) in m/s^2, like adafruit_adxl34x"""
+        return self._sample(self._read(_DATAX0, 6), 0)
+
+    def drain_raw(self, out):
+        """
+        every sample since the last call, in counts (4 mg), into a
+        preallocated list: out[3i], out[3i+1], out[3i+2] = x, y, z
+        return: number of samples, gesture bits land in self.events
+        """
+        # one burst INT_SOURCE .. FIFO_STATUS: flags, oldest sample
+        # and how many are left behind it
+        buf = self._read(_INT_SOURCE, 10)
+        self.events = buf[0] & GESTURES
+        if not buf[0] & INT_DATA_READY:
+            return 0
+
+        n = 1 + (buf[9] & 0x3F if self.fifo else 0)
+        n = min(n, len(out) // 3)
+        i = 2
+        for k in range(0, 3 * n, 3):
+            out[k] = _s16(buf[i], buf[i + 1])
+            out[k + 1] = _s16(buf[i + 2], buf[i + 3])
+            out[k + 2] = _s16(buf[i + 4], buf[i + 5])
+            if k + 3 < 3 * n:
+                buf = self._read(_DATAX0, 6)
+                i = 0
+        return n
+
+    def drain(self):
+        """
+        return: (samples, events)
+            samples: list of (x, y, z) m/s^2, oldest first
+            events : INT_SOURCE bits (GESTURES) latched since last call
+        """
+        raw = self._raw
+        n = self.drain_raw(raw)
+        samples = [(raw[k] * MS2_PER_LSB, raw[k + 1] * MS2_PER_LSB, raw[k + 2] * MS2_PER_LSB)
+                   for k in range(0, 3 * n, 3)]
+        return samples, self.events
@@ -0,0 +1,97 @@
+# ============================================================
+#   Non-blocking buzzer sequencer
+# ============================================================
+
+import time
+
+
+class MelodyPlayer:
+    """
+    Plays (freq, duration) melodies on ONE reusable PWM channel.
+
+    start(melody) -> begin playback, returns immediately
+    poll()        -> call every frame, True while still playing
+    stop()        -> silence right now
+
+    pwm must be created with variable_frequency=True so the
+    note can change without re-allocating the channel.
+    """
+
+    def __init__(self, pwm, clock=time.monotonic, gap=0.02, volume=32768):
+        self.pwm = pwm
+        self.clock = clock
+        self.gap = gap            # silence after every note
+        self.volume = volume      # duty cycle while a tone sounds
+
+        self.melody = None
+        self.index = 0
+        self._in_gap = False
+        self._deadline = 0
+        self._freq = 0
+
+        self.pwm.duty_cycle = 0
+
+    # -------------------------------------------------
+    # control
+    # -------------------------------------------------
+    def start(self, melody):
+        if not melody:
+            self.stop()
+            return
+        self.melody = melody
+        self.index = 0
+        self._in_gap = False
+        self._deadline = self.clock() + melody[0][1]
+        self._output()
+
+    def stop(self):
+        self.melody = None
+        self.index = 0
+        self._in_gap = False
+        self.pwm.duty_cycle = 0
+
+    def is_playing(self):
+        return self.melody is not None
+
+    # -------------------------------------------------
+    # advance
+    # -------------------------------------------------
+    def poll(self):
+        if self.melody is None:
+            return False
+
+        now = self.clock()
+        if now < self._deadline:
+            return True
+
+        # catch up on every phase that ended since last poll,
+        # only touch the PWM once for the phase we land in
+        while now >= self._deadline:
+            if not self._in_gap:
+                self._in_gap = True
+                self._deadline += self.gap
+            else:
+                self.index += 1
+                if self.index >= len(self.melody):
+                    self.stop()
+                    return False
+                self._in_gap = False
+                self._deadline += self.melody[self.index][1]
+
+        self._output()
+        return True
+
+    def _output(self):
+        if self._in_gap:
+            self.pwm.duty_cycle = 0
+            return
+
+        freq = self.melody[self.index][0]
+        if freq == 0:
+            self.pwm.duty_cycle = 0
+            return
+
+        if freq != self._freq:
+            self.pwm.frequency = freq
+            self._freq = freq
+        self.pwm.duty_cycle = self.volume
@@ -1,36 +1,121 @@
+from lane_map import LANES, FULL
+
+# ============================================================
+#   Characters
+#   a skill is data: "effect" picks what it does, the other
+#   keys are its numbers. A new character with an existing
+#   effect is one more entry here, no code.
+#
+#   effect  keys
+#   slow    step_time   seconds per row while it lasts
+#   clear   rows, lanes rows from the top of the screen,
+#                       lanes "all" / "own" / "near" (own +-1)
+#   score   amount      added to the score (HP)
+#   dash    rows        map jumps forward
+#
+#   every skill also has (defaults in SKILL_DEFAULTS):
+#   charge    % per row the map moves, skill at 100
+#   cooldown  rows after a use before charging starts again
+#   duration  rows a timed effect (slow) lasts, 0: rest of the level
+# ============================================================
+
 characters = [
     {
         "name": "Homura",
         "skill": "Time Slow",
         "shape": "diamond",
-        "color": (150, 0, 220)
+        "color": (150, 0, 220),
+        "effect": "slow", "step_time": 4
     },
     {
         "name": "Madoka",
         "skill": "Full Screen Purify",
         "shape": "circle",
-        "color": (200, 50, 70)
+        "color": (200, 50, 70),
+        "effect": "clear", "rows": 6, "lanes": "all"
     },
     {
         "name": "Mami",
         "skill": "Long-range Attack",
         "shape": "flower",
-        "color": (230, 160, 10)
+        "color": (230, 160, 10),
+        "effect": "clear", "rows": 10, "lanes": "own"
     },
     {
         "name": "Sayaka",
         "skill": "Self Heal",
         "shape": "square",
-        "color": (60, 140, 255)
+        "color": (60, 140, 255),
+        "effect": "score", "amount": 200
     },
     {
         "name": "Kyouko",
         "skill": "Fast Dash",
         "shape": "triangle",
-        "color": (230, 10, 10)
+        "color": (230, 10, 10),
+        "effect": "dash", "rows": 3
+    },
+    {
+        "name": "Nagisa",
+        "skill": "Bubble Burst",
+        "shape": "circle",
+        "color": (255, 110, 180),
+        "effect": "clear", "rows": 8, "lanes": "near",
+        "charge": 4, "cooldown": 5
     }
 ]
-from game_manager import GameManager
+
+SKILL_DEFAULTS = {"charge": 5, "cooldown": 0, "duration": 0}
+
+# lane bitmask per player column
+LANE_MASKS = {
+    "all": (FULL,) * LANES,
+    "own": tuple(1 << c for c in range(LANES)),
+    "near": tuple((7 << c >> 1) & FULL for c in range(LANES)),
+}
+
+
+# -------------------------------
+#   effects
+# -------------------------------
+def _use_slow(skill, game_manager, grid, offset, player_col):
+    game_manager.set_step_time(skill["step_time"])
+
+
+def _end_slow(skill, game_manager):
+    game_manager.set_step_time(game_manager.current_difficulty()["step_time"])
+
+
+def _use_clear(skill, game_manager, grid, offset, player_col):
+    grid.clear_rows(offset, offset + skill["rows"], LANE_MASKS[skill["lanes"]][player_col])
+
+
+def _use_score(skill, game_manager, grid, offset, player_col):
+    game_manager.update_score(skill["amount"])
+
+
+def _use_dash(skill, game_manager, grid, offset, player_col):
+    game_manager.update_offset(skill["rows"])
+
+
+# effect: (use, end) - end undoes a timed effect, None if it has none
+EFFECTS = {
+    "slow": (_use_slow, _end_slow),
+    "clear": (_use_clear, None),
+    "score": (_use_score, None),
+    "dash": (_use_dash, None),
+}
+
+
+def make_skill(character):
+    """return: (use, end, skill) - skill is the character with the defaults filled in"""
+    skill = dict(SKILL_DEFAULTS)
+    skill.update(character)
+    if skill.get("effect") not in EFFECTS:
+        raise ValueError("%s: unknown skill effect %r" % (skill["name"], skill.get("effect")))
+    use, end = EFFECTS[skill["effect"]]
+    return use, end, skill
+
 
 class CharacterManager:
     def __init__(self):
@@ -38,6 +123,10 @@ class CharacterManager:
         self.index = 0
         self.charge = 0
         self.max_charge = 100
+        # looked up once here, a bad entry fails at boot, not mid-level
+        self.skills = [make_skill(c) for c in self.list]
+        self.cooldown = 0       # rows until charging again
+        self.active = 0         # rows until the timed effect ends
 
     def current(self):
         return self.list[self.index]
@@ -50,15 +139,40 @@ class CharacterManager:
 
     def get_color(self):
         return self.current()["color"]
-    
+
     def get_charge(self):
         return self.charge
-    
+
     def add_charge(self, amount):
         self.charge = min(self.max_charge, self.charge + amount)
-    
-    def try_use_skill(self, game_manager,grid,offset, player_col):
 
+    def reach(self):
+        """most rows from the top of the screen a skill clears"""
+        return max([s["rows"] for _, _, s in self.skills if s["effect"] == "clear"] or [0])
+
+    def new_game(self):
+        """no charge carried over from the last game"""
+        self.charge = 0
+        self.cooldown = 0
+        self.active = 0
+
+    def new_level(self):
+        """generate_map() resets step_time, a timed effect ends with its level"""
+        self.active = 0
+
+    def step(self, game_manager):
+        """once per row the map moves: charge, cooldown, timed effect"""
+        use, end, skill = self.skills[self.index]
+        if self.active:
+            self.active -= 1
+            if self.active == 0:
+                end(skill, game_manager)
+        if self.cooldown:
+            self.cooldown -= 1
+        else:
+            self.add_charge(skill["charge"])
+
+    def try_use_skill(self, game_manager,grid,offset, player_col):
 
         if self.charge < self.max_charge:
             return None
@@ -66,46 +180,12 @@ class CharacterManager:
         # recharge
         self.charge = 0
 
-        # skills
-        if self.index == 0:
-            self.skill_homura(game_manager)
-        elif self.index == 1:
-            self.skill_madoka(grid, offset)
-        elif self.index == 2:
-            self.skill_mami(grid, offset,player_col)
-        elif self.index == 3:
-            self.skill_sayaka(game_manager)
-        elif self.index == 4:
-            self.skill_kyoko(game_manager)
-            
+        use, end, skill = self.skills[self.index]
+        use(skill, game_manager, grid, offset, player_col)
+        self.cooldown = skill["cooldown"]
+        if end:
+            self.active = skill["duration"]
+
         print("Skill!")
 
         return None
-    
-    
-    # Skills
-    
-    # Madoka — clear offset~offset+5
-    def skill_madoka(self, grid, offset):
-        up_to = min(len(grid), offset + 6)
-        for r in range(offset, up_to):
-            for c in range(5):
-                grid[r][c] = " "
-
-    # Homura — step_time = 4 for this level
-    def skill_homura(self,game_manager):
-        game_manager.set_step_time(4)
-
-    # Sayaka — HP(Score) + 200
-    def skill_sayaka(self,game_manager):
-        game_manager.update_score(200)
-
-    # Mami — clear this col offset~offset+9
-    def skill_mami(self, grid, offset,player_col):
-        up_to = min(len(grid), offset + 10)
-        for r in range(offset, up_to):
-            grid[r][player_col] = " "
-
-    # Kyoko — offset -= 3 dash
-    def skill_kyoko(self, game_manager):
-        game_manager.update_offset(3)
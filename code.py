@@ -1,13 +1,12 @@
 # ============================================================
 
-import time
-import board
-import busio
+# boot trace first, every stage below is timed (profiler.py)
+from profiler import BootTrace
+boot = BootTrace()
 
-import math
-import neopixel
-import adafruit_adxl34x
-import random
+import asyncio
+
+import hal
 
 
 # -------------------------------
@@ -21,133 +20,399 @@ STATE_GAME_OVER = 4
 
 LEVELS = 10
 OPED = True
+ENDLESS = False         # True: endless map, the first stage never ends
+RECORD = False          # True: log seed + inputs, saved to REPLAY_FILE after each game
+REPLAY_FILE = "replay.bin"
+FRAMEBUFFER = False     # True: own SSD1306 driver, partial page updates
+ACCEL_FIFO = False      # True: drain the ADXL345 FIFO, ~2.5 I2C reads/frame instead of 1 (adxl_fifo.py)
+PROFILE = False         # True: time game loop phases, dump per level (profiler.py)
+PROFILE_OVERLAY = False # True: profiler line replaces the HUD line
+GC_BUDGET = 2048        # bytes a frame may allocate before it warns (memory.py)
+GC_IDLE_AFTER = 16384   # collect in frame idle time once this much garbage piled up
+
+# task rates (per second)
+TICK_HZ = 20        # simulation
+INPUT_HZ = 10       # accelerometer, filter is tuned for 10 Hz
+RENDER_HZ = 10      # OLED
+KNOB_HZ = 50        # encoder + button
+LED_HZ = 20         # NeoPixel breathing
+
 game_state = STATE_INTRO
 
+# real drivers on the board, stand-ins on a PC
+# (has to run before oled_renderer pulls in displayio)
+hal.init()
+boot.stage("hal.init")
+
 # ------------------------------------------------------
 #   === imports other files ===
+#   only what the intro needs, menus / game / scores
+#   are imported on first use (load_game, load_scores)
 # ------------------------------------------------------
 
 import oled_renderer
 from oled_renderer import *
-from character import CharacterManager
-from input_manager import KnobController, Accelerator
-from game_manager import GameManager
-from score_manager import ScoreManager
+from input_manager import KnobController, FixedAccelerator
+from audio import MelodyPlayer
+from tasks import Queue, Ticker, Tasks
+from pixel_fx import PixelFX
 
 from utils import *
+boot.stage("imports")
+
+char_manager = game_manager = score_manager = score_log = None
+prof = None
+
+# -------------------------------
+#   setup
+# -------------------------------
+class PlayState:
+    """what the game task shares with the input / render tasks"""
+
+    def __init__(self):
+        self.active = False     # a level is running
+        self.grid = None
+        self.level = 1
+        self.col = 2
+        self.offset = 0
+
+
+def setup(hw, input_tape=None):
+    """
+    what the intro needs: display, buzzer, knob, accelerometer
+    (not calibrated yet, play_intro() does it)
+    input_tape: replay.Replayer to play a log back,
+                None -> live input (recorded if RECORD)
+    """
+    global display, fx, player, clock, knob, acc, tape, play
+
+    display = hw.display
+    fx = PixelFX(hw.pixels)
+    clock = hw.clock
+    boot.clock = hw.clock
+
+    player = MelodyPlayer(hw.buzzer, clock=hw.clock)
+    knob = KnobController(hw.encoder, hw.keys, clock=hw.clock)
+    acc = FixedAccelerator(hw.accel, clock=hw.clock, sleep=hw.sleep, calibrate=False)
+    tape = input_tape
+    play = PlayState()
+
+
+def load_game():
+    """menus + game loop, the first time the character select comes up"""
+    global char_manager, game_manager, sched, tape
+    global game_screen, hud, prof, mem
+
+    from character import CharacterManager
+    from game_manager import GameManager
+    from scheduler import FrameScheduler
+    from memory import MemoryManager
+
+    # built once, every level reuses its labels
+    game_screen = GameScreen(display)
+    hud = HudModel()
+
+    char_manager = CharacterManager()
+    game_manager = GameManager()
+    sched = FrameScheduler(tick_rate=TICK_HZ, clock=clock)
+    game_manager.set_tick_rate(TICK_HZ)
+    # streamed rows a skill clears have to stay in the ring
+    game_manager.map_window = max(game_manager.map_window, char_manager.reach())
+    mem = MemoryManager(budget=GC_BUDGET, collect_after=GC_IDLE_AFTER, clock=clock)
+
+    # off: no profiler object, every `if prof:` is skipped
+    prof = None
+    if PROFILE:
+        from profiler import Profiler
+        prof = Profiler()
+
+    # same seed + same inputs -> same run
+    if tape is None and RECORD:
+        from replay import InputLog, Recorder
+        tape = Recorder(InputLog(game_manager.seed))
+    if tape:
+        game_manager.seed = tape.log.seed
+
+
+def new_game():
+    """
+    the next game depends on its own seed only (no maps, score
+    or charge from the last one), a recorded log starts over with it
+    """
+    char_manager.new_game()
+    if tape and tape.replaying:
+        game_manager.new_game(tape.log.seed)
+        return
+    game_manager.new_game()
+    if tape:
+        tape.new_game(game_manager.seed)
+
+
+def load_scores():
+    """high scores + run log, the first time a game ends"""
+    global score_manager, score_log
+
+    from score_manager import ScoreManager
+    from score_log import ScoreLog
+
+    score_manager = ScoreManager()
+    score_log = ScoreLog()
+
+
+# ============================================================
+#   Tasks
+#   input / render / melody / LEDs run on their own, the
+#   state machine in run() talks to them through queues:
+#     knob_q   input  -> menus     knob events
+#     moves    input  -> game      (left, right, shake)
+#     screens  anyone -> render    what to show
+#     leds     anyone -> LEDs      ("breathe", color) / ("hp", n)
+# ============================================================
+
+async def input_task():
+    """knob at KNOB_HZ, accelerometer at INPUT_HZ while a level runs"""
+    next_accel = clock()
+    while True:
+        event = knob.check()
+        while event:
+            knob_q.put(event)
+            event = knob.check()
+
+        now = clock()
+        if play.active and now >= next_accel:
+            next_accel += 1 / INPUT_HZ
+            if next_accel <= now:
+                next_accel = now + 1 / INPUT_HZ
+            t_in = sched.begin()
+            if prof: t0 = prof.begin()
+            moves.put(acc.update())
+            if prof: prof.end("input", t0)
+            sched.end("input", t_in)
+
+        await asyncio.sleep(1 / KNOB_HZ)
+
+
+def draw(item):
+    """one request from `screens`, return: True for the game screen"""
+    kind = item[0]
+    if kind == "play":
+        game_screen.show()
+        return True
+    if kind == "text":
+        clear_display(display)
+        draw_text_block(display, item[1], align="center")
+    elif kind == "chars":
+        render_character_select(display, char_manager)
+    elif kind == "diffs":
+        render_difficulty_select(display, game_manager)
+    elif kind == "scores":
+        render_high_score_board(display, item[1])
+    return False
+
+
+def draw_play():
+    t_draw = sched.begin()
+    mem.frame_begin()
+    if prof: t0 = prof.begin()
+    hud.set_map(play.grid, play.col, play.offset)
+    if prof: prof.end("map", t0)
+    if prof and PROFILE_OVERLAY:
+        hud.set_line(0, prof.overlay())
+    else:
+        hud.set_stats(play.level, char_manager.get_charge(), game_manager.get_score())
+    if prof: t0 = prof.begin()
+    game_screen.draw(hud)
+    if prof:
+        prof.end("screen", t0)
+        prof.frame()
+    mem.frame_end()
+    sched.end("render", t_draw)
+
+
+async def render_task():
+    """everything on the OLED, the game screen at RENDER_HZ"""
+    tick = Ticker(RENDER_HZ, clock)
+    playing = False
+    while True:
+        item = screens.get_nowait()
+        while item:
+            playing = draw(item)
+            if playing:
+                tick.reset()
+            item = screens.get_nowait()
+
+        if not playing:
+            await screens.wait()
+            continue
+        draw_play()
+        await tick.wait()
+
+
+def start_sound(melody):
+    """start a melody now, melody_task plays it out"""
+    player.start(melody)
+    sound_wake.set()
 
-# setup
 
-displayio.release_displays()        
-i2c = busio.I2C(board.SCL, board.SDA)
-display_bus = i2cdisplaybus.I2CDisplayBus(i2c, device_address=0x3C)  
-display = adafruit_displayio_ssd1306.SSD1306(display_bus, width=128, height=64)
+async def play_sound(melody):
+    start_sound(melody)
+    while player.is_playing():
+        await asyncio.sleep(0.01)
 
-pixels = neopixel.NeoPixel(board.D10, 4, brightness=0.3, auto_write=True)
 
-accel = adafruit_adxl34x.ADXL345(i2c)
+async def melody_task():
+    """polls the buzzer while a melody plays, sleeps otherwise"""
+    while True:
+        if prof: t0 = prof.begin()
+        playing = player.poll()
+        if prof: prof.end("sound", t0)
+        if playing:
+            await asyncio.sleep(0.01)
+        else:
+            sound_wake.clear()
+            await sound_wake.wait()
+
+
+async def led_task():
+    """NeoPixels: breathing on pixel 0, HP on 1..3"""
+    tick = Ticker(LED_HZ, clock)
+    while True:
+        item = leds.get_nowait()
+        while item:
+            kind, value = item
+            if kind == "breathe":
+                if not fx.breathing():
+                    tick.reset()
+                fx.breathe(0, value, clock())
+            elif kind == "hp":
+                HP_show(value, fx)
+            item = leds.get_nowait()
+
+        # unchanged frames are not sent
+        fx.update(clock())
+        if not fx.breathing():
+            await leds.wait()
+            continue
+        await tick.wait()
+
 
-char_manager = CharacterManager()
-knob = KnobController()
-game_manager = GameManager()
-acc = Accelerator(accel)
-score_manager = ScoreManager()
+# -------------------------------
+#   knob
+# -------------------------------
+def read_knob():
+    event = knob_q.get_nowait()
+    if tape:
+        event = tape.knob(event)
+    return event
+
+
+def drain_knob():
+    """
+    take every queued knob event
+    return: (net detents, pressed) - stops at the first press
+    """
+    moved = 0
+    event = read_knob()
+    while event:
+        etype, value = event
+        if etype == "turn":
+            moved += value
+        elif etype == "press":
+            return moved, True
+        event = read_knob()
+    return moved, False
+
+
+async def wait_knob():
+    """until the knob moved, a replay reads its log without waiting"""
+    if tape and tape.replaying:
+        await asyncio.sleep(0.01)
+    else:
+        await knob_q.wait()
 
 # -------------------------------
 #   Intro 
 # -------------------------------
-def play_intro():
+async def play_intro():
 
     print("Intro: WELCOME")
-    clear_display(display)
-    draw_text_block(
-        display,
-        ["WELCOME"],
-        align="center"
-    )
+    screens.put(("text", ["WELCOME"]))
+    await asyncio.sleep(0)      # render task draws it
+    boot.stage("welcome")
     
-    if OPED: play_melody(open_melody)
-    time.sleep(1)
+    # calibrate while the melody plays (board held still)
+    acc.start_calibration()
+    if OPED: start_sound(open_melody)
+    calibrating = True
+    while calibrating or player.is_playing():
+        if calibrating and acc.calibrate_step():
+            calibrating = False
+            boot.stage("calibrated")
+        await asyncio.sleep(0.02)
+    boot.stage("intro")
+    await asyncio.sleep(1)
 
 
 # -------------------------------
 #   Character
 # -------------------------------
-def select_character():
+async def select_character():
     print("Select Character")
     
     
-    render_character_select(display, char_manager)
+    screens.put(("chars",))
+    knob_q.clear()
+    leds.put(("breathe", char_manager.get_color()))
     
-    t = 0
     while True:
         
-        role_color = char_manager.get_color()
-        
-        pixels[0] = breathing_color(role_color, t)
-        pixels.show()
-        t += 0.08
+        await wait_knob()
         
-        event = knob.check()
+        # every detent since last frame, drawn once
+        moved, pressed = drain_knob()
         
-        if event:
-            etype, value = event
-
-            if etype == "turn":
-                if value > 0:
+        if moved:
+            for _ in range(abs(moved)):
+                if moved > 0:
                     char_manager.next()
-                    render_character_select(display, char_manager)
                 else:
                     char_manager.prev()
-                    render_character_select(display, char_manager)
-
-            elif etype == "press":
-                print("Select", char_manager.current()["name"])
-                clear_display(display)
-                draw_text_block(
-                    display,
-                    ["< Selected >", "["+char_manager.current()["name"]+"]"],
-                    align="center"
-                )
-                time.sleep(1)
-                break
-            
-        time.sleep(0.01)
+            screens.put(("chars",))
+            leds.put(("breathe", char_manager.get_color()))
+
+        if pressed:
+            print("Select", char_manager.current()["name"])
+            leds.put(("breathe", None))
+            screens.put(("text", ["< Selected >", "["+char_manager.current()["name"]+"]"]))
+            await asyncio.sleep(1)
+            break
     
 
 
 # -------------------------------
 #   Difficulty
 # -------------------------------
-def select_level():
+async def select_level():
     print("Select Level")
     # Easy / Medium / Hard
-    render_difficulty_select(display, game_manager)
+    screens.put(("diffs",))
+    knob_q.clear()
     while True:
         
-        event = knob.check()
+        await wait_knob()
+        moved, pressed = drain_knob()
         
-        if event:
-            etype, value = event
-
-            if etype == "turn":
-                    game_manager.next_difficulty()
-                    render_difficulty_select(display, game_manager)
-
-            elif etype == "press":
-                print("Select", game_manager.current_difficulty())
-                clear_display(display)
-                draw_text_block(
-                    display,
-                    ["< Selected >", "["+game_manager.current_difficulty()["name"]+"]"],
-                    align="center"
-                )
-                time.sleep(1)
-                break  
-            
-        time.sleep(0.01)
+        if moved:
+            game_manager.next_difficulty(abs(moved))
+            screens.put(("diffs",))
+
+        if pressed:
+            print("Select", game_manager.current_difficulty())
+            screens.put(("text", ["< Selected >", "["+game_manager.current_difficulty()["name"]+"]"]))
+            await asyncio.sleep(1)
+            break  
     
-    time.sleep(1)
+    await asyncio.sleep(1)
 
     level_index = 0
     return level_index
@@ -156,150 +421,185 @@ def select_level():
 # -------------------------------
 #   Game loop
 # -------------------------------
-def game_loop():
+
+async def game_loop():
     print("Game Loop Started")
     
     difficulty = game_manager.current_difficulty()
-    time.sleep(0.5)
+    await asyncio.sleep(0.5)
+    started = clock()
     
     total_score = 0
     
     HP = 3
-    HP_show(HP,pixels)
+    leds.put(("hp", HP))
     
     for game_level in range(1,LEVELS+1):
         
-        grid = game_manager.generate_map()
+        grid = game_manager.generate_map(endless=ENDLESS)
+        char_manager.new_level()
         
         # player pos
         player_col = 2
         
 
         offset = game_manager.get_offset()
-        last_move = time.monotonic()
         score = game_manager.get_score()
-        while True:
-
-            now = time.monotonic()
-            step_time = game_manager.get_step_time()
-            offset = game_manager.get_offset()
         
-            # every step_time move forward 1 row
-            if now - last_move >= step_time:
-                game_manager.update_offset(1)
-                last_move = now
-                game_manager.update_score(10)
-                char_manager.add_charge(5)
-                
-                offset = game_manager.get_offset()
-                print(offset)
-            
-            # left/right -> player_col
-            
-            left, right, shake = acc.update()
+        # garbage of the last level / menus goes now, not mid-level
+        mem.collect()
+        mem.reset()
+        sched.start()
+        moves.clear()
+
+        # render + accelerometer follow `play` from here
+        play.grid = grid
+        play.level = game_level
+        play.col = player_col
+        play.offset = offset
+        play.active = True
+        screens.put(("play",))
         
-            if left:
-                player_col = max(0, player_col - 1)
-
-            if right:
-                player_col = min(4, player_col + 1)
-                
-                
-            # shake → skill
-            if shake:
-                char_manager.try_use_skill(game_manager, grid, offset, player_col)
-                print("+++"+ str(offset))
-                visible_rows = draw_map(display, grid, player_col, offset)
-                screen = ["Lv."+str(game_level)+"    "+ str(char_manager.get_charge()) +"%    "+str(score)]
-                screen.extend(visible_rows)
-                draw_text_block(display, screen, align="center", start_pos=(0, 10), line_spacing=10)
-                play_melody(skill_sound)
-            
-            
-            if game_manager.check_collision(grid, offset, player_col):
-                print("!!!")
-                game_manager.update_score(-50)
-                play_melody(hurt_sound)
-                grid[offset + 4][player_col] = " "
-                
-            
-            score = game_manager.get_score()
-            visible_rows = draw_map(display, grid, player_col, offset)
-            screen = ["Lv."+str(game_level)+"    "+ str(char_manager.get_charge()) +"%    "+str(score)]
-            screen.extend(visible_rows)
-            draw_text_block(display, screen, align="center", start_pos=(0, 10), line_spacing=10)
-            
-            time.sleep(0.1)
+        left = right = shake = False
+        while True:
+
+            # --- sim: fixed ticks at TICK_HZ ---
+            n = sched.ticks_due()
+            if n:
+                t_sim = sched.begin()
+                mem.frame_begin()
+                if prof: t0 = prof.begin()
+
+                # accelerometer decisions since the last tick (input_task)
+                move = moves.get_nowait()
+                while move:
+                    l, r, sh = move
+                    left = left or l
+                    right = right or r
+                    shake = shake or sh
+                    move = moves.get_nowait()
+
+                for _ in range(n):
+                    
+                    if tape:
+                        left, right, shake = tape.tick(left, right, shake)
+                    
+                    # every step_time move forward 1 row
+                    if game_manager.tick():
+                        game_manager.update_score(10)
+                        char_manager.step(game_manager)
+                        print(game_manager.get_offset())
+                    offset = game_manager.get_offset()
+                    
+                    # left/right -> player_col
+                    if left:
+                        player_col = max(0, player_col - 1)
+
+                    if right:
+                        player_col = min(4, player_col + 1)
+                        
+                    # shake → skill
+                    if shake:
+                        char_manager.try_use_skill(game_manager, grid, offset, player_col)
+                        offset = game_manager.get_offset()
+                        print("+++"+ str(offset))
+                        start_sound(skill_sound)
+                    
+                    left = right = shake = False
+                    
+                    if prof: t1 = prof.begin()
+                    if game_manager.check_collision(grid, offset, player_col):
+                        print("!!!")
+                        game_manager.update_score(-50)
+                        start_sound(hurt_sound)
+                        grid.clear(offset + 4, player_col)
+                    if prof: prof.end("collide", t1)
+
+                play.col = player_col
+                play.offset = offset
+                if prof: prof.end("sim", t0)
+                mem.frame_end()
+                sched.end("update", t_sim)
             
-            # level pass
-            if offset == 0:
-                clear_display(display)
-                draw_text_block(
-                    display,
-                    ["Congrats!","Lv."+str(game_level)+" PASSED","Score:"+str(score)],
-                    align="center"
-                )
-                play_melody(pass_sound)
-                time.sleep(1)
+            # level pass (Kyoko's dash can jump past 0)
+            if offset <= 0:
+                play.active = False
+                score = game_manager.get_score()
+                for line in sched.report() + mem.report():
+                    print(line)
+                if prof:
+                    prof.dump("Lv." + str(game_level))
+                    prof.reset()
+                screens.put(("text", ["Congrats!","Lv."+str(game_level)+" PASSED","Score:"+str(score)]))
+                await play_sound(pass_sound)
+                await asyncio.sleep(1)
                 break
             
+            # sleep until the next tick, gc if it fits
+            mem.idle(sched.tick_left())
+            await asyncio.sleep(max(0, sched.tick_left()))
+            
         total_score += score
         
         if score < 0:
             HP -= 1
-            HP_show(HP,pixels)
+            leds.put(("hp", HP))
             
         # Game over
         if HP == 0:
-            clear_display(display)
-            draw_text_block(
-                display,
-                ["GAME OVER"],
-                align="center"
-            )
-            time.sleep(1)
+            screens.put(("text", ["GAME OVER"]))
+            await asyncio.sleep(1)
             game_result = "LOSE"
-            return game_result,total_score
+            return game_result,total_score,game_level,clock()-started
             
     # Survived
     game_result = "WIN"
-    return game_result,total_score
+    return game_result,total_score,LEVELS,clock()-started
 
 
 # -------------------------------
 #   Game Over
 # -------------------------------
-def play_ending(result,total_score):
+async def play_ending(result,total_score,level=0,seconds=0):
     print("Game Over! Result =", result)
     
-    clear_display(display)
-    draw_text_block(
-        display,
-        ["CONGRATS!","Total:"+str(total_score)],
-        align="center"
-    )
-    time.sleep(1)
+    screens.put(("text", ["CONGRATS!","Total:"+str(total_score)]))
+    await asyncio.sleep(1)
     
+    if score_manager is None:
+        boot.mark()
+        load_scores()
+        print(boot.stage("scores"))
+
     # New High Score?
     name = char_manager.current()["name"]
     is_new_high = score_manager.add_score(name, total_score)
 
+    # lifetime stats, summary is in memory
+    score_log.add(char_manager.index, game_manager.current_diff_idx,
+                  total_score, level, seconds)
+    for line in score_log.stats_lines([c["name"] for c in char_manager.list],
+                                      [d["name"] for d in game_manager.difficulties]):
+        print(line)
+
     if is_new_high:
-        draw_text_block(
-        display,
-        ["New High Score!"],
-        align="center"
-    )
-    time.sleep(1)
+        screens.put(("text", ["New High Score!"]))
+    await asyncio.sleep(1)
     
     high_scores = score_manager.get_highscore_display()
     
     # Show High Scores
 
-    render_high_score_board(display, high_scores)
+    screens.put(("scores", high_scores))
 
-    if OPED: play_melody(end_melody)
-    time.sleep(5)
+    if OPED: await play_sound(end_melody)
+    await asyncio.sleep(5)
+    
+    if tape and not tape.replaying:
+        try:
+            tape.log.save(REPLAY_FILE)
+        except OSError:
+            print("replay not saved (read-only flash?)")
     
 
 
@@ -307,27 +607,72 @@ def play_ending(result,total_score):
 #               Main loop
 # ============================================================
 
-print("Game Booting...")
+async def run(games=None):
+    """the state machine, the other tasks run beside it"""
+    global knob_q, moves, screens, leds, sound_wake
 
-while True:
-    if game_state == STATE_INTRO:
-        play_intro()
-        game_state = STATE_SELECT_CHAR
+    # made inside the event loop they belong to
+    knob_q = Queue(16)
+    moves = Queue(4)
+    screens = Queue(4)
+    leds = Queue(4)
+    sound_wake = asyncio.Event()
 
-    elif game_state == STATE_SELECT_CHAR:
-        chosen_char = select_character()
-        game_state = STATE_SELECT_LEVEL
+    tasks = Tasks()
+    for task in (input_task, render_task, melody_task, led_task):
+        tasks.start(task)
+    await tasks.run(state_machine(games))
 
-    elif game_state == STATE_SELECT_LEVEL:
-        chosen_level = select_level()
-        game_state = STATE_PLAYING
 
-    elif game_state == STATE_PLAYING:
-        result,total_score = game_loop()
-        game_state = STATE_GAME_OVER
+async def state_machine(games):
+    global game_state
+
+    played = 0
+    while True:
+        if game_state == STATE_INTRO:
+            await play_intro()
+            game_state = STATE_SELECT_CHAR
+
+        elif game_state == STATE_SELECT_CHAR:
+            if char_manager is None:
+                boot.mark()
+                load_game()
+                boot.stage("game")
+                boot.dump()
+            elif played:
+                new_game()
+            chosen_char = await select_character()
+            game_state = STATE_SELECT_LEVEL
+
+        elif game_state == STATE_SELECT_LEVEL:
+            chosen_level = await select_level()
+            game_state = STATE_PLAYING
+
+        elif game_state == STATE_PLAYING:
+            result,total_score,level,seconds = await game_loop()
+            game_state = STATE_GAME_OVER
+
+        elif game_state == STATE_GAME_OVER:
+            await play_ending(result,total_score,level,seconds)
+            played += 1
+            # back to character
+            game_state = STATE_SELECT_CHAR
+            if games is not None and played >= games:
+                return
+
+
+def main(hw=None, games=None, input_tape=None):
+    """
+    games: stop after this many finished runs (None = forever)
+    """
+    hw = hw or hal.load(framebuffer=FRAMEBUFFER, accel_fifo=ACCEL_FIFO)
+    boot.stage("drivers")
+    setup(hw, input_tape)
+    boot.stage("setup")
+    
+    print("Game Booting...")
+    hal.run(run(games), hw)
 
-    elif game_state == STATE_GAME_OVER:
-        play_ending(result,total_score)
-        # back to character
-        game_state = STATE_SELECT_CHAR
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,618 @@
+# ============================================================
+#   In-memory stand-ins for running game code on a host PC
+# ============================================================
+
+
+class FakeClock:
+    """
+    Deterministic clock. Pass the object itself wherever a
+    clock function is expected (it is callable), and use
+    sleep() / advance() to move time forward instantly.
+    """
+
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            self.now += seconds
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def run_virtual(main, clock):
+    """
+    asyncio.run() on a FakeClock: the loop reads its time from
+    the clock, and when every task sleeps the clock jumps to the
+    next timer instead of the host waiting for it.
+    Tasks still pending when `main` returns are cancelled.
+    """
+    import asyncio
+    import selectors
+
+    class Selector(selectors.SelectSelector):
+        def select(self, timeout=None):
+            if timeout is None:
+                raise RuntimeError("every task waits and no timer is set")
+            if timeout > 0:
+                clock.advance(timeout)
+            return selectors.SelectSelector.select(self, 0)
+
+    class Loop(asyncio.SelectorEventLoop):
+        def time(self):
+            return clock()
+
+    loop = Loop(Selector())
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(main)
+    finally:
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+class RecordingPWM:
+    """
+    Mimics pwmio.PWMOut, records every frequency / duty change.
+    log entries: (time, "frequency" | "duty_cycle", value)
+    """
+
+    def __init__(self, frequency=440, duty_cycle=0, clock=None):
+        self.clock = clock
+        self.log = []
+        self._frequency = frequency
+        self._duty_cycle = duty_cycle
+        self.deinited = False
+
+    def _record(self, name, value):
+        t = self.clock() if self.clock else None
+        self.log.append((t, name, value))
+
+    @property
+    def frequency(self):
+        return self._frequency
+
+    @frequency.setter
+    def frequency(self, value):
+        self._frequency = value
+        self._record("frequency", value)
+
+    @property
+    def duty_cycle(self):
+        return self._duty_cycle
+
+    @duty_cycle.setter
+    def duty_cycle(self, value):
+        self._duty_cycle = value
+        self._record("duty_cycle", value)
+
+    def deinit(self):
+        self.deinited = True
+
+
+# ------------------------------------------------------------
+#   displayio stand-ins (counting)
+# ------------------------------------------------------------
+
+# how many objects / text updates the renderer produced
+counts = {}
+
+
+def _count(name):
+    counts[name] = counts.get(name, 0) + 1
+
+
+def reset_counts():
+    counts.clear()
+
+
+class Group:
+    def __init__(self, x=0, y=0, scale=1):
+        _count("Group")
+        self.x = x
+        self.y = y
+        self.scale = scale
+        self._items = []
+
+    def append(self, item):
+        self._items.append(item)
+
+    def insert(self, index, item):
+        self._items.insert(index, item)
+
+    def remove(self, item):
+        self._items.remove(item)
+
+    def pop(self, index=-1):
+        return self._items.pop(index)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __setitem__(self, index, item):
+        self._items[index] = item
+
+    def __iter__(self):
+        return iter(self._items)
+
+
+class Bitmap:
+    def __init__(self, width, height, value_count):
+        _count("Bitmap")
+        self.width = width
+        self.height = height
+        self._data = bytearray(width * height)
+
+    def __getitem__(self, xy):
+        x, y = xy
+        return self._data[y * self.width + x]
+
+    def __setitem__(self, xy, value):
+        x, y = xy
+        self._data[y * self.width + x] = value
+
+    def fill(self, value):
+        for i in range(len(self._data)):
+            self._data[i] = value
+
+
+class Palette:
+    def __init__(self, color_count):
+        _count("Palette")
+        self._colors = [0] * color_count
+        self.transparent = set()
+
+    def __getitem__(self, index):
+        return self._colors[index]
+
+    def __setitem__(self, index, color):
+        self._colors[index] = color
+
+    def __len__(self):
+        return len(self._colors)
+
+    def make_transparent(self, index):
+        self.transparent.add(index)
+
+
+class TileGrid:
+    def __init__(self, bitmap, pixel_shader=None, x=0, y=0):
+        _count("TileGrid")
+        self.bitmap = bitmap
+        self.pixel_shader = pixel_shader
+        self.x = x
+        self.y = y
+
+
+class Label:
+    def __init__(self, font, text="", color=0xFFFFFF, x=0, y=0):
+        _count("Label")
+        self.font = font
+        self._text = text
+        self.color = color
+        self.x = x
+        self.y = y
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        _count("Label.text")
+        self._text = value
+
+
+class RecordingDisplay:
+    """Counts root_group swaps, each one is a full panel refresh."""
+
+    def __init__(self, width=128, height=64):
+        self.width = width
+        self.height = height
+        self._root_group = None
+        self.refreshes = 0
+
+    @property
+    def root_group(self):
+        return self._root_group
+
+    @root_group.setter
+    def root_group(self, group):
+        self._root_group = group
+        self.refreshes += 1
+
+
+def install_display_modules():
+    """
+    Register displayio / terminalio / adafruit_display_text
+    look-alikes in sys.modules so oled_renderer imports on a PC.
+    """
+    import sys
+    import types
+
+    displayio = types.ModuleType("displayio")
+    displayio.Group = Group
+    displayio.Bitmap = Bitmap
+    displayio.Palette = Palette
+    displayio.TileGrid = TileGrid
+    displayio.release_displays = lambda: None
+
+    terminalio = types.ModuleType("terminalio")
+    terminalio.FONT = object()
+
+    label = types.ModuleType("adafruit_display_text.label")
+    label.Label = Label
+    display_text = types.ModuleType("adafruit_display_text")
+    display_text.label = label
+
+    displaybus = types.ModuleType("i2cdisplaybus")
+    displaybus.I2CDisplayBus = lambda i2c, device_address=0x3C: None
+
+    ssd1306 = types.ModuleType("adafruit_displayio_ssd1306")
+    ssd1306.SSD1306 = lambda bus, width=128, height=64: RecordingDisplay(width, height)
+
+    sys.modules.setdefault("displayio", displayio)
+    sys.modules.setdefault("terminalio", terminalio)
+    sys.modules.setdefault("adafruit_display_text", display_text)
+    sys.modules.setdefault("adafruit_display_text.label", label)
+    sys.modules.setdefault("i2cdisplaybus", displaybus)
+    sys.modules.setdefault("adafruit_displayio_ssd1306", ssd1306)
+
+
+class RecordingI2C:
+    """busio.I2C look-alike, counts every byte written per address."""
+
+    def __init__(self):
+        self.writes = []          # (address, bytes)
+        self.bytes_sent = 0
+        self._locked = False
+
+    def try_lock(self):
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self):
+        self._locked = False
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        if end is None:
+            end = len(buffer)
+        data = bytes(buffer[start:end])
+        self.writes.append((address, data))
+        self.bytes_sent += len(data)
+
+    def reset(self):
+        self.writes = []
+        self.bytes_sent = 0
+
+
+# ------------------------------------------------------------
+#   input stand-ins
+# ------------------------------------------------------------
+
+class FakeAccelerometer:
+    """
+    adafruit_adxl34x.ADXL345 look-alike. Every .acceleration read
+    pops the next queued (x, y, z) sample, then falls back to rest.
+    """
+
+    def __init__(self, samples=(), rest=(0.0, 0.0, 9.8)):
+        self.samples = list(samples)
+        self.rest = rest
+        self.reads = 0
+        self._next = 0
+
+    def push(self, *samples):
+        self.samples.extend(samples)
+
+    @property
+    def acceleration(self):
+        self.reads += 1
+        if self._next < len(self.samples):
+            s = self.samples[self._next]
+            self._next += 1
+            return s
+        return self.rest
+
+
+class FakeADXL345:
+    """
+    Register-level ADXL345 on its own busio.I2C look-alike, for
+    adxl_fifo.FifoADXL345.
+
+    The world is `samples`, (x, y, z) m/s^2 played at signal_rate
+    (sample-and-hold). The chip samples it at its own ODR into a
+    32 entry FIFO (stream mode) and raises ACTIVITY / SINGLE_TAP
+    in INT_SOURCE, cleared when INT_SOURCE is read.
+
+    transactions counts every bus access, writes included.
+    """
+
+    RATES = {0x07: 12.5, 0x08: 25, 0x09: 50, 0x0A: 100, 0x0B: 200, 0x0C: 400}
+    LSB = 0.004 * 9.80665          # m/s^2, full resolution
+    THRESH_LSB = 0.0625 / 0.004    # THRESH_ACT / THRESH_TAP step in LSB
+
+    def __init__(self, clock, samples=(), signal_rate=10, rest=(0.0, 0.0, 9.8)):
+        self.clock = clock
+        self.samples = list(samples)
+        self.signal_rate = signal_rate
+        self.rest = rest
+
+        self.regs = bytearray(64)
+        self.regs[0x00] = 0xE5      # DEVID
+        self.regs[0x2C] = 0x0A      # 100 Hz
+        self.fifo = []
+        self.latest = (0, 0, 0)
+        self.int_source = 0
+        self.overruns = 0
+        self.transactions = 0
+
+        self._next_t = None
+        self._reference = None
+        self._tap_time = 0
+        self._locked = False
+
+    # -------------------------------------------------
+    # the sensor side
+    # -------------------------------------------------
+    def _signal(self, t):
+        i = int(t * self.signal_rate)
+        return self.samples[i] if i < len(self.samples) else self.rest
+
+    def _run(self):
+        """take every sample the chip would have taken by now"""
+        if not self.regs[0x2D] & 0x08:
+            self._next_t = None
+            return
+        dt = 1 / self.RATES.get(self.regs[0x2C] & 0x0F, 100)
+        now = self.clock()
+        if self._next_t is None:
+            self._next_t = now
+        while self._next_t <= now:
+            raw = tuple(int(round(v / self.LSB)) for v in self._signal(self._next_t))
+            self._detect(raw, dt)
+            self.latest = raw
+            if self.regs[0x38] & 0xC0 == 0x80:
+                self.fifo.append(raw)
+                if len(self.fifo) > 32:
+                    self.fifo.pop(0)
+                    self.overruns += 1
+            self._next_t += dt
+
+    def _detect(self, raw, dt):
+        enabled = self.regs[0x2E]
+
+        # AC-coupled activity: change against the last reference
+        if self._reference is None:
+            self._reference = raw
+        thresh = self.regs[0x24] * self.THRESH_LSB
+        if enabled & 0x10 and thresh:
+            if max(abs(raw[i] - self._reference[i]) for i in range(3)) > thresh:
+                self.int_source |= 0x10
+                self._reference = raw
+
+        # single tap: above THRESH_TAP for less than DUR (625 us/LSB)
+        thresh = self.regs[0x1D] * self.THRESH_LSB
+        if enabled & 0x40 and thresh:
+            if max(abs(v) for v in raw) > thresh:
+                self._tap_time += dt
+            else:
+                if 0 < self._tap_time <= self.regs[0x21] * 0.000625:
+                    self.int_source |= 0x40
+                self._tap_time = 0
+
+    def _read_reg(self, reg):
+        if reg == 0x30:
+            ready = bool(self.fifo) if self.regs[0x38] & 0xC0 else self._next_t is not None
+            value = self.int_source | (0x80 if ready else 0)
+            self.int_source = 0
+            return value
+        if 0x32 <= reg <= 0x37:
+            raw = self.fifo[0] if self.fifo else self.latest
+            v = raw[(reg - 0x32) // 2] & 0xFFFF
+            if reg == 0x37 and self.fifo:
+                self.latest = self.fifo.pop(0)
+            return (v >> 8) if reg & 1 else (v & 0xFF)
+        if reg == 0x39:
+            return min(len(self.fifo), 32)
+        return self.regs[reg]
+
+    # -------------------------------------------------
+    # busio.I2C side
+    # -------------------------------------------------
+    def try_lock(self):
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self):
+        self._locked = False
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        if end is None:
+            end = len(buffer)
+        self._run()
+        self.transactions += 1
+        reg = buffer[start]
+        for i, value in enumerate(buffer[start + 1:end]):
+            self.regs[reg + i] = value
+        self._run()
+
+    def writeto_then_readfrom(self, address, buffer_out, buffer_in, *,
+                              out_start=0, out_end=None, in_start=0, in_end=None):
+        if in_end is None:
+            in_end = len(buffer_in)
+        self._run()
+        self.transactions += 1
+        reg = buffer_out[out_start]
+        for i in range(in_end - in_start):
+            buffer_in[in_start + i] = self._read_reg(reg + i)
+
+
+class FakeIncrementalEncoder:
+    """
+    rotaryio.IncrementalEncoder look-alike driven by raw A/B edges,
+    so a host test can feed any edge train (fast spins, bounces).
+    """
+
+    _GRAY = (0, 1, 3, 2)      # A/B states in clockwise order
+
+    def __init__(self, divisor=4):
+        self.divisor = divisor      # quadrature edges per position, as rotaryio
+        self._state = 0
+        self._quarters = 0
+
+    def edge(self, a, b):
+        new = (a << 1) | b
+        step = (self._GRAY.index(new) - self._GRAY.index(self._state)) % 4
+        if step == 1:
+            self._quarters += 1
+        elif step == 3:
+            self._quarters -= 1
+        # step 2 = an edge went missing, like hardware: ignore
+        self._state = new
+
+    def turn(self, detents):
+        direction = 1 if detents > 0 else -1
+        for _ in range(abs(detents) * self.divisor):
+            i = (self._GRAY.index(self._state) + direction) % 4
+            s = self._GRAY[i]
+            self.edge(s >> 1, s & 1)
+
+    @property
+    def position(self):
+        return self._quarters // self.divisor
+
+
+class KeyEvent:
+    def __init__(self, pressed, timestamp, key_number=0):
+        self.key_number = key_number
+        self.pressed = pressed
+        self.released = not pressed
+        self.timestamp = timestamp
+
+
+class _EventQueue:
+    def __init__(self, keys):
+        self._keys = keys
+        self.overflowed = False
+
+    def get(self):
+        return self._keys._next_event()
+
+    def clear(self):
+        self._keys._auto()
+        self._keys._queue = []
+        self.overflowed = False
+
+    def __len__(self):
+        self._keys._auto()
+        return len(self._keys._queue)
+
+
+class FakeKeys:
+    """
+    keypad.Keys look-alike for one button.
+    With period set it presses itself at every multiple of period
+    (held for `hold` s), which walks through the menus on its own.
+    Like keypad, at most max_events wait in the queue: newer
+    events are dropped and events.overflowed is set.
+    """
+
+    def __init__(self, clock, period=None, hold=0.5, max_events=64):
+        self.clock = clock
+        self.period = period
+        self.hold = hold
+        self.max_events = max_events
+        self.events = _EventQueue(self)
+        self._queue = []
+        self._next_auto = period
+        self._release_at = None
+
+    def _add(self, event):
+        if len(self._queue) >= self.max_events:
+            self.events.overflowed = True
+            return
+        self._queue.append(event)
+
+    def press(self, key_number=0):
+        self._add(KeyEvent(True, int(self.clock() * 1000), key_number))
+
+    def release(self, key_number=0):
+        self._add(KeyEvent(False, int(self.clock() * 1000), key_number))
+
+    def _auto(self):
+        # an edge is queued once its time has come, like keypad
+        if not self.period:
+            return
+        now = self.clock()
+        while True:
+            if self._release_at is not None:
+                if now < self._release_at:
+                    return
+                self._add(KeyEvent(False, int(self._release_at * 1000)))
+                self._release_at = None
+            elif now >= self._next_auto:
+                self._add(KeyEvent(True, int(self._next_auto * 1000)))
+                self._release_at = self._next_auto + self.hold
+                self._next_auto += self.period
+            else:
+                return
+
+    def _next_event(self):
+        self._auto()
+        if self._queue:
+            return self._queue.pop(0)
+        return None
+
+
+# ------------------------------------------------------------
+#   output stand-ins
+# ------------------------------------------------------------
+
+class RecordingPixels:
+    """neopixel.NeoPixel look-alike, counts strip transmissions."""
+
+    def __init__(self, n, brightness=0.3, auto_write=True):
+        self.n = n
+        self.brightness = brightness
+        self.auto_write = auto_write
+        self._pixels = [(0, 0, 0)] * n
+        self.transmissions = 0
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        return self._pixels[index]
+
+    def __setitem__(self, index, color):
+        self._pixels[index] = tuple(color)
+        if self.auto_write:
+            self.transmissions += 1
+
+    def fill(self, color):
+        self._pixels = [tuple(color)] * self.n
+        if self.auto_write:
+            self.transmissions += 1
+
+    def show(self):
+        self.transmissions += 1
@@ -0,0 +1,343 @@
+# ============================================================
+#   1-bit framebuffer backend for SSD1306 (128x64)
+#   draws displayio Groups into a page-organised bytearray
+#   and only sends the pages / columns that changed
+# ============================================================
+
+WIDTH = 128
+HEIGHT = 64
+PAGES = HEIGHT // 8
+
+# 5x7 font, ASCII 32..126, 5 column bytes per glyph (bit0 = top)
+FONT_5X7 = bytes((
+    0x00, 0x00, 0x00, 0x00, 0x00,  # ' '
+    0x00, 0x00, 0x5F, 0x00, 0x00,  # !
+    0x00, 0x07, 0x00, 0x07, 0x00,  # "
+    0x14, 0x7F, 0x14, 0x7F, 0x14,  # #
+    0x24, 0x2A, 0x7F, 0x2A, 0x12,  # $
+    0x23, 0x13, 0x08, 0x64, 0x62,  # %
+    0x36, 0x49, 0x55, 0x22, 0x50,  # &
+    0x00, 0x05, 0x03, 0x00, 0x00,  # '
+    0x00, 0x1C, 0x22, 0x41, 0x00,  # (
+    0x00, 0x41, 0x22, 0x1C, 0x00,  # )
+    0x08, 0x2A, 0x1C, 0x2A, 0x08,  # *
+    0x08, 0x08, 0x3E, 0x08, 0x08,  # +
+    0x00, 0x50, 0x30, 0x00, 0x00,  # ,
+    0x08, 0x08, 0x08, 0x08, 0x08,  # -
+    0x00, 0x60, 0x60, 0x00, 0x00,  # .
+    0x20, 0x10, 0x08, 0x04, 0x02,  # /
+    0x3E, 0x51, 0x49, 0x45, 0x3E,  # 0
+    0x00, 0x42, 0x7F, 0x40, 0x00,  # 1
+    0x42, 0x61, 0x51, 0x49, 0x46,  # 2
+    0x21, 0x41, 0x45, 0x4B, 0x31,  # 3
+    0x18, 0x14, 0x12, 0x7F, 0x10,  # 4
+    0x27, 0x45, 0x45, 0x45, 0x39,  # 5
+    0x3C, 0x4A, 0x49, 0x49, 0x30,  # 6
+    0x01, 0x71, 0x09, 0x05, 0x03,  # 7
+    0x36, 0x49, 0x49, 0x49, 0x36,  # 8
+    0x06, 0x49, 0x49, 0x29, 0x1E,  # 9
+    0x00, 0x36, 0x36, 0x00, 0x00,  # :
+    0x00, 0x56, 0x36, 0x00, 0x00,  # ;
+    0x08, 0x14, 0x22, 0x41, 0x00,  # <
+    0x14, 0x14, 0x14, 0x14, 0x14,  # =
+    0x00, 0x41, 0x22, 0x14, 0x08,  # >
+    0x02, 0x01, 0x51, 0x09, 0x06,  # ?
+    0x32, 0x49, 0x79, 0x41, 0x3E,  # @
+    0x7E, 0x11, 0x11, 0x11, 0x7E,  # A
+    0x7F, 0x49, 0x49, 0x49, 0x36,  # B
+    0x3E, 0x41, 0x41, 0x41, 0x22,  # C
+    0x7F, 0x41, 0x41, 0x22, 0x1C,  # D
+    0x7F, 0x49, 0x49, 0x49, 0x41,  # E
+    0x7F, 0x09, 0x09, 0x09, 0x01,  # F
+    0x3E, 0x41, 0x49, 0x49, 0x7A,  # G
+    0x7F, 0x08, 0x08, 0x08, 0x7F,  # H
+    0x00, 0x41, 0x7F, 0x41, 0x00,  # I
+    0x20, 0x40, 0x41, 0x3F, 0x01,  # J
+    0x7F, 0x08, 0x14, 0x22, 0x41,  # K
+    0x7F, 0x40, 0x40, 0x40, 0x40,  # L
+    0x7F, 0x02, 0x0C, 0x02, 0x7F,  # M
+    0x7F, 0x04, 0x08, 0x10, 0x7F,  # N
+    0x3E, 0x41, 0x41, 0x41, 0x3E,  # O
+    0x7F, 0x09, 0x09, 0x09, 0x06,  # P
+    0x3E, 0x41, 0x51, 0x21, 0x5E,  # Q
+    0x7F, 0x09, 0x19, 0x29, 0x46,  # R
+    0x46, 0x49, 0x49, 0x49, 0x31,  # S
+    0x01, 0x01, 0x7F, 0x01, 0x01,  # T
+    0x3F, 0x40, 0x40, 0x40, 0x3F,  # U
+    0x1F, 0x20, 0x40, 0x20, 0x1F,  # V
+    0x3F, 0x40, 0x38, 0x40, 0x3F,  # W
+    0x63, 0x14, 0x08, 0x14, 0x63,  # X
+    0x07, 0x08, 0x70, 0x08, 0x07,  # Y
+    0x61, 0x51, 0x49, 0x45, 0x43,  # Z
+    0x00, 0x7F, 0x41, 0x41, 0x00,  # [
+    0x02, 0x04, 0x08, 0x10, 0x20,  # backslash
+    0x00, 0x41, 0x41, 0x7F, 0x00,  # ]
+    0x04, 0x02, 0x01, 0x02, 0x04,  # ^
+    0x40, 0x40, 0x40, 0x40, 0x40,  # _
+    0x00, 0x01, 0x02, 0x04, 0x00,  # `
+    0x20, 0x54, 0x54, 0x54, 0x78,  # a
+    0x7F, 0x48, 0x44, 0x44, 0x38,  # b
+    0x38, 0x44, 0x44, 0x44, 0x20,  # c
+    0x38, 0x44, 0x44, 0x48, 0x7F,  # d
+    0x38, 0x54, 0x54, 0x54, 0x18,  # e
+    0x08, 0x7E, 0x09, 0x01, 0x02,  # f
+    0x0C, 0x52, 0x52, 0x52, 0x3E,  # g
+    0x7F, 0x08, 0x04, 0x04, 0x78,  # h
+    0x00, 0x44, 0x7D, 0x40, 0x00,  # i
+    0x20, 0x40, 0x44, 0x3D, 0x00,  # j
+    0x7F, 0x10, 0x28, 0x44, 0x00,  # k
+    0x00, 0x41, 0x7F, 0x40, 0x00,  # l
+    0x7C, 0x04, 0x18, 0x04, 0x78,  # m
+    0x7C, 0x08, 0x04, 0x04, 0x78,  # n
+    0x38, 0x44, 0x44, 0x44, 0x38,  # o
+    0x7C, 0x14, 0x14, 0x14, 0x08,  # p
+    0x08, 0x14, 0x14, 0x18, 0x7C,  # q
+    0x7C, 0x08, 0x04, 0x04, 0x08,  # r
+    0x48, 0x54, 0x54, 0x54, 0x20,  # s
+    0x04, 0x3F, 0x44, 0x40, 0x20,  # t
+    0x3C, 0x40, 0x40, 0x20, 0x7C,  # u
+    0x1C, 0x20, 0x40, 0x20, 0x1C,  # v
+    0x3C, 0x40, 0x30, 0x40, 0x3C,  # w
+    0x44, 0x28, 0x10, 0x28, 0x44,  # x
+    0x0C, 0x50, 0x50, 0x50, 0x3C,  # y
+    0x44, 0x64, 0x54, 0x4C, 0x44,  # z
+    0x00, 0x08, 0x36, 0x41, 0x00,  # {
+    0x00, 0x00, 0x7F, 0x00, 0x00,  # |
+    0x00, 0x41, 0x36, 0x08, 0x00,  # }
+    0x08, 0x04, 0x08, 0x10, 0x08,  # ~
+))
+
+# SSD1306 128x64, internal charge pump, horizontal addressing
+INIT_SEQUENCE = (
+    0xAE,              # display off
+    0xD5, 0x80,        # clock divide
+    0xA8, 0x3F,        # multiplex 64
+    0xD3, 0x00,        # display offset
+    0x40,              # start line 0
+    0x8D, 0x14,        # charge pump on
+    0x20, 0x00,        # horizontal addressing
+    0xA1,              # segment remap
+    0xC8,              # COM scan dec
+    0xDA, 0x12,        # COM pins
+    0x81, 0xCF,        # contrast
+    0xD9, 0xF1,        # precharge
+    0xDB, 0x40,        # VCOM detect
+    0xA4,              # resume from RAM
+    0xA6,              # normal (not inverted)
+    0xAF,              # display on
+)
+
+
+class FrameBuffer:
+    """
+    128x64 mono buffer, SSD1306 layout:
+    byte = page * 128 + x, bit n = row (page * 8 + n)
+    """
+
+    def __init__(self, width=WIDTH, height=HEIGHT):
+        self.width = width
+        self.height = height
+        self.buf = bytearray(width * (height // 8))
+
+    def fill(self, c):
+        v = 0xFF if c else 0x00
+        for i in range(len(self.buf)):
+            self.buf[i] = v
+
+    def pixel(self, x, y, c=1):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i = (y >> 3) * self.width + x
+            if c:
+                self.buf[i] |= 1 << (y & 7)
+            else:
+                self.buf[i] &= ~(1 << (y & 7)) & 0xFF
+
+    def _column(self, x, y, bits):
+        # OR an up-to-8-bit column into 1 or 2 pages
+        if x < 0 or x >= self.width or bits == 0:
+            return
+        page = y >> 3
+        shift = y & 7
+        if y < 0:
+            # (y >> 3) floors, so shift is still 0..7
+            lo = (bits << shift) >> 8
+            if page + 1 >= 0 and page + 1 < self.height // 8:
+                self.buf[(page + 1) * self.width + x] |= lo & 0xFF
+            return
+        if page < self.height // 8:
+            self.buf[page * self.width + x] |= (bits << shift) & 0xFF
+        if shift and page + 1 < self.height // 8:
+            self.buf[(page + 1) * self.width + x] |= bits >> (8 - shift)
+
+    def text(self, s, x, y):
+        # top-left at (x, y), 6 px per char (5 + 1 spacing)
+        for ch in s:
+            code = ord(ch) - 32
+            if 0 < code < 95:
+                base = code * 5
+                for i in range(5):
+                    self._column(x + i, y, FONT_5X7[base + i])
+            x += 6
+            if x >= self.width:
+                break
+
+    def blit(self, bitmap, x, y):
+        # any object with width / height / [x, y] (displayio.Bitmap)
+        for by in range(bitmap.height):
+            for bx in range(bitmap.width):
+                if bitmap[bx, by]:
+                    self.pixel(x + bx, y + by)
+
+
+class FramebufferDisplay:
+    """
+    Drop-in target for oled_renderer: assign a displayio Group to
+    root_group and it is rasterised and flushed page by page.
+
+    Labels and TileGrids are read through their public attributes
+    (text / x / y, bitmap / x / y), so the same draw_* / render_*
+    functions work for both backends.
+
+    auto_refresh is False: after mutating a retained group call
+    refresh() (GameScreen does this for you).
+    """
+
+    auto_refresh = False
+
+    def __init__(self, i2c, address=0x3C, width=WIDTH, height=HEIGHT):
+        self.i2c = i2c
+        self.address = address
+        self.width = width
+        self.height = height
+
+        self.back = FrameBuffer(width, height)
+        self.front = bytearray(len(self.back.buf))   # what the panel shows
+        # one view per page, made once: flush() compares and copies
+        # pages in place, no per-frame slices
+        pages = range(height // 8)
+        self._back_pages = [memoryview(self.back.buf)[p * width:(p + 1) * width] for p in pages]
+        self._front_pages = [memoryview(self.front)[p * width:(p + 1) * width] for p in pages]
+
+        self._cmd = bytearray(2)                     # 0x00 control + command
+        self._page = bytearray(width + 1)            # 0x40 control + data
+        self._page[0] = 0x40
+        self._root_group = None
+
+        # bus statistics
+        self.bytes_sent = 0
+        self.pages_sent = 0
+
+        for c in INIT_SEQUENCE:
+            self._command(c)
+        self._send_full()
+
+    @property
+    def root_group(self):
+        return self._root_group
+
+    @root_group.setter
+    def root_group(self, group):
+        self._root_group = group
+        self.refresh()
+
+    def refresh(self):
+        self.back.fill(0)
+        if self._root_group is not None:
+            self._draw(self._root_group, 0, 0)
+        self.flush()
+
+    # -------------------------------------------------
+    # rasterise a displayio tree
+    # -------------------------------------------------
+    def _draw(self, item, ox, oy):
+        if getattr(item, "hidden", False):
+            return
+
+        x = ox + getattr(item, "x", 0)
+        y = oy + getattr(item, "y", 0)
+
+        text = getattr(item, "text", None)
+        if text is not None:
+            # Label origin is left / vertical centre
+            self.back.text(text, x, y - 3)
+            return
+
+        bitmap = getattr(item, "bitmap", None)
+        if bitmap is not None:
+            self.back.blit(bitmap, x, y)
+            return
+
+        try:
+            n = len(item)
+        except TypeError:
+            return
+        for i in range(n):
+            self._draw(item[i], x, y)
+
+    # -------------------------------------------------
+    # I2C
+    # -------------------------------------------------
+    def _write(self, buf, end):
+        while not self.i2c.try_lock():
+            pass
+        try:
+            self.i2c.writeto(self.address, buf, end=end)
+        finally:
+            self.i2c.unlock()
+        self.bytes_sent += end
+
+    def _command(self, c):
+        self._cmd[0] = 0x00
+        self._cmd[1] = c
+        self._write(self._cmd, 2)
+
+    def _send_window(self, page, x0, x1):
+        self._command(0x21)
+        self._command(x0)
+        self._command(x1)
+        self._command(0x22)
+        self._command(page)
+        self._command(page)
+
+        # byte by byte into the preallocated buffers
+        back = self._back_pages[page]
+        front = self._front_pages[page]
+        out = self._page
+        x = x0
+        while x <= x1:
+            b = back[x]
+            out[x - x0 + 1] = b
+            front[x] = b
+            x += 1
+        self._write(out, x1 - x0 + 2)
+        self.pages_sent += 1
+
+    def _send_full(self):
+        for page in range(self.height // 8):
+            self._send_window(page, 0, self.width - 1)
+
+    def flush(self):
+        """
+        send only the changed column span of each changed page
+        return: number of pages sent
+        """
+        w = self.width
+        sent = 0
+
+        page = 0
+        while page < len(self._back_pages):
+            # compared in place, no page copies
+            back = self._back_pages[page]
+            front = self._front_pages[page]
+            x0 = 0
+            while x0 < w and back[x0] == front[x0]:
+                x0 += 1
+            if x0 < w:
+                x1 = w - 1
+                while back[x1] == front[x1]:
+                    x1 -= 1
+                self._send_window(page, x0, x1)
+                sent += 1
+            page += 1
+
+        return sent
@@ -1,13 +1,20 @@
 import random
 
+from lane_map import MapStream, mix30
+
 class GameManager:
     def __init__(self):
 
         # difficulties
+        # rows: level length, prob: obstacle chance per cell,
+        # step_time: seconds per row (tools/simulate.py sweeps these)
         self.difficulties = [
-            {"name": "Easy",   "speed": "Slow", "density": "+--"},
-            {"name": "Medium", "speed": "Medium", "density": "++-"},
-            {"name": "Hard",   "speed": "Fast", "density": "+++"}
+            {"name": "Easy",   "speed": "Slow", "density": "+--",
+             "rows": 20, "prob": 0.1, "step_time": 2.5},
+            {"name": "Medium", "speed": "Medium", "density": "++-",
+             "rows": 30, "prob": 0.15, "step_time": 2.0},
+            {"name": "Hard",   "speed": "Fast", "density": "+++",
+             "rows": 40, "prob": 0.3, "step_time": 1.5}
         ]
 
         self.current_diff_idx = 0
@@ -16,6 +23,22 @@ class GameManager:
         self.offset = 40
         self.score = 0
 
+        # fixed-timestep stepping (see scheduler.py)
+        self.tick_rate = 20
+        self.tick_count = 0
+
+        # every level's map derives from this seed
+        self.seed = random.randint(0, 0x3FFFFFFF)
+        self.level_count = 0
+        # rows MapStream keeps, must cover the longest skill clear
+        self.map_window = 16
+
+
+    def new_game(self, seed=None):
+        """level 1 and no score again, on a fresh seed unless one is given"""
+        self.seed = random.randint(0, 0x3FFFFFFF) if seed is None else seed
+        self.level_count = 0
+        self.score = 0
 
     def current_difficulty(self):
         return self.difficulties[self.current_diff_idx]
@@ -29,6 +52,25 @@ class GameManager:
     def get_step_time(self):
         return self.step_time
     
+    def set_tick_rate(self, rate):
+        self.tick_rate = rate
+
+    def step_ticks(self):
+        # step_time can change mid-level (Homura), so convert every time
+        return max(1, int(self.step_time * self.tick_rate + 0.5))
+
+    def tick(self):
+        """
+        advance one sim tick
+        return: True if the map moved forward 1 row
+        """
+        self.tick_count += 1
+        if self.tick_count >= self.step_ticks():
+            self.tick_count = 0
+            self.update_offset(1)
+            return True
+        return False
+
     def update_offset(self,uo):
         self.offset -= uo
         
@@ -42,44 +84,27 @@ class GameManager:
         return self.score
     
     
-    def generate_map(self):
+    def generate_map(self, endless=False):
+        """
+        return: MapStream, rows are made lazily as the level scrolls
+        endless=True -> level never runs out of rows
+        """
 
         difficulty = self.difficulties[self.current_diff_idx]
 
-        if difficulty == "easy":
-            rows = 20
-            prob = 0.1
-            self.step_time = 2.5
-            
-        elif difficulty == "medium":
-            rows = 30
-            prob = 0.15
-            self.step_time = 2.0
-        else:
-            rows = 40
-            prob = 0.3
-            self.step_time = 1.5
-
-        # map grid：list of list，5*N
-        grid = []
-
-        for _ in range(rows):
-            row = []
-
-            # random
-            for _ in range(5):
-                if random.random() < prob:
-                    row.append("X")
-                else:
-                    row.append(" ")
-
-            # 1 space (easier)
-            if all(c == "X" for c in row):
-                idx = random.randint(0, 4)
-                row[idx] = " "
-
-            grid.append(row)
-            self.offset = len(grid)
+        rows = difficulty["rows"]
+        prob = difficulty["prob"]
+        self.step_time = difficulty["step_time"]
+
+        # map grid：1 byte per row, bit c = obstacle in lane c,
+        # generated on demand from (level seed, row)
+        self.level_count += 1
+        level_seed = mix30(self.seed ^ self.level_count)
+        grid = MapStream(level_seed, prob, None if endless else rows, self.map_window)
+
+        self.offset = len(grid)
+
+        self.tick_count = 0
 
         return grid
     
@@ -87,15 +112,7 @@ class GameManager:
 
         player_row = offset + 4
 
-        # if finish / wall -> no collision
-        if player_row < 0 or player_row >= len(grid):
-            return False
-
-        if player_col < 0 or player_col > 4:
-            return False
-
-        cell = grid[player_row][player_col]
-
-        return cell == "X"
+        # if finish / wall -> no collision (is_blocked checks bounds)
+        return grid.is_blocked(player_row, player_col)
     
 
@@ -0,0 +1,178 @@
+# ============================================================
+#   Hardware abstraction
+#   real CircuitPython drivers on the board, in-memory
+#   stand-ins (fakes.py) on a PC, picked once at startup
+# ============================================================
+
+import time
+
+_headless = None
+
+# quadrature edges per knob detent, the old driver's
+# pulses_per_detent (not yet checked against this knob on the
+# board); change it here if a detent skips or doubles
+KNOB_DIVISOR = 3
+
+
+class Hardware:
+    """Everything the game touches, plus the clock it runs on."""
+
+    def __init__(self, i2c, display, pixels, accel, encoder, keys, buzzer,
+                 clock=time.monotonic, sleep=time.sleep, headless=False):
+        self.i2c = i2c
+        self.display = display
+        self.pixels = pixels
+        self.accel = accel
+        self.encoder = encoder
+        self.keys = keys
+        self.buzzer = buzzer
+        self.clock = clock
+        self.sleep = sleep
+        self.headless = headless
+
+
+def init(headless=None):
+    """
+    choose the backend, must run before oled_renderer is imported
+    headless=None -> auto: no `board` module means we are on a PC
+    """
+    global _headless
+    if headless is None:
+        try:
+            import board
+            headless = False
+        except ImportError:
+            headless = True
+
+    if headless:
+        import fakes
+        fakes.install_display_modules()
+
+    _headless = headless
+    return headless
+
+
+def load(framebuffer=False, accel_fifo=False, accel_gestures=True, knob_divisor=KNOB_DIVISOR,
+         **host_options):
+    if _headless is None:
+        init()
+    if _headless:
+        return host_hardware(framebuffer=framebuffer, accel_fifo=accel_fifo,
+                             accel_gestures=accel_gestures, knob_divisor=knob_divisor,
+                             **host_options)
+    return board_hardware(framebuffer=framebuffer, accel_fifo=accel_fifo,
+                          accel_gestures=accel_gestures, knob_divisor=knob_divisor)
+
+
+def run(main, hw):
+    """
+    run the async main to the end: CircuitPython asyncio on the
+    board; on a PC with a fakes.FakeClock the loop follows the
+    virtual clock, so sleeps cost nothing there too
+    """
+    if hasattr(hw.clock, "advance"):
+        import fakes
+        return fakes.run_virtual(main, hw.clock)
+    import asyncio
+    return asyncio.run(main)
+
+
+# ------------------------------------------------------------
+#   ESP32-C3 board
+# ------------------------------------------------------------
+
+def board_hardware(framebuffer=False, accel_fifo=False, accel_gestures=True,
+                   knob_divisor=KNOB_DIVISOR):
+    import board
+    import busio
+    import displayio
+    import keypad
+    import neopixel
+    import pwmio
+
+    displayio.release_displays()
+    i2c = busio.I2C(board.SCL, board.SDA)
+
+    if framebuffer:
+        from framebuffer import FramebufferDisplay
+        display = FramebufferDisplay(i2c, address=0x3C)
+    else:
+        import i2cdisplaybus
+        import adafruit_displayio_ssd1306
+        display_bus = i2cdisplaybus.I2CDisplayBus(i2c, device_address=0x3C)
+        display = adafruit_displayio_ssd1306.SSD1306(display_bus, width=128, height=64)
+
+    pixels = neopixel.NeoPixel(board.D10, 4, brightness=0.3, auto_write=False)
+
+    if accel_gestures:
+        # on-chip tap/activity latch; the latest sample only (one
+        # I2C read per frame), or the whole FIFO with accel_fifo
+        from adxl_fifo import FifoADXL345, RATE_25HZ, RATE_100HZ
+        accel = FifoADXL345(i2c, rate=RATE_25HZ if accel_fifo else RATE_100HZ, fifo=accel_fifo)
+    else:
+        import adafruit_adxl34x
+        accel = adafruit_adxl34x.ADXL345(i2c)
+
+    # both count / scan in the background, nothing is lost between polls
+    try:
+        import rotaryio
+        encoder = rotaryio.IncrementalEncoder(board.D1, board.D2, divisor=knob_divisor)
+    except ImportError:
+        # ESP32-C3: no pulse counter, no rotaryio - keypad decodes the
+        # pins; a 1 ms scan keeps up with ~250 detents/s at divisor 4
+        from input_manager import KeypadEncoder
+        pins = keypad.Keys((board.D1, board.D2), value_when_pressed=False, pull=True,
+                           interval=0.001, max_events=64)
+        encoder = KeypadEncoder(pins, knob_divisor)
+    keys = keypad.Keys((board.D0,), value_when_pressed=False, pull=True)
+
+    buzzer = pwmio.PWMOut(board.D7, frequency=440, duty_cycle=0, variable_frequency=True)
+
+    return Hardware(i2c, display, pixels, accel, encoder, keys, buzzer)
+
+
+# ------------------------------------------------------------
+#   PC stand-ins
+# ------------------------------------------------------------
+
+def host_hardware(framebuffer=False, clock=None, accel_samples=(), button_period=3.0,
+                  accel_fifo=False, accel_gestures=True, knob_divisor=KNOB_DIVISOR):
+    """
+    clock: defaults to a fakes.FakeClock, so sleeps cost nothing
+    and the game runs as fast as the host can go
+
+    accel_samples play at 10 Hz; with accel_gestures they go
+    through the ADXL345 register model (FIFO drained with
+    accel_fifo), else one sample per read
+    """
+    import fakes
+
+    if clock is None:
+        clock = fakes.FakeClock()
+
+    i2c = fakes.RecordingI2C()
+    if framebuffer:
+        from framebuffer import FramebufferDisplay
+        display = FramebufferDisplay(i2c, address=0x3C)
+    else:
+        display = fakes.RecordingDisplay()
+
+    if accel_gestures:
+        from adxl_fifo import FifoADXL345, RATE_25HZ, RATE_100HZ
+        accel = FifoADXL345(fakes.FakeADXL345(clock, accel_samples, signal_rate=10),
+                            rate=RATE_25HZ if accel_fifo else RATE_100HZ, fifo=accel_fifo)
+    else:
+        accel = fakes.FakeAccelerometer(accel_samples)
+
+    return Hardware(
+        i2c,
+        display,
+        fakes.RecordingPixels(4, brightness=0.3, auto_write=False),
+        accel,
+        fakes.FakeIncrementalEncoder(knob_divisor),
+        fakes.FakeKeys(clock, period=button_period),
+        fakes.RecordingPWM(clock=clock),
+        clock=clock,
+        sleep=getattr(clock, "sleep", time.sleep),
+        headless=True,
+    )
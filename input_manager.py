@@ -1,62 +1,145 @@
 import time
-import board
-import digitalio
-import busio
-import math
-import adafruit_adxl34x
-from rotary_encoder import RotaryEncoder
-import adafruit_adxl34x
 
-class KnobController:
-    def __init__(self, pin_a=board.D1, pin_b=board.D2, pin_button=board.D0,
-                 encoder_cd=0.3, debounce_ms=3, pulses_per_detent=3):
+from adxl_fifo import MS2_PER_LSB
+
+try:
+    # keypad stamps its events with this, not with time.monotonic()
+    from supervisor import ticks_ms as _ticks_ms
+except ImportError:
+    _ticks_ms = None
+
+_TICKS_PERIOD = 1 << 29     # supervisor.ticks_ms() wraps here
+
+# devices are created by hal.py (real pins or host stand-ins)
+
+
+class KeypadEncoder:
+    """
+    rotaryio.IncrementalEncoder look-alike (.position) for boards
+    without rotaryio: the ESP32-C3 has no PCNT pulse counter.
+    keypad scans the A/B pins in the background and queues every
+    edge, position decodes them in order, so a fast spin is not
+    lost between polls either (up to keys' max_events edges).
+
+    keys: keypad.Keys((A, B), value_when_pressed=False, ...)
+    divisor: quadrature edges per position, as rotaryio
+    """
 
-        # Rotary encoder
-        self.encoder = RotaryEncoder(pin_a, pin_b,
-                                     debounce_ms=debounce_ms,
-                                     pulses_per_detent=pulses_per_detent)
+    _GRAY = (0, 1, 3, 2)      # A/B states in clockwise order
 
-        # Button input
-        self.button = digitalio.DigitalInOut(pin_button)
-        self.button.switch_to_input(pull=digitalio.Pull.UP)
+    def __init__(self, keys, divisor=4):
+        self.keys = keys
+        self.divisor = divisor
+        self._state = 3           # both pins pulled up at rest
+        self._quarters = 0
 
-        self.encoder_cd = encoder_cd  # cd
-        self._last_encoder_time = 0
-        self._last_button_state = self.button.value
-        self._last_button_time = 0
-        self.button_cd = 0.3  
+    @property
+    def position(self):
+        event = self.keys.events.get()
+        while event:
+            # pressed = pin low
+            bit = 2 if event.key_number == 0 else 1
+            new = self._state & ~bit if event.pressed else self._state | bit
+            step = (self._GRAY.index(new) - self._GRAY.index(self._state)) % 4
+            if step == 1:
+                self._quarters += 1
+            elif step == 3:
+                self._quarters -= 1
+            self._state = new
+            event = self.keys.events.get()
+        return self._quarters // self.divisor
+
+
+class KnobController:
+    """
+    Knob + button as an event queue.
+
+    encoder: rotaryio.IncrementalEncoder-like (.position), counts
+             quadrature edges in the background, so fast spins
+             are never lost between polls
+    keys:    keypad.Keys-like (.events.get()), button edges are
+             scanned and queued in the background as well
+
+    every detent / edge becomes one queued (time, type, value),
+    check() hands them out one at a time. time is in clock() seconds:
+      button edges  when keypad saw them (Event.timestamp)
+      detents       when poll() found them - the encoder keeps a
+                    count, not times, so several detents between
+                    two polls share the poll's time
+    ticks_ms: what keypad's timestamps count in, defaults to
+              supervisor.ticks_ms (host: clock() in ms)
+    """
+
+    def __init__(self, encoder, keys, clock=time.monotonic, max_events=32, ticks_ms=None):
+        self.encoder = encoder
+        self.keys = keys
+        self.clock = clock
+        self.max_events = max_events
+        if ticks_ms is None:
+            ticks_ms = _ticks_ms or (lambda: int(clock() * 1000))
+        self.ticks_ms = ticks_ms
+
+        self.queue = []
+        self._last_position = encoder.position
+        self.dropped = 0
+
+    def _push(self, t, etype, value):
+        if len(self.queue) >= self.max_events:
+            # full: lose the oldest, not the newest
+            self.queue.pop(0)
+            self.dropped += 1
+        self.queue.append((t, etype, value))
+
+    def poll(self):
+        """move everything captured since last poll into the queue"""
+        now = self.clock()
+
+        # --- 1. rotary: one event per detent ---
+        position = self.encoder.position
+        delta = position - self._last_position
+        self._last_position = position
+        step = 1 if delta > 0 else -1
+        for _ in range(abs(delta)):
+            self._push(now, "turn", step)
+
+        # --- 2. btn edges, at keypad's own timestamps ---
+        event = self.keys.events.get()
+        if event:
+            now_ms = self.ticks_ms()
+        while event:
+            age = ((now_ms - event.timestamp) % _TICKS_PERIOD) / 1000
+            if event.pressed:
+                self._push(now - age, "press", None)
+            else:
+                self._push(now - age, "release", None)
+            event = self.keys.events.get()
+
+        return len(self.queue)
+
+    def flush(self):
+        """forget input from before a menu was shown"""
+        self.poll()
+        self.queue = []
+
+    def next_event(self):
+        """return: (time, type, value) or None"""
+        if not self.queue:
+            self.poll()
+        if self.queue:
+            return self.queue.pop(0)
+        return None
 
     def check(self):
         """
         return:
             ("turn", +1 / -1)
             ("press", None)
-
+            ("release", None)
+            None when nothing is queued
         """
-        now = time.monotonic()
-
-        # --- 1. check rotary ---
-        changed = self.encoder.update()
-        if changed and (now - self._last_encoder_time) > self.encoder_cd:
-            delta = self.encoder.get_delta()
-            if delta != 0:
-                self._last_encoder_time = now
-                if delta > 0:
-                    return ("turn", +1)
-                else:
-                    return ("turn", -1)
-
-        # --- 2. check btn ---
-        current_button = self.button.value
-        if current_button != self._last_button_state:
-            self._last_button_time = now
-            self._last_button_state = current_button
-
-        
-        if not current_button: 
-            if now - self._last_button_time > self.button_cd:
-                return ("press", None)
-
+        event = self.next_event()
+        if event:
+            return event[1], event[2]
         return None
 
 
@@ -68,12 +151,20 @@ class Accelerator:
                  lane_cd=1.0,
                  shake_delta=2.5,
                  shake_frames=2,
-                 alpha=0.2):
+                 alpha=0.2,
+                 clock=time.monotonic,
+                 sleep=time.sleep,
+                 calibrate=True):
 
         self.accel = accel_device
+        # adxl_fifo.FifoADXL345 hands over a batch per frame
+        self.fifo = hasattr(accel_device, "drain")
+        self.clock = clock
+        self.sleep = sleep
 
         # EMA
         self.alpha = alpha
+        self._alphas = {1: alpha}
         self.fx = self.fy = self.fz = 0
         self.previous_fx = self.previous_fy = self.previous_fz = 0
 
@@ -87,10 +178,14 @@ class Accelerator:
 
         # CD
         self.lane_cd = lane_cd
-        self.last_lane_change = time.monotonic()
+        self.last_lane_change = clock()
 
         # baseline calibration
-        self.baseline_x, self.baseline_y, self.baseline_z = self._calibrate()
+        # calibrate=False: the caller runs it later (FixedAccelerator
+        # can be stepped while the intro plays)
+        self.baseline_x = self.baseline_y = self.baseline_z = 0
+        if calibrate:
+            self.baseline_x, self.baseline_y, self.baseline_z = self._calibrate()
 
     # -------------------------------------------------
     # calibrate baseline
@@ -102,9 +197,15 @@ class Accelerator:
             sum_x += x
             sum_y += y
             sum_z += z
-            time.sleep(0.05)
+            self.sleep(0.05)
         return sum_x / samples, sum_y / samples, sum_z / samples
 
+    def _sample_alpha(self, n):
+        a = self._alphas.get(n)
+        if a is None:
+            a = self._alphas[n] = 1 - (1 - self.alpha) ** (1 / n) if n else 0
+        return a
+
     # -------------------------------------------------
     # update
     # -------------------------------------------------
@@ -113,20 +214,22 @@ class Accelerator:
         return (left, right, shake)
         """
 
-        left = right = shake = False
-
         # -------------------------
         # read
         # -------------------------
-        raw_x, raw_y, raw_z = self.accel.acceleration
-        x = raw_x - self.baseline_x
-        y = raw_y - self.baseline_y
-        z = raw_z - self.baseline_z
+        if self.fifo:
+            # everything sampled since the last frame
+            samples, events = self.accel.drain()
+        else:
+            samples, events = (self.accel.acceleration,), 0
 
-        # EMA
-        self.fx = self.alpha * x + (1 - self.alpha) * self.fx
-        self.fy = self.alpha * y + (1 - self.alpha) * self.fy
-        self.fz = self.alpha * z + (1 - self.alpha) * self.fz
+        # EMA over every sample, alpha scaled so one frame of
+        # n samples moves the filter as far as one sample did
+        a = self._sample_alpha(len(samples))
+        for raw_x, raw_y, raw_z in samples:
+            self.fx += a * (raw_x - self.baseline_x - self.fx)
+            self.fy += a * (raw_y - self.baseline_y - self.fy)
+            self.fz += a * (raw_z - self.baseline_z - self.fz)
 
         # -------------------------
         # shake
@@ -136,16 +239,31 @@ class Accelerator:
         dz = abs(self.fz - self.previous_fz)
         delta = max(dx, dy, dz)
 
-        if delta > self.shake_delta:
-            self.shake_counter += 1
-        else:
-            self.shake_counter = 0
-
         # update to current
         self.previous_fx = self.fx
         self.previous_fy = self.fy
         self.previous_fz = self.fz
 
+        return self._gestures(delta > self.shake_delta, events, self.fx, self.tilt_threshold)
+
+    def _gestures(self, jolt, events, fx, tilt):
+        """
+        shake / lane decision, shared with FixedAccelerator
+        jolt: the filter moved more than shake_delta this frame
+        fx, tilt: filtered x and its threshold, in the same unit
+        """
+
+        left = right = shake = False
+
+        if jolt:
+            self.shake_counter += 1
+        else:
+            self.shake_counter = 0
+
+        # tap / activity latched by the chip between two frames
+        if events:
+            self.shake_counter = self.shake_frames
+
         # -------------------------
         # shake
         # -------------------------
@@ -158,14 +276,14 @@ class Accelerator:
         # -------------------------
         # left/right
         # -------------------------
-        t = time.monotonic()
+        t = self.clock()
 
-        if self.fx > self.tilt_threshold and (t - self.last_lane_change) > self.lane_cd:
+        if fx > tilt and (t - self.last_lane_change) > self.lane_cd:
             right = True
             self.last_lane_change = t
             print("RIGHT")
 
-        elif self.fx < -self.tilt_threshold and (t - self.last_lane_change) > self.lane_cd:
+        elif fx < -tilt and (t - self.last_lane_change) > self.lane_cd:
             left = True
             self.last_lane_change = t
             print("LEFT")
@@ -173,3 +291,152 @@ class Accelerator:
         return left, right, shake
 
 
+# fraction bits of the fixed-point filter
+_Q = 8
+
+
+class FixedAccelerator(Accelerator):
+    """
+    Same tilt / shake rules as Accelerator, in integers only:
+    samples stay in ADXL345 counts (4 mg), the EMA keeps _Q
+    fraction bits. With adxl_fifo.FifoADXL345 (drain_raw) a
+    frame allocates nothing and touches no float.
+
+    Calibration is a running mean that stops as soon as it is
+    steady (standard error under cal_tol counts, min_samples ..
+    max_samples) instead of a fixed 30 x 50 ms. It can also be
+    stepped from a loop: start_calibration() / calibrate_step().
+    """
+
+    def __init__(self, accel_device, tilt_threshold=2.2, lane_cd=1.0,
+                 shake_delta=2.5, shake_frames=2, alpha=0.2,
+                 clock=time.monotonic, sleep=time.sleep, calibrate=True,
+                 cal_tol=1, min_samples=8, max_samples=30):
+        self.raw = hasattr(accel_device, "drain_raw")
+        self._buf = [0] * (3 * 33)
+        self.cal_tol = cal_tol
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+
+        self.calibrated = False
+        super().__init__(accel_device, tilt_threshold, lane_cd, shake_delta,
+                         shake_frames, alpha, clock, sleep, calibrate)
+
+        one = 1 << _Q
+        self.tilt_q = int(tilt_threshold / MS2_PER_LSB * one)
+        self.shake_q = int(shake_delta / MS2_PER_LSB * one)
+        self._alphas = {1: int(alpha * one + 0.5)}
+        self.fx = self.fy = self.fz = 0
+        self.previous_fx = self.previous_fy = self.previous_fz = 0
+
+    def _read(self):
+        """return: (n, events), samples in self._buf"""
+        if self.raw:
+            n = self.accel.drain_raw(self._buf)
+            return n, self.accel.events
+
+        # float driver (adafruit / host fake): one sample a frame
+        x, y, z = self.accel.acceleration
+        buf = self._buf
+        buf[0] = int(round(x / MS2_PER_LSB))
+        buf[1] = int(round(y / MS2_PER_LSB))
+        buf[2] = int(round(z / MS2_PER_LSB))
+        return 1, 0
+
+    # -------------------------------------------------
+    # calibrate baseline
+    # -------------------------------------------------
+    def start_calibration(self):
+        self.calibrated = False
+        self._cal_n = 0
+        self._cal_first = [0, 0, 0]
+        self._cal_sum = [0, 0, 0]
+        self._cal_sq = [0, 0, 0]
+
+    def _steady(self):
+        n = self._cal_n
+        if n >= self.max_samples:
+            return True
+        if n < self.min_samples:
+            return False
+        # standard error^2 = (n*S2 - S1^2) / (n^2 (n-1)), no division
+        limit = self.cal_tol * self.cal_tol * n * n * (n - 1)
+        for axis in range(3):
+            s1 = self._cal_sum[axis]
+            if n * self._cal_sq[axis] - s1 * s1 > limit:
+                return False
+        return True
+
+    def calibrate_step(self):
+        """feed whatever the chip has, True once the baseline is set"""
+        if self.calibrated:
+            return True
+
+        n, _ = self._read()
+        buf = self._buf
+        for k in range(0, 3 * n, 3):
+            if self._cal_n == 0:
+                self._cal_first[0] = buf[k]
+                self._cal_first[1] = buf[k + 1]
+                self._cal_first[2] = buf[k + 2]
+            for axis in range(3):
+                # offsets from the first sample keep the squares small
+                d = buf[k + axis] - self._cal_first[axis]
+                self._cal_sum[axis] += d
+                self._cal_sq[axis] += d * d
+            self._cal_n += 1
+            if self._steady():
+                break
+
+        if not self._steady():
+            return False
+
+        n = self._cal_n
+        self.baseline_x, self.baseline_y, self.baseline_z = (
+            self._cal_first[axis] + (2 * self._cal_sum[axis] + n) // (2 * n)
+            for axis in range(3))
+        self.calibrated = True
+        return True
+
+    def _calibrate(self, samples=None):
+        self.start_calibration()
+        while not self.calibrate_step():
+            # FIFO: about one new sample per 40 ms
+            self.sleep(0.04 if self.raw else 0.05)
+        return self.baseline_x, self.baseline_y, self.baseline_z
+
+    # -------------------------------------------------
+    # update
+    # -------------------------------------------------
+    def _sample_alpha(self, n):
+        a = self._alphas.get(n)
+        if a is None:
+            a = self._alphas[n] = int((1 - (1 - self.alpha) ** (1 / n)) * (1 << _Q) + 0.5)
+        return a
+
+    def update(self):
+        """
+        return (left, right, shake)
+        """
+        n, events = self._read()
+
+        fx, fy, fz = self.fx, self.fy, self.fz
+        if n:
+            a = self._sample_alpha(n)
+            bx, by, bz = self.baseline_x, self.baseline_y, self.baseline_z
+            buf = self._buf
+            # f += a * (x - f), with a and f in Q8, x in counts
+            for k in range(0, 3 * n, 3):
+                fx += (buf[k] - bx) * a - (fx * a >> _Q)
+                fy += (buf[k + 1] - by) * a - (fy * a >> _Q)
+                fz += (buf[k + 2] - bz) * a - (fz * a >> _Q)
+
+        delta = max(abs(fx - self.previous_fx),
+                    abs(fy - self.previous_fy),
+                    abs(fz - self.previous_fz))
+
+        self.fx = self.previous_fx = fx
+        self.fy = self.previous_fy = fy
+        self.fz = self.previous_fz = fz
+
+        return self._gestures(delta > self.shake_q, events, fx, self.tilt_q)
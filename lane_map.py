@@ -0,0 +1,193 @@
+# ============================================================
+#   Packed level map
+#   one byte per row, bit c set = obstacle in lane c
+# ============================================================
+
+LANES = 5
+FULL = (1 << LANES) - 1
+
+# " X | X | X | X | X " -> the cell of lane c sits at 1 + 4*c
+_ROW_TEMPLATE = b"   |   |   |   |   "
+
+# text of every row, built once: 32 masks x (no player + 5 lanes)
+# index mask * _STRIDE + player_col + 1. The player's "O" hides
+# its own lane, so rows that look the same share one str:
+# 112 strings behind 192 slots.
+_STRIDE = LANES + 1
+
+
+def _build_row_text():
+    table = []
+    shared = {}
+    buf = bytearray(_ROW_TEMPLATE)
+    for mask in range(FULL + 1):
+        for player_col in range(-1, LANES):
+            for c in range(LANES):
+                if c == player_col:
+                    buf[1 + 4 * c] = 79        # "O"
+                elif (mask >> c) & 1:
+                    buf[1 + 4 * c] = 88        # "X"
+                else:
+                    buf[1 + 4 * c] = 32        # " "
+            t = str(buf, "ascii")
+            table.append(shared.setdefault(t, t))
+    return table
+
+
+_ROW_TEXT = _build_row_text()
+
+
+class LaneMap:
+    """
+    Same indexing as the old list-of-lists grid:
+    row 0 is the far end of the level, row len-1 the start,
+    the player stands on row offset + 4.
+    """
+
+    def __init__(self, rows=0):
+        self.rows = bytearray(rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    # -------------------------------------------------
+    # cells
+    # -------------------------------------------------
+    def row_mask(self, r):
+        if 0 <= r < len(self.rows):
+            return self.rows[r]
+        return 0
+
+    def set_row(self, r, mask):
+        self.rows[r] = mask & FULL
+
+    def is_blocked(self, r, c):
+        if 0 <= r < len(self.rows) and 0 <= c < LANES:
+            return (self.rows[r] >> c) & 1 == 1
+        return False
+
+    def clear(self, r, c):
+        if 0 <= r < len(self.rows) and 0 <= c < LANES:
+            self.rows[r] &= FULL ^ (1 << c)
+
+    def clear_rows(self, start, stop, lanes=FULL):
+        """clear `lanes` (bitmask) on rows start..stop-1, clipped to the map"""
+        keep = FULL ^ lanes
+        for r in range(max(0, start), min(len(self.rows), stop)):
+            self.rows[r] &= keep
+
+    # -------------------------------------------------
+    # text for the renderer
+    # -------------------------------------------------
+    def row_text(self, r, player_col=-1):
+        """one table lookup, nothing allocated"""
+        if player_col < 0 or player_col >= LANES:
+            player_col = -1
+        return _ROW_TEXT[self.row_mask(r) * _STRIDE + player_col + 1]
+
+
+# ------------------------------------------------------------
+#   streamed map
+# ------------------------------------------------------------
+
+ENDLESS = 1 << 29     # "length" of an endless level
+
+
+MASK30 = 0x3FFFFFFF
+GOLDEN30 = 0x278DDE6D  # 2**30 / golden ratio, odd
+MUL15 = 0x5BD1         # odd, 15 bits
+
+
+def mix30(x):
+    """
+    cheap 30-bit scramble: two rounds of xorshift + a 15x15 bit
+    multiply (xorshift alone is linear, neighbouring rows would
+    look alike). Every value stays below 2**30, a small int on
+    CircuitPython: bits are masked before a shift, not after.
+    """
+    x = (x & MASK30) or GOLDEN30
+    for _ in range(2):
+        x ^= (x & 0x1FFFF) << 13
+        x ^= x >> 17
+        x ^= (x & 0x1FFFFFF) << 5
+        x = ((x & 0x7FFF) * MUL15) ^ (x >> 15)
+    return x
+
+
+class MapStream(LaneMap):
+    """
+    Level whose rows are made on demand: row r is a pure function
+    of (seed, r), so nothing is built up front and any row can be
+    recreated. Only a small ring of recent rows is kept so skill
+    clears and collisions stick while the row is near the player.
+
+    length=None -> endless level (offset never reaches 0 in practice)
+    window must cover every row touched around the player
+    (screen + Mami's 10 row reach), 16 is plenty.
+    """
+
+    def __init__(self, seed, prob, length=None, window=16):
+        LaneMap.__init__(self, 0)
+        self.seed = seed & MASK30
+        self.threshold = int(prob * 256)
+        self.length = ENDLESS if length is None else length
+        self.window = window
+        self.ring = bytearray(window)
+        self.tags = [-1] * window     # row held by each ring slot
+
+    def __len__(self):
+        return self.length
+
+    def _generate(self, r):
+        h = mix30(self.seed ^ r)
+        h2 = mix30(h ^ GOLDEN30)
+
+        # one byte of hash per lane vs. prob * 256:
+        # three from h, two from h2
+        mask = 0
+        for c in range(LANES):
+            byte = (h >> (8 * c)) & 0xFF if c < 3 else (h2 >> (8 * (c - 3))) & 0xFF
+            if byte < self.threshold:
+                mask |= 1 << c
+
+        # 1 space (easier)
+        if mask == FULL:
+            mask ^= 1 << ((h2 >> 16) % LANES)
+        return mask
+
+    def _slot(self, r):
+        if r < 0 or r >= self.length:
+            return -1
+        slot = r % self.window
+        if self.tags[slot] != r:
+            self.ring[slot] = self._generate(r)
+            self.tags[slot] = r
+        return slot
+
+    # -------------------------------------------------
+    # same interface as LaneMap
+    # -------------------------------------------------
+    def row_mask(self, r):
+        slot = self._slot(r)
+        return self.ring[slot] if slot >= 0 else 0
+
+    def set_row(self, r, mask):
+        slot = self._slot(r)
+        if slot >= 0:
+            self.ring[slot] = mask & FULL
+
+    def is_blocked(self, r, c):
+        if 0 <= c < LANES:
+            return (self.row_mask(r) >> c) & 1 == 1
+        return False
+
+    def clear(self, r, c):
+        slot = self._slot(r)
+        if slot >= 0 and 0 <= c < LANES:
+            self.ring[slot] &= FULL ^ (1 << c)
+
+    def clear_rows(self, start, stop, lanes=FULL):
+        keep = FULL ^ lanes
+        for r in range(max(0, start), min(self.length, stop)):
+            slot = self._slot(r)
+            self.ring[slot] &= keep
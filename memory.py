@@ -0,0 +1,127 @@
+# ============================================================
+#   Memory manager
+#   gc.collect() only where a pause cannot be seen:
+#     - level transitions (collect())
+#     - frame idle time, once enough garbage has piled up and
+#       the slowest collect so far fits before the next sim tick
+#   per-frame allocation is checked against a byte budget
+#
+#   gc.mem_alloc() only grows between collections, so the
+#   difference across a frame is what the frame allocated.
+#   A drop means the heap filled up and the VM collected on
+#   its own inside the frame: that is the stutter to avoid.
+# ============================================================
+
+import gc
+import time
+
+_mem_alloc = getattr(gc, "mem_alloc", None)
+
+
+class MemoryManager:
+    """
+    mem.frame_begin()
+    ... input / sim / render ...
+    mem.frame_end()          -> warns past `budget` bytes
+    mem.idle(sched.tick_left())  -> before the game task sleeps
+
+    mem.collect()            -> at level transitions
+
+    Without gc.mem_alloc (CPython) nothing is measured and
+    idle() never collects; tools/check_memory.py swaps in a
+    tracemalloc probe.
+    """
+
+    def __init__(self, budget=2048, collect_after=16384, clock=time.monotonic,
+                 max_warnings=3):
+        self.budget = budget                # bytes one frame may allocate
+        self.collect_after = collect_after  # idle collect past this much garbage
+        self.clock = clock
+        self.max_warnings = max_warnings    # per level, print() allocates too
+        self.collect_cost = 0.0             # slowest collect so far, s
+        self.collects = 0
+        self._base = self._alloc()
+        self._mark = None
+        self.reset()
+
+    # -------------------------------------------------
+    # probes, replaced on the host
+    # -------------------------------------------------
+    def _alloc(self):
+        return _mem_alloc() if _mem_alloc else 0
+
+    def _frame_mark(self):
+        return self._alloc()
+
+    def _frame_used(self, mark):
+        return self._alloc() - mark
+
+    # -------------------------------------------------
+    # collection
+    # -------------------------------------------------
+    def collect(self):
+        t0 = self.clock()
+        gc.collect()
+        dt = self.clock() - t0
+        if dt > self.collect_cost:
+            self.collect_cost = dt
+        self.collects += 1
+        self._base = self._alloc()
+
+    def idle(self, left):
+        """
+        left: seconds until the next sim tick (sched.tick_left())
+        return: True if it collected
+        """
+        if left <= self.collect_cost:
+            return False
+        if self._alloc() - self._base < self.collect_after:
+            return False
+        self.collect()
+        self.idle_collects += 1
+        return True
+
+    # -------------------------------------------------
+    # per frame budget
+    # -------------------------------------------------
+    def frame_begin(self):
+        self._mark = self._frame_mark()
+
+    def frame_end(self):
+        """return: bytes the frame allocated, None if unknown"""
+        if self._mark is None:
+            return None
+        used = self._frame_used(self._mark)
+        self._mark = None
+        if used < 0:
+            # heap collected inside the frame, the VM ran out
+            self.auto_collects += 1
+            self._base = self._alloc()
+            return None
+
+        self.frames += 1
+        self.total += used
+        if used > self.worst:
+            self.worst = used
+        if used > self.budget:
+            self.over += 1
+            if self.over <= self.max_warnings:
+                print("frame %d allocated %d B > budget %d B" % (self.frames, used, self.budget))
+        return used
+
+    def reset(self):
+        """per level counters"""
+        self.frames = 0
+        self.total = 0
+        self.worst = 0
+        self.over = 0
+        self.auto_collects = 0
+        self.idle_collects = 0
+
+    def report(self):
+        if not self.frames:
+            return []
+        return ["alloc/frame mean=%dB max=%dB budget=%dB over=%d" % (
+                    self.total // self.frames, self.worst, self.budget, self.over),
+                "gc idle=%d auto=%d slowest=%.1fms" % (
+                    self.idle_collects, self.auto_collects, self.collect_cost * 1000)]
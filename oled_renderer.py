@@ -5,29 +5,67 @@
 import displayio
 import terminalio
 from adafruit_display_text import label
-import i2cdisplaybus
-import adafruit_displayio_ssd1306
-
-from character import CharacterManager
 
 # ------------------------------------------------------------
 #   CLEAR
 # ------------------------------------------------------------
 
+_EMPTY = None
+
+
 def clear_display(display):
-    display.root_group = displayio.Group()
+    global _EMPTY
+    if _EMPTY is None:
+        _EMPTY = displayio.Group()
+    display.root_group = _EMPTY
 
 
 # ------------------------------------------------------------
 #   SHOW TEXT
 # ------------------------------------------------------------
 
+# text screens are pooled: one Group + Labels per screen layout,
+# built on first use, only the text changes afterwards
+_text_screens = {}
+
+# centred x per string, bounded (scores make new strings)
+_LAYOUT_MAX = 48
+_layout = {}
+
+
+def _center_x(t):
+    x = _layout.get(t)
+    if x is None:
+        if len(_layout) >= _LAYOUT_MAX:
+            _layout.clear()
+        x = _layout[t] = (128 - len(t) * 6) // 2
+    return x
+
+
+def _text_screen(key, rows, start_y, line_spacing):
+    screen = _text_screens.get(key)
+    if screen is None:
+        group = displayio.Group()
+        labels = []
+        y = start_y
+        for _ in range(rows):
+            txt = label.Label(terminalio.FONT, text="", color=0xFFFFFF, x=0, y=y)
+            group.append(txt)
+            labels.append(txt)
+            y += line_spacing
+        screen = _text_screens[key] = (group, labels)
+    return screen
+
+
 def draw_text_block(display, text_lines,
                     align="left",
                     start_pos=None,
-                    line_spacing=14):
-
-    group = displayio.Group()
+                    line_spacing=14,
+                    screen=None):
+    """
+    screen: pool key, screens with the same key and line count
+            share their labels (default: one pool per layout)
+    """
 
     # cal y -> center
     if start_pos is None:
@@ -37,25 +75,18 @@ def draw_text_block(display, text_lines,
     else:
         start_x, start_y = start_pos
 
-    y = start_y
-    for t in text_lines:
+    key = (screen, len(text_lines), start_y, line_spacing)
+    group, labels = _text_screen(key, len(text_lines), start_y, line_spacing)
+
+    for txt, t in zip(labels, text_lines):
         if align == "left":
-            x = start_x
+            txt.x = start_x
         else:  # center
-            text_width = len(t) * 6
-            x = (128 - text_width) // 2
-
-        txt = label.Label(
-            terminalio.FONT,
-            text=t,
-            color=0xFFFFFF,
-            x=x,
-            y=y
-        )
-        group.append(txt)
-        y += line_spacing
-
-    display.root_group = group
+            txt.x = _center_x(t)
+        if txt.text != t:
+            txt.text = t
+
+    _show(display, group)
     
     
 def draw_title(display, title_text):
@@ -70,101 +101,126 @@ def draw_title(display, title_text):
 
 WHITE = 0xFFFFFF
 
+# shapes are rasterised once into one bitmap each and reused
+_PALETTE = None
+_SPRITES = {}
 
-def _palette():
-    p = displayio.Palette(2)
-    p[0] = 0x000000
-    p[1] = WHITE
-    return p
-
-
-def draw_shape(group, shape_name, cx=100, cy=30):
-
-    if shape_name == "circle":
-        _draw_circle(group, cx, cy)
-
-    elif shape_name == "square":
-        _draw_square(group, cx, cy)
-
-    elif shape_name == "diamond":
-        _draw_diamond(group, cx, cy)
 
-    elif shape_name == "triangle":
-        _draw_triangle(group, cx, cy)
+def _palette():
+    global _PALETTE
+    if _PALETTE is None:
+        _PALETTE = displayio.Palette(2)
+        _PALETTE[0] = 0x000000
+        _PALETTE[1] = WHITE
+        _PALETTE.make_transparent(0)
+    return _PALETTE
 
-    elif shape_name == "flower":
-        _draw_flower(group, cx, cy)
 
+# each shape: list of (x, y, width) horizontal spans around (0, 0)
 
-def _draw_circle(group, cx, cy):
-    palette = _palette()
+def _circle_spans():
     r = 8
     for dy in range(-r, r + 1):
         w = int((r*r - dy*dy)**0.5)
-        bmp = displayio.Bitmap(w*2, 1, 2)
-        for x in range(w*2):
-            bmp[x, 0] = 1
-        group.append(displayio.TileGrid(bmp, pixel_shader=palette, x=cx-w, y=cy+dy))
+        yield -w, dy, w*2
 
 
-def _draw_square(group, cx, cy):
-    palette = _palette()
-    bmp = displayio.Bitmap(14, 14, 2)
-    for x in range(14):
-        for y in range(14):
-            bmp[x, y] = 1
-    group.append(displayio.TileGrid(bmp, pixel_shader=palette, x=cx-7, y=cy-7))
+def _square_spans():
+    for dy in range(-7, 7):
+        yield -7, dy, 14
 
 
-def _draw_diamond(group, cx, cy):
-    palette = _palette()
+def _diamond_spans():
     for dy in range(-9, 9):
         w = 9 - abs(dy)
-        bmp = displayio.Bitmap(w*2, 1, 2)
-        for x in range(w*2):
-            bmp[x, 0] = 1
-        group.append(displayio.TileGrid(bmp, pixel_shader=palette, x=cx-w, y=cy+dy))
+        yield -w, dy, w*2
 
 
-def _draw_triangle(group, cx, cy):
-    palette = _palette()
+def _triangle_spans():
     side = 17
     h = int(side * 0.9)
-    top_y = cy - h//2 - 2
+    top_y = -h//2 - 2
     for row in range(h):
         span = int((row/(h-1)) * (side/2))
-        bmp = displayio.Bitmap(span*2, 1, 2)
-        for x in range(span*2):
-            bmp[x, 0] = 1
-        group.append(displayio.TileGrid(bmp, pixel_shader=palette, x=cx-span, y=top_y+row))
+        yield -span, top_y + row, span*2
 
 
-def _draw_flower(group, cx, cy):
-    palette = _palette()
+def _flower_spans():
     r = 4
     offsets = [(0,-5),(5,-1),(0,-1),(-5,-1),(3,4),(-3,4)]
     for ox, oy in offsets:
         for dy in range(-r, r+1):
             w = int((r*r - dy*dy)**0.5)
-            if w <= 0:
-                continue
-            bmp = displayio.Bitmap(w*2, 1, 2)
-            for x in range(w*2):
-                bmp[x, 0] = 1
-            group.append(displayio.TileGrid(bmp, pixel_shader=palette, x=cx+ox-w, y=cy+oy+dy))
+            yield ox - w, oy + dy, w*2
+
+
+_SHAPES = {
+    "circle": _circle_spans,
+    "square": _square_spans,
+    "diamond": _diamond_spans,
+    "triangle": _triangle_spans,
+    "flower": _flower_spans,
+}
+
+
+def _sprite(shape_name):
+    """
+    return: (bitmap, dx, dy), top-left of the bitmap is (cx+dx, cy+dy)
+    built on first use, cached afterwards
+    """
+    sprite = _SPRITES.get(shape_name)
+    if sprite is not None:
+        return sprite
+
+    spans = [s for s in _SHAPES[shape_name]() if s[2] > 0]
+    x0 = min(x for x, _, _ in spans)
+    y0 = min(y for _, y, _ in spans)
+    x1 = max(x + w for x, _, w in spans)
+    y1 = max(y for _, y, _ in spans) + 1
+
+    bmp = displayio.Bitmap(x1 - x0, y1 - y0, 2)
+    for x, y, w in spans:
+        for i in range(w):
+            bmp[x - x0 + i, y - y0] = 1
+
+    sprite = (bmp, x0, y0)
+    _SPRITES[shape_name] = sprite
+    return sprite
+
+
+def draw_shape(group, shape_name, cx=100, cy=30):
+    if shape_name not in _SHAPES:
+        return
+    bmp, dx, dy = _sprite(shape_name)
+    group.append(displayio.TileGrid(bmp, pixel_shader=_palette(), x=cx+dx, y=cy+dy))
+
+
+def _show(display, group):
+    # same group again: only non-auto displays need a push
+    if display.root_group is group:
+        if not getattr(display, "auto_refresh", True):
+            display.refresh()
+    else:
+        display.root_group = group
 
 
 # Select Character UI
 
-def render_character_select(display, char_manager):
+_select_screen = None
+_select_tiles = {}
+_SHAPE_SLOT = 3
 
-    clear_display(display)
 
-    role = char_manager.current()
-    name = role["name"]
-    skill = role["skill"]
-    shape = role["shape"]
+def _shape_tile(shape_name, cx=100, cy=30):
+    tile = _select_tiles.get(shape_name)
+    if tile is None:
+        bmp, dx, dy = _sprite(shape_name)
+        tile = displayio.TileGrid(bmp, pixel_shader=_palette(), x=cx+dx, y=cy+dy)
+        _select_tiles[shape_name] = tile
+    return tile
+
 
+def _build_character_select():
     group = displayio.Group()
 
     # title
@@ -180,7 +236,7 @@ def render_character_select(display, char_manager):
     # name
     t_name = label.Label(
         terminalio.FONT,
-        text="[" + name + "]",
+        text="[]",
         color=0xFFFFFF,
         x=5,
         y=30
@@ -190,15 +246,15 @@ def render_character_select(display, char_manager):
     # skill
     t_skill = label.Label(
         terminalio.FONT,
-        text=skill,
+        text=" ",
         color=0xFFFFFF,
         x=5,
         y=55
     )
     group.append(t_skill)
 
-    # shape
-    draw_shape(group, shape)
+    # shape slot (index _SHAPE_SLOT), swapped on every turn
+    group.append(displayio.Group())
 
     # frame
 
@@ -215,22 +271,34 @@ def render_character_select(display, char_manager):
     for f in [f1,f2,f3,f4,f5,f6,f7,f8]:
         group.append(f)
 
+    return group, t_name, t_skill
+
+
+def render_character_select(display, char_manager):
+
+    global _select_screen
+    if _select_screen is None:
+        _select_screen = _build_character_select()
+    group, t_name, t_skill = _select_screen
+
+    role = char_manager.current()
+
+    t_name.text = "[" + role["name"] + "]"
+    t_skill.text = role["skill"]
+    group[_SHAPE_SLOT] = _shape_tile(role["shape"])
+
     # show
-    display.root_group = group
+    _show(display, group)
     
     
+
 # Difficulty level
 
 
-def render_difficulty_select(display, game_manager):
+_difficulty_screen = None
 
-    clear_display(display)
-
-    diff = game_manager.current_difficulty()
-    name = diff["name"]
-    speed = diff["speed"]
-    density = diff["density"]
 
+def _build_difficulty_select():
     group = displayio.Group()
 
     # title
@@ -244,35 +312,33 @@ def render_difficulty_select(display, game_manager):
     group.append(title)
 
     # name
-    t_name = label.Label(
-        terminalio.FONT,
-        text="[" + name + "]",
-        color=0xFFFFFF,
-        x=10,
-        y=25
-    )
+    t_name = label.Label(terminalio.FONT, text="[]", color=0xFFFFFF, x=10, y=25)
     group.append(t_name)
 
     # tips
-    t_speed = label.Label(
-        terminalio.FONT,
-        text="Speed: " + str(speed),
-        color=0xFFFFFF,
-        x=10,
-        y=45
-    )
+    t_speed = label.Label(terminalio.FONT, text=" ", color=0xFFFFFF, x=10, y=45)
     group.append(t_speed)
 
-    t_density = label.Label(
-        terminalio.FONT,
-        text="Obstacle: " + str(density),
-        color=0xFFFFFF,
-        x=10,
-        y=55
-    )
+    t_density = label.Label(terminalio.FONT, text=" ", color=0xFFFFFF, x=10, y=55)
     group.append(t_density)
 
-    display.root_group = group
+    return group, t_name, t_speed, t_density
+
+
+def render_difficulty_select(display, game_manager):
+
+    global _difficulty_screen
+    if _difficulty_screen is None:
+        _difficulty_screen = _build_difficulty_select()
+    group, t_name, t_speed, t_density = _difficulty_screen
+
+    diff = game_manager.current_difficulty()
+
+    t_name.text = "[" + diff["name"] + "]"
+    t_speed.text = "Speed: " + str(diff["speed"])
+    t_density.text = "Obstacle: " + str(diff["density"])
+
+    _show(display, group)
     
     
 # Game
@@ -281,27 +347,134 @@ def draw_map(display, map_data, player_col, offset):
 
     visible_rows = []
 
-    # OLED 5 rows
-    for i in range(5):
-        map_row_index = offset + i
+    # OLED 5 rows, player on the last one
+    # (rows outside the map come back empty)
+    for i in range(4):
+        visible_rows.append(map_data.row_text(offset + i))
+    visible_rows.append(map_data.row_text(offset + 4, player_col))
 
-        if map_row_index < len(map_data):
-            row = map_data[map_row_index].copy()
-        else:
-
-            row = [" "] * 5
+    return visible_rows
 
-        # plyaer
-        if i == 4:
-            row[player_col] = "O"
 
-        # | 
-        line = " | ".join(row)
-        line = " " + line + " "
-        visible_rows.append(line)
+class HudModel:
+    """
+    Text of the in-game screen: HUD line + 5 map rows.
+    set_stats() / set_map() only reformat what changed and
+    add its line index to `changed`; GameScreen.draw() then
+    rewrites those labels and empties the set.
+    A frame where nothing moved allocates nothing.
+    """
+
+    def __init__(self, rows=5):
+        self.lines = [""] * (rows + 1)
+        self.changed = set()
+        self._stats = [None, None, None]      # level, charge, score
+        self._fields = ["", "", ""]           # their str()
+        self._masks = [-1] * rows             # row mask shown per map line
+        self._cols = [-1] * rows              # player lane shown per map line
+
+    def set_line(self, i, text):
+        if self.lines[i] != text:
+            self.lines[i] = text
+            self.changed.add(i)
+        if i == 0:
+            self._stats[0] = None             # next set_stats() redraws
+
+    def _field(self, k, value):
+        if self._stats[k] == value:
+            return False
+        self._stats[k] = value
+        self._fields[k] = str(value)
+        return True
+
+    def set_stats(self, level, charge, score):
+        # no tuple of fields here: that would allocate every frame
+        dirty = self._field(0, level)
+        dirty = self._field(1, charge) or dirty
+        dirty = self._field(2, score) or dirty
+        if dirty:
+            f = self._fields
+            self.lines[0] = "Lv." + f[0] + "    " + f[1] + "%    " + f[2]
+            self.changed.add(0)
+
+    def set_map(self, map_data, player_col, offset):
+        """player on the last row, same rows as draw_map()"""
+        last = len(self._masks) - 1
+        i = 0               # no range(): nothing allocated on idle frames
+        while i <= last:
+            mask = map_data.row_mask(offset + i)
+            col = player_col if i == last else -1
+            if mask != self._masks[i] or col != self._cols[i]:
+                self._masks[i] = mask
+                self._cols[i] = col
+                self.lines[i + 1] = map_data.row_text(offset + i, col)
+                self.changed.add(i + 1)
+            i += 1
+
+
+class GameScreen:
+    """
+    Retained in-game screen: HUD line + 5 map rows.
+    Built once, update() / draw() only touch labels whose
+    text actually changed.
+    """
+
+    def __init__(self, display, rows=6, start_pos=(0, 10), line_spacing=10):
+        self.display = display
+        self.group = displayio.Group()
+        self.labels = []
+        self.lines = []
+
+        y = start_pos[1]
+        for _ in range(rows):
+            txt = label.Label(terminalio.FONT, text="", color=WHITE, x=0, y=y)
+            self.group.append(txt)
+            self.labels.append(txt)
+            self.lines.append("")
+            y += line_spacing
+
+    def show(self):
+        if self.display.root_group is not self.group:
+            self.display.root_group = self.group
+
+    def _set(self, i, t):
+        if self.lines[i] == t:
+            return 0
+        txt = self.labels[i]
+        txt.text = t
+        txt.x = (128 - len(t) * 6) // 2
+        self.lines[i] = t
+        return 1
+
+    def _refresh(self, changed):
+        # framebuffer backend has no auto refresh
+        if changed and not getattr(self.display, "auto_refresh", True):
+            self.display.refresh()
+        return changed
+
+    def update(self, text_lines):
+        """
+        text_lines: [hud, row0 .. row4], centered like draw_text_block
+        return: number of labels rewritten
+        """
+        changed = 0
+        for i, t in enumerate(text_lines):
+            changed += self._set(i, t)
+        return self._refresh(changed)
+
+    def draw(self, hud):
+        """
+        hud: HudModel, only its changed lines are looked at
+        return: number of labels rewritten
+        """
+        if not hud.changed:
+            return 0
+        changed = 0
+        for i in hud.changed:
+            changed += self._set(i, hud.lines[i])
+        hud.changed.clear()
+        return self._refresh(changed)
 
-    return visible_rows
-    
 
 def render_high_score_board(display, scores):
     lines = ["< High Score >"]
@@ -0,0 +1,117 @@
+# ============================================================
+#   NeoPixel effects
+#   breathing from a lookup table built at import, all in
+#   integers (the ESP32-C3 has no FPU, math.sin is soft-float)
+#
+#   The strip runs with auto_write off: pixels are set in the
+#   buffer, show() sends them in one write and only when some
+#   pixel actually changed since the last one.
+# ============================================================
+
+import math
+
+# one breath: old breathing_color(t) with t = seconds * 8,
+# sin(t / 3) -> 6 * pi / 8 s
+BREATH_PERIOD = 6 * math.pi / 8
+BREATH_STEPS = 32
+# brightness range of a breath, as in the old float version
+BREATH_LOW = 0.1
+BREATH_HIGH = 0.6
+# the sine is what the eye should see, not the LED current
+BREATH_GAMMA = 2.2
+
+_BREATH_RATE = BREATH_STEPS / BREATH_PERIOD
+
+
+def _build_breath():
+    """channel scale per step, /256"""
+    table = bytearray(BREATH_STEPS)
+    for i in range(BREATH_STEPS):
+        s = 0.5 + 0.5 * math.sin(2 * math.pi * i / BREATH_STEPS)
+        table[i] = int(256 * (BREATH_LOW + (BREATH_HIGH - BREATH_LOW) * s ** BREATH_GAMMA))
+    return table
+
+
+BREATH = _build_breath()
+
+
+class PixelFX:
+    """
+    NeoPixel strip with change detection, same indexing:
+
+    fx = PixelFX(pixels)
+    fx[1] = (150, 150, 150)     # buffer only
+    fx.breathe(0, color, now)   # None stops, the pixel keeps its color
+    fx.update(now)              # breathing step + show()
+
+    Colors are tuples, compared against what was last set.
+    writes / skipped count show() calls that did / did not
+    transmit.
+    """
+
+    def __init__(self, pixels):
+        pixels.auto_write = False
+        self.pixels = pixels
+        self.n = len(pixels)
+        self.frame = [(0, 0, 0)] * self.n
+        self.dirty = False
+        self.writes = 0
+        self.skipped = 0
+        # breathing per pixel: base color (None: off), start, table step
+        self._base = [None] * self.n
+        self._started = [0] * self.n
+        self._step = [-1] * self.n
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        return self.frame[i]
+
+    def __setitem__(self, i, color):
+        if self.frame[i] != color:
+            self.frame[i] = color
+            self.pixels[i] = color
+            self.dirty = True
+
+    def show(self):
+        """return: True if the strip was written"""
+        if not self.dirty:
+            self.skipped += 1
+            return False
+        self.pixels.show()
+        self.dirty = False
+        self.writes += 1
+        return True
+
+    # -------------------------------------------------
+    # breathing
+    # -------------------------------------------------
+    def breathe(self, i, color, now):
+        """a new color keeps the phase of the one before"""
+        if self._base[i] is None:
+            self._started[i] = now
+        self._base[i] = color
+        self._step[i] = -1
+
+    def breathing(self):
+        i = 0
+        while i < self.n:
+            if self._base[i] is not None:
+                return True
+            i += 1
+        return False
+
+    def update(self, now):
+        """return: True if the strip was written"""
+        i = 0
+        while i < self.n:
+            base = self._base[i]
+            if base is not None:
+                step = int((now - self._started[i]) * _BREATH_RATE) % BREATH_STEPS
+                if step != self._step[i]:
+                    self._step[i] = step
+                    k = BREATH[step]
+                    self[i] = ((base[0] * k) >> 8, (base[1] * k) >> 8, (base[2] * k) >> 8)
+            i += 1
+        return self.show()
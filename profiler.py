@@ -0,0 +1,173 @@
+# ============================================================
+#   Frame profiler
+#   named spans, last `size` timings of each in a ring buffer,
+#   min / mean / p99 on demand, free heap sampling
+#   BootTrace: ms per boot stage
+#
+#   code.py only calls the Profiler behind `if prof:`, so with
+#   PROFILE off nothing is created and no span is timed
+# ============================================================
+
+import gc
+import time
+from array import array
+
+try:
+    _now_us = time.monotonic_ns
+    _SCALE = 1000
+except AttributeError:
+    # very old CircuitPython builds: float seconds
+    _now_us = time.monotonic
+    _SCALE = 0.000001
+
+
+def _us():
+    return int(_now_us() // _SCALE)
+
+
+_mem_free = getattr(gc, "mem_free", None)
+
+
+class Span:
+    """ring buffer of the last `size` durations in microseconds"""
+
+    def __init__(self, name, size):
+        self.name = name
+        self.times = array("l", [0] * size)
+        self.count = 0
+        self.max = 0
+
+    def add(self, us):
+        self.times[self.count % len(self.times)] = us
+        self.count += 1
+        if us > self.max:
+            self.max = us
+
+    def stats(self):
+        """return: (n, min, mean, p99) in us over the ring"""
+        n = min(self.count, len(self.times))
+        if not n:
+            return 0, 0, 0, 0
+        ordered = sorted(self.times[:n])
+        p99 = ordered[min(n - 1, (n * 99) // 100)]
+        return n, ordered[0], sum(ordered) // n, p99
+
+
+class Profiler:
+    """
+    t0 = prof.begin()
+    ...
+    prof.end("map", t0)
+
+    report() -> lines for the serial console
+    overlay() -> one short line for the OLED
+    """
+
+    def __init__(self, size=128, mem_every=10):
+        self.size = size
+        self.spans = {}
+        self.order = []
+        self.mem_every = mem_every    # sample gc.mem_free() every n frames
+        self.frames = 0
+        self.mem_low = None
+        self.mem_last = None
+
+    def begin(self):
+        return _us()
+
+    def end(self, name, t0):
+        span = self.spans.get(name)
+        if span is None:
+            span = self.spans[name] = Span(name, self.size)
+            self.order.append(name)
+        span.add(_us() - t0)
+
+    def frame(self):
+        """call once per rendered frame"""
+        self.frames += 1
+        if _mem_free is not None and self.frames % self.mem_every == 0:
+            free = _mem_free()
+            self.mem_last = free
+            if self.mem_low is None or free < self.mem_low:
+                self.mem_low = free
+
+    def reset(self):
+        self.spans = {}
+        self.order = []
+        self.frames = 0
+        self.mem_low = None
+
+    # -------------------------------------------------
+    # output
+    # -------------------------------------------------
+    def report(self):
+        lines = []
+        for name in self.order:
+            n, lo, mean, p99 = self.spans[name].stats()
+            lines.append("%-8s n=%d min=%.2fms mean=%.2fms p99=%.2fms max=%.2fms" % (
+                name, n, lo / 1000, mean / 1000, p99 / 1000, self.spans[name].max / 1000))
+        if self.mem_low is not None:
+            lines.append("mem_free low=%d last=%d" % (self.mem_low, self.mem_last))
+        return lines
+
+    def dump(self, title=None):
+        if title:
+            print("--- profile:", title, "---")
+        for line in self.report():
+            print(line)
+
+    def overlay(self, names=("sim", "map", "screen")):
+        """e.g. 'si1.2 ma0.4 sc9.8' (p99 ms), fits one 21 char row"""
+        parts = []
+        for name in names:
+            span = self.spans.get(name)
+            if span is not None:
+                parts.append("%s%.1f" % (name[:2], span.stats()[3] / 1000))
+        if self.mem_last is not None:
+            parts.append("%dk" % (self.mem_last // 1024))
+        return " ".join(parts)
+
+
+class BootTrace:
+    """
+    boot = BootTrace()
+    ... boot.stage("hal.init") ...    ms since the previous stage
+    boot.mark()                       deferred work starts later:
+    ... boot.stage("game modules")    time it from here
+
+    Real time from monotonic_ns. Once `clock` is set (the game
+    clock, virtual on the host where sleeps cost nothing) every
+    stage also notes its time, e.g. how long until WELCOME.
+    """
+
+    def __init__(self):
+        self.stages = []
+        self.clock = None
+        self._last = _us()
+
+    def mark(self):
+        self._last = _us()
+
+    def stage(self, name):
+        """return: the report line of this stage"""
+        now = _us()
+        t = self.clock() if self.clock else None
+        self.stages.append((name, now - self._last, t))
+        self._last = now
+        return self._line(self.stages[-1])
+
+    def _line(self, stage):
+        name, us, t = stage
+        line = "boot %-12s %8.2fms" % (name, us / 1000)
+        if t is not None:
+            line += "  t=%.2fs" % t
+        return line
+
+    def report(self):
+        lines = [self._line(s) for s in self.stages]
+        lines.append("boot %-12s %8.2fms" % ("total", sum(s[1] for s in self.stages) / 1000))
+        return lines
+
+    def dump(self):
+        for line in self.report():
+            print(line)
@@ -0,0 +1,114 @@
+# ============================================================
+#   Input recording / replay
+#   a run is fully described by the map seed plus what the
+#   player did on every sim tick and every knob event
+# ============================================================
+
+import struct
+
+MAGIC = b"MRL1"
+
+LEFT = 1
+RIGHT = 2
+SHAKE = 4
+
+# knob events <-> 1 byte
+_KNOB_CODES = {("turn", 1): 1, ("turn", -1): 2, ("press", None): 3}
+_KNOB_EVENTS = {1: ("turn", 1), 2: ("turn", -1), 3: ("press", None)}
+
+
+class InputLog:
+    """
+    seed  : map seed of the session
+    ticks : bytearray, one byte per sim tick (LEFT | RIGHT | SHAKE)
+    knob  : list of (tick index, code) for menu input
+    """
+
+    def __init__(self, seed=0):
+        self.seed = seed
+        self.ticks = bytearray()
+        self.knob = []
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<III", self.seed, len(self.ticks), len(self.knob)))
+            f.write(self.ticks)
+            for index, code in self.knob:
+                f.write(struct.pack("<IB", index, code))
+
+    @staticmethod
+    def load(path):
+        with open(path, "rb") as f:
+            if f.read(4) != MAGIC:
+                raise ValueError("not an input log: " + path)
+            seed, n_ticks, n_knob = struct.unpack("<III", f.read(12))
+            log = InputLog(seed)
+            log.ticks = bytearray(f.read(n_ticks))
+            for _ in range(n_knob):
+                log.knob.append(struct.unpack("<IB", f.read(5)))
+        return log
+
+
+class Recorder:
+    """passes live input through and writes it to the log"""
+
+    replaying = False
+
+    def __init__(self, log):
+        self.log = log
+
+    def new_game(self, seed):
+        """a log holds one game: start over on that game's seed"""
+        self.log.seed = seed
+        self.log.ticks = bytearray()
+        self.log.knob = []
+
+    def tick(self, left, right, shake):
+        bits = 0
+        if left:
+            bits |= LEFT
+        if right:
+            bits |= RIGHT
+        if shake:
+            bits |= SHAKE
+        self.log.ticks.append(bits)
+        return left, right, shake
+
+    def knob(self, event):
+        if event:
+            code = _KNOB_CODES.get(event)
+            if code:
+                self.log.knob.append((len(self.log.ticks), code))
+        return event
+
+
+class Replayer:
+    """ignores live input and plays the log back"""
+
+    replaying = True
+
+    def __init__(self, log):
+        self.log = log
+        self._tick = 0
+        self._knob = 0
+
+    def tick(self, left, right, shake):
+        if self._tick >= len(self.log.ticks):
+            return False, False, False
+        bits = self.log.ticks[self._tick]
+        self._tick += 1
+        return bool(bits & LEFT), bool(bits & RIGHT), bool(bits & SHAKE)
+
+    def knob(self, event):
+        """the next logged event once the run has reached its tick"""
+        if self._knob >= len(self.log.knob):
+            return None
+        index, code = self.log.knob[self._knob]
+        if index > self._tick:
+            return None
+        self._knob += 1
+        return _KNOB_EVENTS[code]
+
+    def done(self):
+        return self._tick >= len(self.log.ticks) and self._knob >= len(self.log.knob)
@@ -0,0 +1,108 @@
+# ============================================================
+#   Fixed-timestep frame scheduler
+# ============================================================
+
+import time
+
+
+class PhaseStats:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+
+    def add(self, dt):
+        self.count += 1
+        self.total += dt
+        if self.min is None or dt < self.min:
+            self.min = dt
+        if dt > self.max:
+            self.max = dt
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+class FrameScheduler:
+    """
+    Simulation runs in fixed ticks (tick_rate per second);
+    input and render have their own tasks and rates (code.py).
+
+    game task, per pass:
+        for _ in range(sched.ticks_due()): ...
+        await asyncio.sleep(max(0, sched.tick_left()))
+
+    begin() / end(phase, t0) time the input / update / render
+    phases, report() prints them per level.
+
+    clock is injectable so pacing can run on a PC with
+    fakes.FakeClock.
+    """
+
+    def __init__(self, tick_rate=20, max_catchup=4, clock=time.monotonic):
+        self.tick_dt = 1 / tick_rate
+        self.max_catchup = max_catchup
+        self.clock = clock
+
+        self.start()
+
+    def start(self):
+        now = self.clock()
+        self.ticks = 0
+        self.dropped_ticks = 0
+        self.stats = {}
+        self._next_tick = now
+
+    # -------------------------------------------------
+    # due checks
+    # -------------------------------------------------
+    def ticks_due(self):
+        """number of sim ticks to run now, capped at max_catchup"""
+        now = self.clock()
+        if now < self._next_tick:
+            return 0
+
+        n = int((now - self._next_tick) / self.tick_dt) + 1
+        if n > self.max_catchup:
+            # too far behind: run the cap, forget the rest
+            self.dropped_ticks += n - self.max_catchup
+            n = self.max_catchup
+            self._next_tick = now + self.tick_dt
+        else:
+            self._next_tick += n * self.tick_dt
+
+        self.ticks += n
+        return n
+
+    # -------------------------------------------------
+    # pacing
+    # -------------------------------------------------
+    def tick_left(self):
+        """seconds until the next sim tick is due"""
+        return self._next_tick - self.clock()
+
+    # -------------------------------------------------
+    # timing stats
+    # -------------------------------------------------
+    def begin(self):
+        return self.clock()
+
+    def end(self, phase, t0):
+        s = self.stats.get(phase)
+        if s is None:
+            s = self.stats[phase] = PhaseStats()
+        s.add(self.clock() - t0)
+
+    def report(self):
+        lines = []
+        for name in sorted(self.stats):
+            s = self.stats[name]
+            lines.append("%-7s n=%d mean=%.1fms min=%.1fms max=%.1fms" % (
+                name, s.count, s.mean() * 1000, (s.min or 0) * 1000, s.max * 1000))
+        if self.dropped_ticks:
+            lines.append("dropped ticks: %d" % self.dropped_ticks)
+        return lines
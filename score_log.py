@@ -0,0 +1,265 @@
+# ============================================================
+#   Lifetime run log
+#   runs.bin : append-only, one fixed-size record per game,
+#              after a header with the number of the first one
+#   runs.sum : running totals, read once, O(1) to query
+#
+#   records are numbered from the first game ever logged, so
+#   compaction moves the log's base, never the summary's count
+# ============================================================
+
+import os
+import struct
+
+LOG_MAGIC = b"MSL2"
+SUM_MAGIC = b"MSS1"
+
+# character index, difficulty index, score, level reached, seconds
+RECORD = "<BBiHH"
+RECORD_SIZE = struct.calcsize(RECORD)
+
+# magic, number of the first record in the file
+HEADER = "<4sI"
+HEADER_SIZE = struct.calcsize(HEADER)
+
+MAX_CHARS = 8
+MAX_DIFFS = 4
+
+# magic, records folded in (numbered as above), games, total score,
+# best score, total seconds, total levels,
+# then (games, best) per character and games per difficulty
+SUMMARY = "<4sIIiiII" + "Ii" * MAX_CHARS + "I" * MAX_DIFFS
+SUMMARY_SIZE = struct.calcsize(SUMMARY)
+
+
+def _exists(path):
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
+
+def _replace(tmp, path):
+    try:
+        os.rename(tmp, path)
+    except OSError:
+        # FAT will not rename onto an existing file
+        os.remove(path)
+        os.rename(tmp, path)
+
+
+class Summary:
+    """lifetime totals, everything a stats screen needs"""
+
+    def __init__(self):
+        self.covered = 0              # records 0..covered-1 already counted
+        self.games = 0
+        self.total_score = 0
+        self.best_score = 0
+        self.seconds = 0
+        self.levels = 0
+        self.char_games = [0] * MAX_CHARS
+        self.char_best = [0] * MAX_CHARS
+        self.diff_games = [0] * MAX_DIFFS
+
+    def add(self, char, diff, score, level, seconds):
+        if self.games == 0 or score > self.best_score:
+            self.best_score = score
+        self.games += 1
+        self.total_score += score
+        self.seconds += seconds
+        self.levels += level
+        if char < MAX_CHARS:
+            if self.char_games[char] == 0 or score > self.char_best[char]:
+                self.char_best[char] = score
+            self.char_games[char] += 1
+        if diff < MAX_DIFFS:
+            self.diff_games[diff] += 1
+
+    def mean_score(self):
+        return self.total_score // self.games if self.games else 0
+
+    def pack(self):
+        per_char = []
+        for i in range(MAX_CHARS):
+            per_char.append(self.char_games[i])
+            per_char.append(self.char_best[i])
+        return struct.pack(SUMMARY, SUM_MAGIC, self.covered, self.games,
+                           self.total_score, self.best_score, self.seconds,
+                           self.levels, *(per_char + self.diff_games))
+
+    @staticmethod
+    def unpack(data):
+        if len(data) != SUMMARY_SIZE:
+            raise ValueError("short run summary")
+        v = struct.unpack(SUMMARY, data)
+        if v[0] != SUM_MAGIC:
+            raise ValueError("not a run summary")
+        s = Summary()
+        s.covered, s.games, s.total_score, s.best_score, s.seconds, s.levels = v[1:7]
+        per_char = v[7:7 + 2 * MAX_CHARS]
+        s.char_games = list(per_char[0::2])
+        s.char_best = list(per_char[1::2])
+        s.diff_games = list(v[7 + 2 * MAX_CHARS:])
+        return s
+
+
+class ScoreLog:
+    """
+    add(...)  -> appends one RECORD_SIZE record, rewrites the
+                 SUMMARY_SIZE summary (two small flash writes)
+    summary   -> in memory, no file access
+
+    Past max_records the log is compacted to its newest
+    keep_records; the summary keeps counting everything.
+    If the board reset between the append and the summary
+    write, load() folds the missing records back in. A reset
+    during compaction loses nothing: the summary is not
+    touched, only the log's base moves.
+    """
+
+    def __init__(self, path="runs.bin", max_records=512, keep_records=128):
+        self.path = path
+        self.sum_path = path.rsplit(".", 1)[0] + ".sum"
+        self.max_records = max_records
+        self.keep_records = keep_records
+        self.base = 0                 # number of the log's first record
+        self.records = 0
+        self.writes = 0
+        self.summary = Summary()
+        self.load()
+
+    # --------------------------------------
+    # load
+    # --------------------------------------
+    def _check_log(self):
+        """count whole records, repair what a reset can leave behind"""
+        try:
+            size = os.stat(self.path)[6]
+            with open(self.path, "rb") as f:
+                header = f.read(HEADER_SIZE)
+        except OSError:
+            return 0
+        if len(header) < HEADER_SIZE or header[:len(LOG_MAGIC)] != LOG_MAGIC:
+            print("run log unreadable, starting a new one")
+            os.remove(self.path)
+            return 0
+
+        self.base = struct.unpack(HEADER, header)[1]
+        body = size - HEADER_SIZE
+        self.records = body // RECORD_SIZE
+        if body % RECORD_SIZE:
+            # torn last record: rewrite without it so appends stay aligned
+            self.compact(self.records)
+        return self.records
+
+    def load(self):
+        try:
+            self.records = self._check_log()
+        except OSError as e:
+            print("run log not repaired (read-only flash?)", e)
+
+        summary = None
+        if _exists(self.sum_path):
+            try:
+                with open(self.sum_path, "rb") as f:
+                    summary = Summary.unpack(f.read(SUMMARY_SIZE))
+            except (OSError, ValueError):
+                print("run summary unreadable, rebuilding from the log")
+        if summary is None:
+            summary = Summary()
+        self.summary = summary
+
+        end = self.base + self.records
+        if summary.covered < self.base:
+            # records before the base were compacted away uncounted
+            # (a new or rebuilt summary): nothing left to fold in
+            summary.covered = self.base
+        if summary.covered > end:
+            # log lost records the totals hold: keep the totals
+            summary.covered = end
+        elif summary.covered < end:
+            # records appended after the last summary write
+            for rec in self.read(summary.covered - self.base):
+                summary.add(*rec)
+            summary.covered = end
+            try:
+                self._write_summary()
+            except OSError:
+                pass
+
+    def read(self, start=0):
+        """yield records from index `start` (the slow path, for tools)"""
+        with open(self.path, "rb") as f:
+            f.seek(HEADER_SIZE + start * RECORD_SIZE)
+            for _ in range(start, self.records):
+                data = f.read(RECORD_SIZE)
+                if len(data) < RECORD_SIZE:
+                    return
+                yield struct.unpack(RECORD, data)
+
+    # --------------------------------------
+    # write
+    # --------------------------------------
+    def _write_summary(self):
+        tmp = self.sum_path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(self.summary.pack())
+        _replace(tmp, self.sum_path)
+        self.writes += 1
+
+    def add(self, char, diff, score, level, seconds):
+        """log one finished game, False on read-only flash"""
+        seconds = min(int(seconds), 0xFFFF)
+        level = min(level, 0xFFFF)
+        try:
+            if self.records >= self.max_records:
+                self.compact()
+            new = not _exists(self.path)
+            with open(self.path, "ab") as f:
+                if new:
+                    # numbering goes on from what the summary counted
+                    self.base = self.summary.covered
+                    f.write(struct.pack(HEADER, LOG_MAGIC, self.base))
+                f.write(struct.pack(RECORD, char, diff, score, level, seconds))
+            self.records += 1
+            self.writes += 1
+
+            self.summary.add(char, diff, score, level, seconds)
+            self.summary.covered = self.base + self.records
+            self._write_summary()
+        except OSError as e:
+            print("run not logged (read-only flash?)", e)
+            return False
+        return True
+
+    def compact(self, keep=None):
+        """keep only the newest `keep` (default keep_records) records"""
+        if keep is None:
+            keep = self.keep_records
+        start = max(0, self.records - keep)
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(struct.pack(HEADER, LOG_MAGIC, self.base + start))
+            for rec in self.read(start):
+                f.write(struct.pack(RECORD, *rec))
+        _replace(tmp, self.path)
+        self.writes += 1
+        self.base += start
+        self.records -= start
+
+    # --------------------------------------
+    # display
+    # --------------------------------------
+    def stats_lines(self, names=(), difficulties=()):
+        s = self.summary
+        lines = ["games %d  best %d  mean %d" % (s.games, s.best_score, s.mean_score()),
+                 "levels %d  time %dm" % (s.levels, s.seconds // 60)]
+        for i, name in enumerate(names[:MAX_CHARS]):
+            if s.char_games[i]:
+                lines.append("%s: %d games, best %d" % (name, s.char_games[i], s.char_best[i]))
+        for i, name in enumerate(difficulties[:MAX_DIFFS]):
+            if s.diff_games[i]:
+                lines.append("%s: %d games" % (name, s.diff_games[i]))
+        return lines
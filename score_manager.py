@@ -1,44 +1,141 @@
 import os
 
+
+def _insert_pos(scores, score):
+    """
+    binary search on a list sorted high -> low (no bisect on
+    CircuitPython). Equal scores keep their order: the new one
+    goes after them, like the old append + stable sort.
+    """
+    lo, hi = 0, len(scores)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if scores[mid][1] >= score:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _parse(line):
+    """'Madoka,200' -> ('Madoka', 200), None if the line is broken"""
+    name, sep, score_str = line.rpartition(",")
+    if not sep or not name:
+        return None
+    try:
+        return name, int(score_str)
+    except ValueError:
+        return None
+
+
 class ScoreManager:
-    def __init__(self, filename="scores.txt"):
+    """
+    scores.txt is read once into memory:
+        board: top `top` (name, score), high -> low
+        bests: best score of every character
+    and only written back when one of them changes, through
+    a temp file + rename so a reset mid-write keeps the old file.
+
+    file format (old files load as they are):
+        Madoka,200      board entry
+        *Homura,140     character best
+    """
+
+    def __init__(self, filename="scores.txt", top=3):
         self.filename = filename
-        
-        if not self._file_exists():
-            self._init_empty_file()
+        self.tmp = filename + ".tmp"
+        self.top = top
+
+        self.board = []
+        self.bests = {}
+        self.writes = 0           # flash writes since boot
+        self.skipped = 0          # broken lines ignored on load
+        self._lines = None        # cached get_highscore_display()
 
-    def _file_exists(self):
+        self._load()
+
+    def _file_exists(self, filename):
         try:
-            os.stat(self.filename)
+            os.stat(filename)
             return True
         except OSError:
             return False
 
-    def _init_empty_file(self):
-        with open(self.filename, "w") as f:
-            f.write("")   
-
-    def _load_scores(self):
-        scores = []
-        
-        with open(self.filename, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    print("Empty!")
-                # format：Madoka,200
-                name, score_str = line.split(",")
-                scores.append((name, int(score_str)))
-
-        
-        print(scores)
+    # --------------------------------------
+    # flash
+    # --------------------------------------
+    def _load(self):
+        filename = self.filename
+        if not self._file_exists(filename):
+            # reset between the two steps of _save
+            if not self._file_exists(self.tmp):
+                return
+            filename = self.tmp
 
-        return scores
+        try:
+            with open(filename, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    # format：Madoka,200 / *Madoka,200
+                    best = line[0] == "*"
+                    entry = _parse(line[1:] if best else line)
+                    if entry is None:
+                        self.skipped += 1
+                        continue
+                    if best:
+                        self._update_best(*entry)
+                    else:
+                        self._insert(*entry)
+        except (OSError, UnicodeError):
+            print("scores unreadable, starting empty")
+            self.skipped += 1
+
+        if self.skipped:
+            print("scores: skipped", self.skipped, "broken lines")
+
+        # old files have no bests, the board is a good start
+        for name, score in self.board:
+            self._update_best(name, score)
+
+    def _save(self):
+        try:
+            with open(self.tmp, "w") as f:
+                for name, score in self.board:
+                    f.write(f"{name},{score}\n")
+                for name in sorted(self.bests):
+                    f.write(f"*{name},{self.bests[name]}\n")
+            try:
+                os.rename(self.tmp, self.filename)
+            except OSError:
+                # FAT will not rename onto an existing file
+                os.remove(self.filename)
+                os.rename(self.tmp, self.filename)
+        except OSError as e:
+            print("scores not saved (read-only flash?)", e)
+            return False
+        self.writes += 1
+        return True
 
-    def _save_scores(self, scores):
-        with open(self.filename, "w") as f:
-            for name, score in scores:
-                f.write(f"{name},{score}\n")
+    # --------------------------------------
+    # in memory
+    # --------------------------------------
+    def _insert(self, name, score):
+        """return: rank (0 based) on the board, -1 if it did not make it"""
+        i = _insert_pos(self.board, score)
+        if i >= self.top:
+            return -1
+        self.board.insert(i, (name, score))
+        del self.board[self.top:]
+        return i
+
+    def _update_best(self, name, score):
+        old = self.bests.get(name)
+        if old is not None and old >= score:
+            return False
+        self.bests[name] = score
+        return True
 
     # --------------------------------------
     # 对外功能
@@ -46,58 +143,41 @@ class ScoreManager:
 
     def add_score(self, character, score):
         """
-        return: True -> top3
+        return: True -> top N
         """
-        all_scores = self._load_scores()
-
-        # add new
-        all_scores.append((character, score))
+        rank = self._insert(character, score)
+        new_best = self._update_best(character, score)
 
-        # sort
-        all_scores.sort(key=lambda x: x[1], reverse=True)
+        if rank >= 0 or new_best:
+            self._lines = None
+            self._save()
 
-        # top 3?
-        is_new_high = False
-        if (character, score) in all_scores[:3]:
-            is_new_high = True
+        return rank >= 0
 
-        # save top 3
-        trimmed = all_scores[:3]
-
-        self._save_scores(trimmed)
-
-        return is_new_high
+    def best(self, character):
+        return self.bests.get(character)
 
     def get_highscore_display(self):
         """
         return high score list
         format:
         [
-            "< High Score >",
             "1 Madoka 200",
             "2 Homura 140",
             "-----"
         ]
         """
-        lines = []
+        if self._lines is not None:
+            return self._lines
 
-        scores = self._load_scores()
-
-        if len(scores) == 0:
-            lines.append("-----")
-            return lines
-
-        # sort (in case
-        scores.sort(key=lambda x: x[1], reverse=True)
-
-        for idx, (name, score) in enumerate(scores):
+        lines = []
+        for idx, (name, score) in enumerate(self.board):
             # format: 1 Madoka 200
             lines.append(f"{idx+1} {name} {score}")
 
         # empty: "-----"
-        if len(scores) < 3:
+        if len(self.board) < self.top:
             lines.append("-----")
-        
 
+        self._lines = lines
         return lines
-
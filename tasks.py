@@ -0,0 +1,135 @@
+# ============================================================
+#   Task runtime helpers
+#   asyncio on the board (CircuitPython asyncio library),
+#   stdlib asyncio on a PC (hal.run() adds a virtual clock)
+#
+#   CircuitPython's asyncio has Event but no Queue, so the
+#   queues between tasks are built here on top of Event.
+# ============================================================
+
+import asyncio
+
+
+class Queue:
+    """
+    small FIFO between two tasks
+
+    put()        never blocks: when full the oldest item goes
+                 (like keypad's event queue), `dropped` counts it
+    get_nowait() -> item or None
+    await get()  -> next item, waits while empty
+    await wait() -> returns once something is queued, takes nothing
+    """
+
+    def __init__(self, size=8):
+        self.size = size
+        self.items = []
+        self.dropped = 0
+        self._ready = asyncio.Event()
+
+    def __len__(self):
+        return len(self.items)
+
+    def put(self, item):
+        if len(self.items) >= self.size:
+            self.items.pop(0)
+            self.dropped += 1
+        self.items.append(item)
+        self._ready.set()
+
+    def get_nowait(self):
+        if not self.items:
+            return None
+        item = self.items.pop(0)
+        if not self.items:
+            self._ready.clear()
+        return item
+
+    async def wait(self):
+        while not self.items:
+            await self._ready.wait()
+
+    async def get(self):
+        await self.wait()
+        return self.get_nowait()
+
+    def clear(self):
+        self.items = []
+        self._ready.clear()
+
+
+class Ticker:
+    """
+    fixed rate for a task loop:
+
+    tick = Ticker(10, clock)
+    while True:
+        ...
+        await tick.wait()
+
+    a slot that is already over is skipped, not made up for
+    """
+
+    def __init__(self, rate, clock):
+        self.dt = 1 / rate
+        self.clock = clock
+        self.next = clock()
+        self.skipped = 0
+
+    def reset(self):
+        self.next = self.clock()
+
+    async def wait(self):
+        self.next += self.dt
+        left = self.next - self.clock()
+        if left <= 0:
+            self.skipped += 1
+            self.next = self.clock()
+            left = 0
+        await asyncio.sleep(left)
+
+
+class Tasks:
+    """
+    background tasks beside one main coroutine:
+
+    tasks = Tasks()
+    tasks.start(input_task)            # coroutine function
+    result = await tasks.run(main())   # cancels the rest after
+
+    A background task that raises stops everything and its error
+    comes out of run(), instead of the task dying on its own
+    while the game waits for it forever.
+    """
+
+    def __init__(self):
+        self.tasks = []
+        self.error = None
+        self._done = asyncio.Event()
+
+    def start(self, task):
+        self.tasks.append(asyncio.create_task(self._guard(task())))
+
+    async def _guard(self, coro):
+        try:
+            return await coro
+        except Exception as e:
+            self.error = e
+            self._done.set()
+
+    async def run(self, main):
+        result = []
+
+        async def main_task():
+            result.append(await main)
+            self._done.set()
+
+        self.start(main_task)
+        try:
+            await self._done.wait()
+        finally:
+            for task in self.tasks:
+                task.cancel()
+        if self.error is not None:
+            raise self.error
+        return result[0] if result else None
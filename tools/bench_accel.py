@@ -0,0 +1,125 @@
+# ============================================================
+#   Host benchmark: float Accelerator vs FixedAccelerator
+#   run:  python tools/bench_accel.py
+#
+#   1. filter throughput, samples per ms, for FIFO batch sizes
+#   2. both filters on the same ADXL345 stream must agree on
+#      every LEFT / RIGHT / SHAKE
+#   3. calibration time on the virtual clock
+# ============================================================
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import fakes
+from adxl_fifo import FifoADXL345, MS2_PER_LSB
+from input_manager import Accelerator, FixedAccelerator
+
+REST = (0.0, 0.0, 9.8)
+FRAME = 0.1
+
+
+class Batches:
+    """
+    FIFO stand-in without the bus: hands out the same prepared
+    batches through drain() (floats) and drain_raw() (counts)
+    """
+
+    def __init__(self, batches):
+        self.batches = batches
+        self.raw = [[int(round(v / MS2_PER_LSB)) for s in b for v in s] for b in batches]
+        self.i = 0
+        self.events = 0
+
+    @property
+    def acceleration(self):
+        return self.batches[0][0]
+
+    def drain(self):
+        b = self.batches[self.i % len(self.batches)]
+        self.i += 1
+        return b, 0
+
+    def drain_raw(self, out):
+        raw = self.raw[self.i % len(self.raw)]
+        self.i += 1
+        out[:len(raw)] = raw
+        return len(raw) // 3
+
+
+def noisy(rnd, base):
+    return tuple(v + rnd.gauss(0, 0.05) for v in base)
+
+
+def throughput(cls, per_frame, frames=3000):
+    rnd = random.Random(1)
+    batches = [[noisy(rnd, REST) for _ in range(per_frame)] for _ in range(30)]
+    batches += [[noisy(rnd, (rnd.uniform(-8, 8), 0.0, 9.8)) for _ in range(per_frame)]
+                for _ in range(200)]
+    dev = Batches(batches)
+    acc = cls(dev, clock=time.monotonic, sleep=lambda s: None)
+    dev.i = 0
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        acc.update()
+    dt = time.perf_counter() - t0
+    return frames * per_frame / (dt * 1000)
+
+
+def world(seed=3, seconds=120, rate=100):
+    """tilts and shakes at 100 Hz"""
+    rnd = random.Random(seed)
+    samples = [noisy(rnd, REST) for _ in range(2 * rate)]
+    while len(samples) < seconds * rate:
+        roll = rnd.random()
+        if roll < 0.01:
+            x = rnd.choice((-6.0, 6.0))
+            samples += [noisy(rnd, (x, 0.0, 9.8)) for _ in range(40)]
+        elif roll < 0.015:
+            samples += [(0.0, 0.0, 30.0), (0.0, 0.0, -10.0)] * rnd.randint(5, 15)
+        else:
+            samples.append(noisy(rnd, REST))
+    return samples, rate
+
+
+def decisions(cls, samples, rate):
+    clock = fakes.FakeClock()
+    bus = fakes.FakeADXL345(clock, samples, signal_rate=rate)
+    acc = cls(FifoADXL345(bus), clock=clock, sleep=clock.sleep)
+    cal = clock()
+
+    # same frame phase for both: start at 2 s, drop the backlog
+    clock.advance(2.0 - cal)
+    acc.update()
+    out = []
+    while clock() < len(samples) / rate:
+        clock.advance(FRAME)
+        out.append(acc.update())
+    return out, cal
+
+
+if __name__ == "__main__":
+    sys.stdout, stdout = open(os.devnull, "w"), sys.stdout     # filter prints
+    try:
+        rows = [(n, throughput(Accelerator, n), throughput(FixedAccelerator, n))
+                for n in (1, 3, 10, 32)]
+        samples, rate = world()
+        float_out, float_cal = decisions(Accelerator, samples, rate)
+        fixed_out, fixed_cal = decisions(FixedAccelerator, samples, rate)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    print("samples per ms (host CPython, filter only)")
+    for n, f, q in rows:
+        print("  %2d per frame  float %7.1f  fixed %7.1f  x%.2f" % (n, f, q, q / f))
+
+    differ = sum(1 for a, b in zip(float_out, fixed_out) if a != b)
+    events = sum(1 for a in float_out if any(a))
+    print("decisions: %d frames, %d gestures, %d differ" % (len(float_out), events, differ))
+    print("calibration: float %.2f s, fixed %.2f s (virtual)" % (float_cal, fixed_cal))
+    sys.exit(1 if differ else 0)
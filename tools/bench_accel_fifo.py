@@ -0,0 +1,92 @@
+# ============================================================
+#   Host check: short shakes vs the 100 ms input frame
+#   run:  python tools/bench_accel_fifo.py
+#
+#   the world is a 200 Hz signal with 40-80 ms shakes placed
+#   between frames; every backend runs on fakes.FakeADXL345
+#   so detections and I2C transactions are comparable
+# ============================================================
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import fakes
+from adxl_fifo import FifoADXL345, RATE_25HZ, RATE_100HZ
+from input_manager import Accelerator
+
+SIGNAL_HZ = 200
+FRAME = 0.1               # code.INPUT_HZ = 10
+REST = (0.0, 0.0, 9.8)
+SHAKE = ((0.0, 0.0, 38.0), (0.0, 0.0, -20.0))
+
+
+class Polled:
+    """the old path: adafruit-style .acceleration, one read per frame"""
+
+    def __init__(self, chip):
+        self.chip = chip
+
+    @property
+    def acceleration(self):
+        return self.chip.acceleration
+
+
+def world(shakes=40, seed=7):
+    """return: (samples at SIGNAL_HZ, start time of every shake)"""
+    samples = [REST] * (3 * SIGNAL_HZ)           # calibration + settle
+    starts = []
+    n = seed
+    for _ in range(shakes):
+        n = (n * 1103515245 + 12345) & 0x7FFFFFFF
+        samples += [REST] * (SIGNAL_HZ + n % 37)  # > 1 s apart, any phase
+        length = 8 + (n >> 8) % 9                 # 40 .. 80 ms
+        starts.append(len(samples) / SIGNAL_HZ)
+        samples += [SHAKE[i % 2] for i in range(length)]
+    samples += [REST] * SIGNAL_HZ
+    return samples, starts
+
+
+def run(name, make):
+    samples, starts = world()
+    clock = fakes.FakeClock()
+    bus = fakes.FakeADXL345(clock, samples, signal_rate=SIGNAL_HZ)
+    device = make(bus)
+    acc = Accelerator(device, clock=clock, sleep=clock.sleep)
+
+    bus.transactions = 0
+    frames = 0
+    hits = []
+    end = len(samples) / SIGNAL_HZ
+    while clock() < end:
+        clock.advance(FRAME)
+        left, right, shake = acc.update()
+        frames += 1
+        if shake:
+            hits.append(clock())
+
+    # a shake counts as seen if a SHAKE comes within 0.3 s of it
+    seen = sum(1 for s in starts if any(s <= t <= s + 0.3 for t in hits))
+    false = sum(1 for t in hits if not any(s <= t <= s + 0.3 for s in starts))
+    return name, seen, len(starts), false, bus.transactions / frames
+
+
+if __name__ == "__main__":
+    sys.stdout, out = open(os.devnull, "w"), sys.stdout     # Accelerator prints
+    try:
+        results = [
+            run("old: 1 read/frame", lambda bus: Polled(FifoADXL345(bus, rate=RATE_100HZ, fifo=False))),
+            run("bypass + chip activity/tap", lambda bus: FifoADXL345(bus, rate=RATE_100HZ, fifo=False)),
+            run("FIFO 25 Hz + chip activity", lambda bus: FifoADXL345(bus, rate=RATE_25HZ)),
+            run("FIFO 100 Hz + chip tap", lambda bus: FifoADXL345(bus, rate=RATE_100HZ)),
+        ]
+    finally:
+        sys.stdout.close()
+        sys.stdout = out
+
+    for name, seen, total, false, io in results:
+        print("%-28s seen %2d/%d  false %d  I2C/frame %.2f" % (name, seen, total, false, io))
+
+    # the default backend (bypass + chip latch) must see every shake
+    sys.exit(0 if results[1][1] == results[1][2] else 1)
@@ -0,0 +1,97 @@
+# ============================================================
+#   Host benchmark: I2C bytes per frame on the framebuffer backend
+#   run:  python tools/bench_framebuffer.py [--show]
+#
+#   also: bytes flush() allocates per frame, must be 0
+# ============================================================
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import fakes
+fakes.install_display_modules()
+
+from oled_renderer import draw_map, draw_text_block, GameScreen
+from framebuffer import FramebufferDisplay, WIDTH, HEIGHT
+
+from bench_render import frames, FRAMES
+
+# what a displayio root_group swap pushes: whole panel + addressing
+FULL_FRAME = WIDTH * HEIGHT // 8
+
+
+def run(name, retained):
+    i2c = fakes.RecordingI2C()
+    display = FramebufferDisplay(i2c)
+    i2c.reset()
+    display.pages_sent = 0
+
+    screen = GameScreen(display) if retained else None
+    if screen:
+        screen.show()
+
+    for hud, grid, offset, player_col in frames():
+        lines = [hud]
+        lines.extend(draw_map(display, grid, player_col, offset))
+        if screen:
+            screen.update(lines)
+        else:
+            draw_text_block(display, lines, align="center", start_pos=(0, 10), line_spacing=10)
+
+    print("%-9s bytes/frame %7.1f  pages/frame %.2f  (full refresh ~%d)"
+          % (name, i2c.bytes_sent / FRAMES, display.pages_sent / FRAMES, FULL_FRAME))
+    return display
+
+
+class CountingI2C(fakes.RecordingI2C):
+    """counts bytes only: RecordingI2C's copy of each write would be the allocation"""
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        self.bytes_sent += (len(buffer) if end is None else end) - start
+
+
+def flush_alloc(display):
+    """most bytes one frame's flush() allocates, frames changing 1 / 128 bytes"""
+    display.i2c = CountingI2C()
+    buf = display.back.buf
+    worst = 0
+    tracemalloc.start()
+    try:
+        for f in range(FRAMES):
+            for span in (1, 128):
+                for j in range(span):
+                    buf[(f * 7 + j) % len(buf)] ^= 0xFF
+                # CPython ints past 256 are heap objects, growing
+                # counters would allocate; small ints on the board
+                display.bytes_sent = display.pages_sent = display.i2c.bytes_sent = 0
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                display.flush()
+                display.flush()         # unchanged frame
+                worst = max(worst, tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    return worst
+
+
+def show(display):
+    buf = display.back.buf
+    for y in range(HEIGHT):
+        row = ""
+        for x in range(WIDTH):
+            row += "#" if buf[(y >> 3) * WIDTH + x] & (1 << (y & 7)) else "."
+        print(row)
+
+
+if __name__ == "__main__":
+    run("textblock", retained=False)
+    d = run("retained", retained=True)
+    peak = flush_alloc(d)
+    print("flush() allocates %d B per frame (worst of %d)" % (peak, 2 * FRAMES))
+    if "--show" in sys.argv:
+        show(d)
+    if peak:
+        sys.exit(1)
@@ -0,0 +1,80 @@
+# ============================================================
+#   Host benchmark: heap + display objects over full cycles
+#   intro -> select -> play -> ending, headless, virtual clock
+#   run:  python tools/bench_heap.py [games]
+#
+#   high-water = tracemalloc peak during one select -> play ->
+#   ending cycle, above what was live when the cycle started.
+#   It is CPython's heap, not the board's, but it moves with
+#   what the game allocates; the displayio object counts are
+#   exactly what the board would allocate.
+# ============================================================
+
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import run_headless
+import fakes
+
+# the buzzer log grows with every note: keep the fakes' own
+# bookkeeping out of the measurement
+fakes.RecordingPWM._record = lambda self, name, value: None
+
+DISPLAY_OBJECTS = ("Group", "Label", "TileGrid", "Bitmap", "Palette")
+
+
+def created():
+    return sum(fakes.counts.get(k, 0) for k in DISPLAY_OBJECTS)
+
+
+def measure(games):
+    """return: list of (high-water bytes, display objects) per cycle"""
+    cycles = []
+    load_game = run_headless.load_game
+
+    def instrumented():
+        game = load_game()
+        select_character = game.select_character
+        play_ending = game.play_ending
+        start = {}
+
+        def cycle_start():
+            gc.collect()
+            tracemalloc.reset_peak()
+            start["heap"] = tracemalloc.get_traced_memory()[0]
+            start["objects"] = created()
+            return select_character()
+
+        async def cycle_end(*args):
+            await play_ending(*args)
+            cycles.append((tracemalloc.get_traced_memory()[1] - start["heap"],
+                           created() - start["objects"]))
+
+        game.select_character = cycle_start
+        game.play_ending = cycle_end
+        return game
+
+    run_headless.load_game = instrumented
+    fakes.reset_counts()
+    tracemalloc.start()
+    try:
+        # FakeAccelerometer: the ADXL345 register model's own
+        # sample bursts would dominate the host peak
+        run_headless.run(games, accel_gestures=False)
+    finally:
+        tracemalloc.stop()
+        run_headless.load_game = load_game
+    return cycles
+
+
+if __name__ == "__main__":
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    for i, (peak, objects) in enumerate(measure(games)):
+        print("cycle %d: heap high-water %6.1f KB, display objects created %d"
+              % (i + 1, peak / 1024, objects))
+    print("label text writes: %d" % fakes.counts.get("Label.text", 0))
@@ -0,0 +1,128 @@
+# ============================================================
+#   Host benchmark: HUD + map text per frame
+#   string building every frame vs oled_renderer.HudModel
+#   run:  python tools/bench_hud.py
+#
+#   a scripted level: label text writes, time per frame. Then
+#   the last frame repeated IDLE_FRAMES times in one tracemalloc
+#   window: "idle" frames are the ones where nothing on screen
+#   moved, most frames at 10 Hz with a 1.5 s step_time. Its
+#   peak has to stay at +0 B for the model.
+# ============================================================
+
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import fakes
+fakes.install_display_modules()
+
+from oled_renderer import draw_map, GameScreen, HudModel
+from lane_map import LaneMap
+
+FRAMES = 600
+STEP_FRAMES = 15     # 1.5 s step_time at 100 ms per frame
+
+
+def make_grid(rows=60, prob=0.3):
+    rnd = random.Random(1)
+    grid = LaneMap(rows)
+    for r in range(rows):
+        grid.set_row(r, sum(1 << c for c in range(5) if rnd.random() < prob))
+    return grid
+
+
+def frames():
+    # (level, charge, score, offset, player_col) like game_loop sees them
+    offset = 55
+    score = charge = 0
+    player_col = 2
+    for f in range(FRAMES):
+        if f % STEP_FRAMES == 0 and offset > 0:
+            offset -= 1
+            score += 10
+            charge = min(100, charge + 5)
+        if f % 40 == 20:
+            player_col = (player_col + 1) % 5
+        yield 1, charge, score, offset, player_col
+
+
+def concat(display, screen, grid):
+    # what game_loop did before HudModel
+    def frame(level, charge, score, offset, player_col):
+        lines = ["Lv." + str(level) + "    " + str(charge) + "%    " + str(score)]
+        lines.extend(draw_map(display, grid, player_col, offset))
+        screen.update(lines)
+    return frame
+
+
+def model(display, screen, grid):
+    hud = HudModel()
+
+    def frame(level, charge, score, offset, player_col):
+        hud.set_map(grid, player_col, offset)
+        hud.set_stats(level, charge, score)
+        screen.draw(hud)
+    return frame
+
+
+IDLE_FRAMES = 200   # stays a cached small int in the loop below
+
+
+def idle_block(frame, state):
+    """
+    bytes over IDLE_FRAMES repeats of one frame, measured around
+    the whole block: (peak above the start, still held at the end)
+    """
+    frame(*state)           # the state is on screen now
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    i = 0
+    while i < IDLE_FRAMES:
+        frame(*state)
+        i += 1
+    now, peak = tracemalloc.get_traced_memory()
+    return peak - before, now - before
+
+
+def measure(name, build):
+    display = fakes.RecordingDisplay()
+    screen = GameScreen(display)
+    screen.show()
+    grid = make_grid()
+    frame = build(display, screen, grid)
+
+    fakes.reset_counts()
+    idle = busy = 0
+    last = None
+    t0 = time.perf_counter()
+    for state in frames():
+        frame(*state)
+        if state == last:
+            idle += 1
+        else:
+            busy += 1
+        last = state
+    dt = time.perf_counter() - t0
+    sets = fakes.counts.get("Label.text", 0)
+
+    tracemalloc.start()
+    peak, held = idle_block(frame, last)
+    tracemalloc.stop()
+
+    print("%-7s frames %d (idle %d, changed %d)  text sets %d  %.1f us/frame"
+          "  | %d idle frames: peak +%d B, held +%d B"
+          % (name, FRAMES, idle, busy, sets, dt / FRAMES * 1e6, IDLE_FRAMES, peak, held))
+    return peak
+
+
+if __name__ == "__main__":
+    measure("concat", concat)
+    peak = measure("model", model)
+    print("idle frames allocate nothing" if peak == 0 else "idle frames still allocate")
+    if peak:
+        sys.exit(1)
@@ -0,0 +1,97 @@
+# ============================================================
+#   Host check: fast knob spin, no detent may be lost
+#   run:  python tools/bench_knob.py
+#
+#   rotaryio    fakes.FakeIncrementalEncoder
+#   keypad      input_manager.KeypadEncoder (ESP32-C3, no
+#               rotaryio) fed by A/B edges through fakes.FakeKeys
+# ============================================================
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import fakes
+from input_manager import KnobController, KeypadEncoder
+
+OLD_CD = 0.3          # the old encoder_cd: one turn per 0.3 s at most
+
+
+class KeypadKnob(KeypadEncoder):
+    """KeypadEncoder on a FakeKeys that turn() feeds with pin edges"""
+
+    def __init__(self, clock, divisor=4):
+        KeypadEncoder.__init__(self, fakes.FakeKeys(clock), divisor)
+        self._pins = 3
+
+    def turn(self, detents):
+        gray = self._GRAY
+        direction = 1 if detents > 0 else -1
+        for _ in range(abs(detents) * self.divisor):
+            new = gray[(gray.index(self._pins) + direction) % 4]
+            changed = new ^ self._pins
+            key = 0 if changed == 2 else 1
+            if new & changed:
+                self.keys.release(key)
+            else:
+                self.keys.press(key)
+            self._pins = new
+
+
+def spin(detents_per_s, seconds=2.0, poll_every=0.05, direction=1, kind="rotaryio"):
+    """
+    feed a quadrature edge train (4 edges per detent) while the menu
+    polls every `poll_every` s, return (sent, captured, old_captured)
+    """
+    clock = fakes.FakeClock()
+    if kind == "keypad":
+        encoder = KeypadKnob(clock)
+    else:
+        encoder = fakes.FakeIncrementalEncoder()
+    keys = fakes.FakeKeys(clock)
+    knob = KnobController(encoder, keys, clock=clock)
+
+    edge_dt = 1.0 / (detents_per_s * encoder.divisor)
+    next_poll = poll_every
+    sent = captured = 0
+    old_captured = 0
+    last_old = -OLD_CD
+
+    while clock() < seconds:
+        encoder.turn(direction)      # one detent = 4 edges
+        sent += 1
+        clock.advance(edge_dt * encoder.divisor)
+
+        if clock() >= next_poll:
+            next_poll += poll_every
+            event = knob.check()
+            while event:
+                if event[0] == "turn":
+                    captured += event[1] * direction
+                    if clock() - last_old > OLD_CD:
+                        old_captured += 1
+                        last_old = clock()
+                event = knob.check()
+
+    # whatever is still counted shows up on the next poll
+    event = knob.check()
+    while event:
+        captured += event[1] * direction
+        event = knob.check()
+
+    return sent, captured, old_captured
+
+
+if __name__ == "__main__":
+    ok = True
+    print("encoder   detents/s   sent  captured  (old 0.3 s cooldown would keep)")
+    for kind in ("rotaryio", "keypad"):
+        for rate in (5, 20, 60, 200):
+            for direction in (1, -1):
+                sent, captured, old = spin(rate, direction=direction, kind=kind)
+                ok &= sent == captured
+                print("%-9s %6d %3s %6d %9d   %d" % (kind, rate, "cw" if direction > 0 else "ccw",
+                                                      sent, captured, old))
+    print("no detents lost" if ok else "DETENTS LOST")
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,75 @@
+# ============================================================
+#   Host benchmark: level map memory, list-of-lists vs LaneMap
+#   run:  python tools/bench_map.py
+# ============================================================
+
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from lane_map import LaneMap, MapStream
+
+PROB = 0.3
+
+
+def build_grid(rows):
+    # the old generate_map layout
+    rnd = random.Random(1)
+    grid = []
+    for _ in range(rows):
+        grid.append(["X" if rnd.random() < PROB else " " for _ in range(5)])
+    return grid
+
+
+def build_lane_map(rows):
+    rnd = random.Random(1)
+    grid = LaneMap(rows)
+    for r in range(rows):
+        mask = 0
+        for c in range(5):
+            if rnd.random() < PROB:
+                mask |= 1 << c
+        grid.set_row(r, mask)
+    return grid
+
+
+def build_stream(rows):
+    # scroll through the whole level like game_loop does
+    grid = MapStream(1, PROB, rows)
+    for offset in range(rows, -1, -1):
+        for i in range(5):
+            grid.row_mask(offset + i)
+    return grid
+
+
+def heap_of(build, rows):
+    tracemalloc.start()
+    grid = build(rows)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return grid, size
+
+
+def lookups_per_s(hit, grid, rows, n=200000):
+    t0 = time.perf_counter()
+    # scroll slowly through the level, like collision checks do
+    for i in range(n):
+        hit(grid, (i >> 6) % rows, i % 5)
+    return n / (time.perf_counter() - t0)
+
+
+if __name__ == "__main__":
+    print("rows     list-of-lists    LaneMap  MapStream   lookups/s (list / LaneMap / MapStream)")
+    for rows in (40, 400, 4000):
+        g_list, m_list = heap_of(build_grid, rows)
+        g_lane, m_lane = heap_of(build_lane_map, rows)
+        g_stream, m_stream = heap_of(build_stream, rows)
+        l1 = lookups_per_s(lambda g, r, c: g[r][c] == "X", g_list, rows)
+        l2 = lookups_per_s(lambda g, r, c: g.is_blocked(r, c), g_lane, rows)
+        l3 = lookups_per_s(lambda g, r, c: g.is_blocked(r, c), g_stream, rows)
+        print("%-6d %10d B %10d B %8d B    %.2fM / %.2fM / %.2fM"
+              % (rows, m_list, m_lane, m_stream, l1 / 1e6, l2 / 1e6, l3 / 1e6))
@@ -0,0 +1,80 @@
+# ============================================================
+#   Host benchmark: NeoPixel writes, old helpers vs pixel_fx
+#   run:  python tools/bench_pixels.py
+#
+#   one minute of the character screen: pixel 0 breathing,
+#   the HP pixels set every 5 s (changing now and then).
+#     10ms loop   the old menu loop: breathing_color() every
+#                 10 ms, auto_write on + show()
+#     task 20Hz   the same helpers from a 20 Hz LED task
+#     fx 20Hz     PixelFX, auto_write off, changed frames only
+#     fx 100Hz    PixelFX polled 5x as often: same writes
+#   writes/s are strip transmissions (fakes.RecordingPixels),
+#   us/frame the host time of one LED frame.
+# ============================================================
+
+import os
+import sys
+import math
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import fakes
+from pixel_fx import PixelFX
+from utils import HP_show
+
+SECONDS = 60
+COLOR = (255, 0, 120)
+HP = (3, 3, 2, 2, 2, 1, 1, 1, 1, 3, 3, 3)    # one every 5 s
+
+
+def breathing_color(base_color, t):
+    # utils.breathing_color before pixel_fx
+    breathe = 0.1 + 0.5 * (0.5 + 0.5*math.sin(t/3))
+    r = int(base_color[0] * breathe)
+    g = int(base_color[1] * breathe)
+    b = int(base_color[2] * breathe)
+    return (r, g, b)
+
+
+def helpers(rate):
+    pixels = fakes.RecordingPixels(4, auto_write=True)
+
+    def frame(now, hp):
+        if hp is not None:
+            HP_show(hp, pixels)
+        pixels[0] = breathing_color(COLOR, now * 8)
+        pixels.show()
+    return rate, pixels, frame
+
+
+def effects(rate):
+    pixels = fakes.RecordingPixels(4, auto_write=True)
+    fx = PixelFX(pixels)
+    fx.breathe(0, COLOR, 0.0)
+
+    def frame(now, hp):
+        if hp is not None:
+            HP_show(hp, fx)
+        fx.update(now)
+    return rate, pixels, frame
+
+
+def measure(name, setup):
+    rate, pixels, frame = setup
+    frames = SECONDS * rate
+    hp_every = 5 * rate
+    t0 = time.perf_counter()
+    for f in range(frames):
+        frame(f / rate, HP[f // hp_every] if f % hp_every == 0 else None)
+    dt = time.perf_counter() - t0
+    print("%-10s %5d frames  %6.1f writes/s  %5.2f us/frame"
+          % (name, frames, pixels.transmissions / SECONDS, dt / frames * 1e6))
+
+
+if __name__ == "__main__":
+    measure("10ms loop", helpers(100))
+    measure("task 20Hz", helpers(20))
+    measure("fx 20Hz", effects(20))
+    measure("fx 100Hz", effects(100))
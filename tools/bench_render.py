@@ -0,0 +1,106 @@
+# ============================================================
+#   Host benchmark: in-game screen, rebuild vs retained
+#   run:  python tools/bench_render.py
+# ============================================================
+
+import os
+import sys
+import random
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import fakes
+fakes.install_display_modules()
+
+from oled_renderer import draw_map, draw_text_block, GameScreen
+from lane_map import LaneMap
+
+FRAMES = 400
+STEP_FRAMES = 15     # 1.5 s step_time at 100 ms per frame
+
+
+def make_grid(rows=40, prob=0.3):
+    rnd = random.Random(1)
+    grid = LaneMap(rows)
+    for r in range(rows):
+        grid.set_row(r, sum(1 << c for c in range(5) if rnd.random() < prob))
+    return grid
+
+
+def frames():
+    # (hud, grid, offset, player_col) like game_loop would see them
+    grid = make_grid()
+    offset = len(grid) - 5
+    score = 0
+    player_col = 2
+    for f in range(FRAMES):
+        if f % STEP_FRAMES == 0 and offset > 0:
+            offset -= 1
+            score += 10
+        if f % 40 == 20:
+            player_col = (player_col + 1) % 5
+        hud = "Lv.1    " + str(min(100, f // 3)) + "%    " + str(score)
+        yield hud, grid, offset, player_col
+
+
+def rebuild_text_block(display, text_lines, start_y=10, line_spacing=10):
+    # what draw_text_block did before it pooled its labels
+    import displayio
+    import terminalio
+    from adafruit_display_text import label
+
+    group = displayio.Group()
+    y = start_y
+    for t in text_lines:
+        x = (128 - len(t) * 6) // 2
+        group.append(label.Label(terminalio.FONT, text=t, color=0xFFFFFF, x=x, y=y))
+        y += line_spacing
+    display.root_group = group
+
+
+def run_rebuild(display):
+    for hud, grid, offset, player_col in frames():
+        lines = [hud]
+        lines.extend(draw_map(display, grid, player_col, offset))
+        rebuild_text_block(display, lines)
+
+
+def run_pooled(display):
+    for hud, grid, offset, player_col in frames():
+        lines = [hud]
+        lines.extend(draw_map(display, grid, player_col, offset))
+        draw_text_block(display, lines, align="center", start_pos=(0, 10), line_spacing=10)
+
+
+def run_retained(display):
+    screen = GameScreen(display)
+    screen.show()
+    for hud, grid, offset, player_col in frames():
+        lines = [hud]
+        lines.extend(draw_map(display, grid, player_col, offset))
+        screen.update(lines)
+
+
+def measure(name, fn):
+    display = fakes.RecordingDisplay()
+    fakes.reset_counts()
+    tracemalloc.start()
+    fn(display)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    c = fakes.counts
+    print("%-9s groups/frame %.2f  labels/frame %.2f  text sets/frame %.2f  refreshes/frame %.2f  peak %d B"
+          % (name,
+             c.get("Group", 0) / FRAMES,
+             c.get("Label", 0) / FRAMES,
+             c.get("Label.text", 0) / FRAMES,
+             display.refreshes / FRAMES,
+             peak))
+
+
+if __name__ == "__main__":
+    measure("rebuild", run_rebuild)
+    measure("pooled", run_pooled)
+    measure("retained", run_retained)
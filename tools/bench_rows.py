@@ -0,0 +1,87 @@
+# ============================================================
+#   Host benchmark: map row text, built per call vs table
+#   run:  python tools/bench_rows.py
+#
+#   frames/s of the render path headless:
+#     draw_map   five row strings, what the labels get
+#     render     HudModel.set_map + GameScreen.draw, the map
+#                scrolling one row every frame (worst case)
+# ============================================================
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import fakes
+fakes.install_display_modules()
+
+import lane_map
+from lane_map import LaneMap, LANES
+from oled_renderer import draw_map, GameScreen, HudModel
+
+ROWS = 400
+FRAMES = 20000
+
+
+class BuiltRows(LaneMap):
+    """row_text as it was: fill a bytearray, decode it"""
+
+    def __init__(self, rows=0):
+        LaneMap.__init__(self, rows)
+        self._text = bytearray(lane_map._ROW_TEMPLATE)
+
+    def row_text(self, r, player_col=-1):
+        mask = self.row_mask(r)
+        buf = self._text
+        for c in range(LANES):
+            if c == player_col:
+                buf[1 + 4 * c] = 79        # "O"
+            elif (mask >> c) & 1:
+                buf[1 + 4 * c] = 88        # "X"
+            else:
+                buf[1 + 4 * c] = 32        # " "
+        return str(buf, "ascii")
+
+
+def fill(grid):
+    rnd = random.Random(1)
+    for r in range(len(grid)):
+        grid.set_row(r, sum(1 << c for c in range(LANES) if rnd.random() < 0.3))
+    return grid
+
+
+def frames():
+    for f in range(FRAMES):
+        yield (ROWS - 5) - f % (ROWS - 5), (f // 7) % LANES
+
+
+def bench_draw_map(grid):
+    t0 = time.perf_counter()
+    for offset, player_col in frames():
+        draw_map(None, grid, player_col, offset)
+    return FRAMES / (time.perf_counter() - t0)
+
+
+def bench_render(grid):
+    screen = GameScreen(fakes.RecordingDisplay())
+    screen.show()
+    hud = HudModel()
+    t0 = time.perf_counter()
+    for offset, player_col in frames():
+        hud.set_map(grid, player_col, offset)
+        screen.draw(hud)
+    return FRAMES / (time.perf_counter() - t0)
+
+
+if __name__ == "__main__":
+    old, new = fill(BuiltRows(ROWS)), fill(LaneMap(ROWS))
+    same = all(old.row_text(r, c) == new.row_text(r, c)
+               for r in range(-2, ROWS + 2) for c in range(-1, LANES + 1))
+    print("same text for every row / lane: %s" % same)
+
+    for name, bench in (("draw_map", bench_draw_map), ("render", bench_render)):
+        a, b = bench(old), bench(new)
+        print("%-9s built %8.0f frames/s   table %8.0f frames/s   x%.1f" % (name, a, b, b / a))
@@ -0,0 +1,135 @@
+# ============================================================
+#   Host benchmark: skill use, if/elif methods vs skill table
+#   run:  python tools/bench_skills.py
+#
+#   checks first that the five original characters do the same
+#   thing either way (map, offset, score, step_time), then
+#   times one try_use_skill() per character on a small and a
+#   large LaneMap and an endless MapStream, the map scrolling
+#   one row per use. A clear touches the same few rows whatever
+#   the map size, so the cost should not grow with it.
+# ============================================================
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import character
+from character import CharacterManager
+from game_manager import GameManager
+from lane_map import LaneMap, MapStream, LANES
+
+USES = 20000
+ORIGINAL = 5     # characters that existed before the table
+
+# the "Skill!" line would dominate the timings, left out of both
+character.print = lambda *args: None
+
+
+class IfElifManager(CharacterManager):
+    """try_use_skill as it was: if/elif on the index, one method per skill"""
+
+    def try_use_skill(self, game_manager, grid, offset, player_col):
+        if self.charge < self.max_charge:
+            return None
+        self.charge = 0
+        if self.index == 0:
+            self.skill_homura(game_manager)
+        elif self.index == 1:
+            self.skill_madoka(grid, offset)
+        elif self.index == 2:
+            self.skill_mami(grid, offset, player_col)
+        elif self.index == 3:
+            self.skill_sayaka(game_manager)
+        elif self.index == 4:
+            self.skill_kyoko(game_manager)
+        return None
+
+    def skill_madoka(self, grid, offset):
+        grid.clear_rows(offset, offset + 6)
+
+    def skill_homura(self, game_manager):
+        game_manager.set_step_time(4)
+
+    def skill_sayaka(self, game_manager):
+        game_manager.update_score(200)
+
+    def skill_mami(self, grid, offset, player_col):
+        grid.clear_rows(offset, offset + 10, 1 << player_col)
+
+    def skill_kyoko(self, game_manager):
+        game_manager.update_offset(3)
+
+
+def random_map(rows, seed=1):
+    rnd = random.Random(seed)
+    grid = LaneMap(rows)
+    for r in range(rows):
+        grid.set_row(r, rnd.getrandbits(LANES))
+    return grid
+
+
+def state(gm, grid):
+    return bytes(grid.rows), gm.offset, gm.score, gm.step_time
+
+
+def same_effects(rows=200, trials=200):
+    rnd = random.Random(2)
+    for index in range(ORIGINAL):
+        for _ in range(trials):
+            offset = rnd.randrange(-5, rows)
+            col = rnd.randrange(LANES)
+            results = []
+            for manager in (IfElifManager(), CharacterManager()):
+                gm = GameManager()
+                gm.offset = offset
+                grid = random_map(rows)
+                manager.index = index
+                manager.charge = manager.max_charge
+                manager.try_use_skill(gm, grid, offset, col)
+                results.append(state(gm, grid))
+            if results[0] != results[1]:
+                print("MISMATCH", character.characters[index]["name"], offset, col)
+                return False
+    return True
+
+
+def use_us(manager, index, grid, rows):
+    gm = GameManager()
+    manager.index = index
+    # scrolling like a level: one new row per use, a MapStream
+    # ring then makes one row per use, as in the game
+    rnd = random.Random(3)
+    top = rows - 16
+    spots = [(top - i % top, rnd.randrange(LANES)) for i in range(USES)]
+    full = manager.max_charge
+    t0 = time.perf_counter()
+    for offset, col in spots:
+        manager.charge = full
+        manager.try_use_skill(gm, grid, offset, col)
+    return (time.perf_counter() - t0) / USES * 1e6
+
+
+def main():
+    ok = same_effects()
+    print("original characters, same effects as if/elif: %s" % ("ok" if ok else "FAILED"))
+
+    maps = (("LaneMap 1k", random_map(1000), 1000),
+            ("LaneMap 1M", random_map(1000000), 1000000),
+            ("MapStream", MapStream(7, 0.3), 1 << 20))
+    print("%-8s %-11s %9s %9s" % ("", "map", "if/elif", "table"))
+    for index, c in enumerate(character.characters):
+        for name, grid, rows in maps:
+            old = use_us(IfElifManager(), index, grid, rows) if index < ORIGINAL else None
+            new = use_us(CharacterManager(), index, grid, rows)
+            print("%-8s %-11s %9s %6.2f us" % (
+                c["name"], name, "%6.2f us" % old if old is not None else "-", new))
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
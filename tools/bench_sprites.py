@@ -0,0 +1,49 @@
+# ============================================================
+#   Host benchmark: cost of one knob turn on character select
+#   run:  python tools/bench_sprites.py
+# ============================================================
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import fakes
+fakes.install_display_modules()
+
+from oled_renderer import render_character_select
+from character import CharacterManager
+
+SWITCHES = 500
+
+
+def main():
+    display = fakes.RecordingDisplay()
+    chars = CharacterManager()
+
+    # first lap: anything built lazily gets built here
+    for _ in range(len(chars.list)):
+        render_character_select(display, chars)
+        chars.next()
+
+    fakes.reset_counts()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    for _ in range(SWITCHES):
+        chars.next()
+        render_character_select(display, chars)
+    dt = time.perf_counter() - t0
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    objs = sum(v for k, v in fakes.counts.items() if k != "Label.text")
+    print("per switch: %.1f us  %.1f displayio objects  %d B peak heap  %.2f refreshes"
+          % (dt / SWITCHES * 1e6, objs / SWITCHES, peak, display.refreshes / (SWITCHES + len(chars.list))))
+    for k in sorted(fakes.counts):
+        print("  %-10s %.2f" % (k, fakes.counts[k] / SWITCHES))
+
+
+if __name__ == "__main__":
+    main()
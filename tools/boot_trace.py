@@ -0,0 +1,26 @@
+# ============================================================
+#   Boot trace on a PC: ms per boot stage with the stand-ins
+#   run:  python tools/boot_trace.py
+#
+#   ms are the host's real time (imports, setup, drawing);
+#   t= is the game's virtual clock, where the calibration and
+#   melody waits show up. Run it in a fresh process: modules
+#   imported earlier would make their stage look free.
+# ============================================================
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import run_headless
+
+if __name__ == "__main__":
+    game, hw, wall = run_headless.run(1)
+    for line in game.boot.report():
+        print(line)
+
+    # what the first screen had to wait for vs what came later
+    shown = dict((name, t) for name, _, t in game.boot.stages)
+    print("WELCOME at t=%.2fs, calibrated at t=%.2fs, intro over at t=%.2fs"
+          % (shown["welcome"], shown["calibrated"], shown["intro"]))
@@ -0,0 +1,240 @@
+# ============================================================
+#   Build the board image: every module but code.py as .mpy
+#   run:  python tools/build_mpy.py [--mpy-cross PATH] [--out DIR]
+#                                   [--save FILE] [--compare FILE]
+#
+#   CircuitPython compiles each imported .py at every boot,
+#   in the board's RAM. A .mpy is that bytecode made ahead
+#   of time: copy the contents of build/ to CIRCUITPY.
+#
+#   mpy-cross has to match the CircuitPython release on the
+#   board (the .mpy format changes between majors, a mismatch
+#   fails with "Incompatible .mpy file"). Get the build for
+#   your CircuitPython version from the Adafruit downloads,
+#   then pass it with --mpy-cross or $MPY_CROSS, or put it on
+#   PATH. Without one the .py files are copied as they are,
+#   the board keeps compiling them at boot.
+#
+#   --out may be the CIRCUITPY drive itself: only the files
+#   this build writes are replaced, nothing else there is
+#   touched. scores.txt is not part of the build, copying it
+#   would overwrite the board's saved high scores.
+#
+#   Per module it also prints, measured on this PC:
+#     src      source bytes
+#     code     CPython bytecode bytes (marshal), the closest
+#              host stand-in for the .mpy size
+#     mpy      .mpy bytes (only with mpy-cross)
+#     compile  ms to compile the source: the step .mpy skips
+#     import   ms to import it from source / from bytecode
+#              (python -X importtime, own time, no deps)
+#   --save keeps the sizes, --compare flags a module that
+#   grew more than 10% since.
+# ============================================================
+
+import os
+import sys
+import time
+import shutil
+import marshal
+import tempfile
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# runs from source on the board, CircuitPython looks for code.py
+MAIN = "code.py"
+# host only, never imported on the board
+HOST_ONLY = ("fakes.py",)
+
+GROWTH = 1.10
+
+
+def modules():
+    names = []
+    for name in sorted(os.listdir(ROOT)):
+        if name.endswith(".py") and name != MAIN and name not in HOST_ONLY:
+            names.append(name[:-3])
+    return names
+
+
+# --------------------------------------
+# mpy-cross
+# --------------------------------------
+def find_mpy_cross(path=None):
+    """return: command list, or None"""
+    path = path or os.environ.get("MPY_CROSS")
+    if path:
+        if not os.path.exists(path) and not shutil.which(path):
+            sys.exit("mpy-cross not found at %s" % path)
+        return [path]
+    if shutil.which("mpy-cross"):
+        return ["mpy-cross"]
+    return None
+
+
+def mpy_cross_version(cmd):
+    try:
+        out = subprocess.run(cmd + ["--version"], capture_output=True, text=True)
+    except OSError:
+        return "?"
+    return (out.stdout or out.stderr).strip()
+
+
+def compile_mpy(cmd, name, out_dir):
+    src = os.path.join(ROOT, name + ".py")
+    dst = os.path.join(out_dir, name + ".mpy")
+    # -s: file name in tracebacks without the build machine's path
+    res = subprocess.run(cmd + ["-s", name + ".py", "-o", dst, src],
+                         capture_output=True, text=True)
+    if res.returncode:
+        sys.exit("mpy-cross failed on %s.py:\n%s" % (name, res.stderr))
+    return os.path.getsize(dst)
+
+
+# --------------------------------------
+# host measurements
+# --------------------------------------
+def compile_ms(source, name, repeat=20):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        code = compile(source, name + ".py", "exec")
+    return (time.perf_counter() - t0) * 1000 / repeat, len(marshal.dumps(code))
+
+
+def import_us(names, cache_dir):
+    """own import time per module in us, python -X importtime"""
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=cache_dir)
+    # the second run has to find the first run's bytecode
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    # hal.init() puts the display stand-ins in place first
+    script = ("import sys; sys.path.insert(0, %r); import hal; hal.init(headless=True)\n"
+              "for n in %r: __import__(n)" % (ROOT, names))
+    res = subprocess.run([sys.executable, "-X", "importtime", "-c", script],
+                         capture_output=True, text=True, env=env, cwd=ROOT)
+    if res.returncode:
+        sys.exit("import failed:\n" + res.stderr)
+    own = {}
+    for line in res.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        parts = line.split("|")
+        if len(parts) == 3 and parts[0].startswith("import time:"):
+            try:
+                own[parts[2].strip()] = int(parts[0].split(":")[1])
+            except ValueError:
+                pass
+    return own
+
+
+def import_times(names):
+    """return: ({module: us from source}, {module: us from bytecode})"""
+    cache = tempfile.mkdtemp()
+    cold = import_us(names, cache)     # empty cache: compiles every module
+    warm = import_us(names, cache)     # same cache again: bytecode only
+    shutil.rmtree(cache, ignore_errors=True)
+    return cold, warm
+
+
+def load_sizes(path):
+    """return: (kind, {module: bytes}), kind is "mpy" or "code" """
+    kind, sizes = None, {}
+    with open(path) as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 2 and parts[0] == "kind":
+                kind = parts[1]
+            elif len(parts) == 2:
+                sizes[parts[0]] = int(parts[1])
+    return kind, sizes
+
+
+# --------------------------------------
+# build
+# --------------------------------------
+def main(argv):
+    args = {}
+    i = 0
+    while i < len(argv):
+        if argv[i] in ("--mpy-cross", "--out", "--save", "--compare") and i + 1 < len(argv):
+            args[argv[i][2:]] = argv[i + 1]
+            i += 2
+        else:
+            sys.exit("usage: build_mpy.py [--mpy-cross PATH] [--out DIR]"
+                     " [--save FILE] [--compare FILE]")
+
+    out_dir = os.path.abspath(args.get("out", os.path.join(ROOT, "build")))
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+
+    cmd = find_mpy_cross(args.get("mpy-cross"))
+    if cmd:
+        print("mpy-cross: %s (%s)" % (" ".join(cmd), mpy_cross_version(cmd)))
+    else:
+        print("mpy-cross not found (--mpy-cross, $MPY_CROSS or PATH):")
+        print("  copying .py sources instead, the board compiles them at every boot")
+
+    names = modules()
+    # a .py left from an earlier build would be imported before
+    # the new .mpy; remove this build's own names, nothing else
+    for name in names:
+        for ext in (".py", ".mpy"):
+            if os.path.exists(os.path.join(out_dir, name + ext)):
+                os.remove(os.path.join(out_dir, name + ext))
+    cold, warm = import_times(names)
+
+    rows = []
+    for name in names:
+        with open(os.path.join(ROOT, name + ".py")) as f:
+            source = f.read()
+        ms, code = compile_ms(source, name)
+        if cmd:
+            mpy = compile_mpy(cmd, name, out_dir)
+        else:
+            shutil.copy(os.path.join(ROOT, name + ".py"), out_dir)
+            mpy = None
+        rows.append((name, len(source.encode()), code, mpy, ms,
+                     cold.get(name), warm.get(name)))
+
+    shutil.copy(os.path.join(ROOT, MAIN), out_dir)
+
+    # --- table ---------------------------------------------
+    def us(v):
+        return "%8.2f" % (v / 1000) if v is not None else "       -"
+
+    print("%-15s %7s %7s %7s %8s %8s %8s" % (
+        "module", "src", "code", "mpy", "compile", "imp.src", "imp.pyc"))
+    for name, src, code, mpy, ms, c, w in rows:
+        print("%-15s %7d %7d %7s %8.2f %s %s" % (
+            name, src, code, mpy if mpy is not None else "-", ms, us(c), us(w)))
+    print("%-15s %7d %7d %7s %8.2f %s %s" % (
+        "total", sum(r[1] for r in rows), sum(r[2] for r in rows),
+        sum(r[3] for r in rows) if cmd else "-", sum(r[4] for r in rows),
+        us(sum(r[5] or 0 for r in rows)), us(sum(r[6] or 0 for r in rows))))
+    print("sizes in bytes, times in ms on this PC -> %s" % out_dir)
+
+    # --- regressions ---------------------------------------
+    # .mpy size when there is one, else the CPython stand-in
+    kind = "mpy" if cmd else "code"
+    sizes = dict((r[0], r[3] if cmd else r[2]) for r in rows)
+    grew = []
+    if "compare" in args:
+        before_kind, before = load_sizes(args["compare"])
+        if before_kind != kind:
+            print("not compared: %s holds %s sizes, this build has %s"
+                  % (args["compare"], before_kind, kind))
+            before = {}
+        for name in names:
+            if name in before and sizes[name] > before[name] * GROWTH:
+                grew.append(name)
+                print("grew: %s %d -> %d bytes" % (name, before[name], sizes[name]))
+    if "save" in args:
+        with open(args["save"], "w") as f:
+            f.write("kind %s\n" % kind)
+            for name in names:
+                f.write("%s %d\n" % (name, sizes[name]))
+    if grew:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,98 @@
+# ============================================================
+#   Host check: per-frame allocation stays within GC_BUDGET
+#   run:  python tools/check_memory.py [games]
+#
+#   memory.MemoryManager measures frames with gc.mem_alloc()
+#   on the board. CPython has none, so here a frame's cost is
+#   the tracemalloc peak above what was live when it began:
+#   the most the frame had allocated at any one time.
+#   The first WARMUP frames of a level (new map, first draw)
+#   are left out, the rest have to fit the budget.
+# ============================================================
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import run_headless
+import fakes
+import memory
+
+WARMUP = 3
+
+# the buzzer and I2C logs grow with every note / page write,
+# not something the board does
+
+
+def _i2c_write(self, address, buffer, *, start=0, end=None):
+    self.bytes_sent += (len(buffer) if end is None else end) - start
+
+
+fakes.RecordingPWM._record = lambda self, name, value: None
+fakes.RecordingI2C.writeto = _i2c_write
+
+
+def _frame_mark(self):
+    tracemalloc.reset_peak()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _frame_used(self, mark):
+    return tracemalloc.get_traced_memory()[1] - mark
+
+
+def measure(games, framebuffer=False):
+    """return: (budget, list of per-level lists of frame bytes)"""
+    levels = []
+    frame_end = memory.MemoryManager.frame_end
+    reset = memory.MemoryManager.reset
+
+    def recording_end(self):
+        used = frame_end(self)
+        if used is not None:
+            levels[-1].append(used)
+        return used
+
+    def recording_reset(self):
+        levels.append([])
+        reset(self)
+
+    memory.MemoryManager._frame_mark = _frame_mark
+    memory.MemoryManager._frame_used = _frame_used
+    memory.MemoryManager.frame_end = recording_end
+    memory.MemoryManager.reset = recording_reset
+    tracemalloc.start()
+    try:
+        # FakeAccelerometer: the ADXL345 register model's own
+        # bookkeeping would land in the frames
+        game, hw, wall = run_headless.run(games, framebuffer=framebuffer, accel_gestures=False)
+    finally:
+        tracemalloc.stop()
+        memory.MemoryManager.frame_end = frame_end
+        memory.MemoryManager.reset = reset
+    return game.GC_BUDGET, [frames for frames in levels if frames]
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    failures = 0
+    for name, framebuffer in (("labels", False), ("framebuffer", True)):
+        budget, levels = measure(games, framebuffer)
+        steady = [used for frames in levels for used in frames[WARMUP:]]
+        over = [used for used in steady if used > budget]
+        print("%-12s levels %d  frames %d  mean %5d B  max %5d B  budget %d B  over %d"
+              % (name, len(levels), len(steady), sum(steady) // max(1, len(steady)),
+                 max(steady or [0]), budget, len(over)))
+        if not steady or over:
+            failures += 1
+
+    if failures:
+        print("FAILED")
+        sys.exit(1)
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# ============================================================
+#   Host check: score_log.ScoreLog
+#   run:  python tools/check_score_log.py
+# ============================================================
+
+import os
+import sys
+import time
+import struct
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from score_log import ScoreLog, RECORD, RECORD_SIZE, HEADER_SIZE
+
+failures = []
+
+
+def check(name, ok):
+    print("%-46s %s" % (name, "ok" if ok else "FAIL"))
+    if not ok:
+        failures.append(name)
+
+
+def fresh():
+    return os.path.join(tempfile.mkdtemp(), "runs.bin")
+
+
+def record(i):
+    return i % 5, i % 3, 100 * (i % 7) - 50, 1 + i % 10, 60 + i
+
+
+def fill(path, n, **kw):
+    log = ScoreLog(path, **kw)
+    for i in range(n):
+        log.add(*record(i))
+    return log
+
+
+class Reset(Exception):
+    pass
+
+
+def reset(*args):
+    raise Reset()
+
+
+def totals(log):
+    s = log.summary
+    return (s.games, s.total_score, s.best_score, s.seconds, s.levels,
+            s.char_games, s.char_best, s.diff_games)
+
+
+def main():
+    # --- round trip ------------------------------------------
+    path = fresh()
+    log = fill(path, 20)
+    again = ScoreLog(path)
+    check("summary survives reload", totals(again) == totals(log))
+    check("records readable", len(list(again.read())) == 20)
+    check("record size", os.path.getsize(path) == HEADER_SIZE + 20 * RECORD_SIZE)
+    check("two flash writes per game", log.writes == 40)
+
+    # --- summary is O(1): load does not scan the log ---------
+    small, big = fresh(), fresh()
+    fill(small, 10, max_records=100000)
+    fill(big, 5000, max_records=100000)
+    reads = []
+    real_read = ScoreLog.read
+
+    def counting_read(self, start=0):
+        reads.append(start)
+        return real_read(self, start)
+
+    ScoreLog.read = counting_read
+    try:
+        t0 = time.perf_counter()
+        for _ in range(200):
+            ScoreLog(small)
+        t_small = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for _ in range(200):
+            ScoreLog(big)
+        t_big = time.perf_counter() - t0
+    finally:
+        ScoreLog.read = real_read
+    print("  load: 10 games %.3f ms, 5000 games %.3f ms" % (t_small / 0.2, t_big / 0.2))
+    check("load never reads the log", reads == [])
+
+    # --- resets --------------------------------------------
+    path = fresh()
+    log = fill(path, 5)
+    expect = fill(fresh(), 6)
+    with open(path, "ab") as f:          # appended, summary not written
+        f.write(struct.pack(RECORD, 0, 2, 100 * 5 - 50, 6, 65))
+    check("reset after append: record folded in",
+          totals(ScoreLog(path)) == totals(expect))
+
+    path = fresh()
+    log = fill(path, 5)
+    with open(path, "ab") as f:          # torn record
+        f.write(b"\x01\x02\x03")
+    log = ScoreLog(path)
+    log.add(4, 0, 10, 1, 5)
+    check("torn record dropped, appends stay aligned",
+          list(log.read())[-1] == (4, 0, 10, 1, 5) and log.records == 6)
+
+    path = fresh()
+    log = fill(path, 8)
+    with open(path[:-4] + ".sum", "wb") as f:
+        f.write(b"garbage")
+    check("broken summary rebuilt from the log", totals(ScoreLog(path)) == totals(log))
+
+    path = fresh()
+    with open(path, "wb") as f:
+        f.write(b"not a log at all")
+    log = ScoreLog(path)
+    log.add(1, 1, 5, 1, 1)
+    check("foreign file replaced", log.records == 1 and list(log.read()) == [(1, 1, 5, 1, 1)])
+
+    # --- compaction ------------------------------------------
+    path = fresh()
+    log = fill(path, 100, max_records=32, keep_records=8)
+    full = fill(fresh(), 100, max_records=100000)
+    check("compaction keeps lifetime totals", totals(log) == totals(full))
+    check("log stays bounded", log.records <= 32)
+    check("newest records kept", list(log.read())[-1] == list(full.read())[-1])
+    check("reload after compaction", totals(ScoreLog(path, max_records=32)) == totals(full))
+
+    path = fresh()
+    log = fill(path, 32, max_records=32, keep_records=8)
+    log.compact()                        # reset right after the log swap
+    check("reset after compaction: lifetime totals kept",
+          totals(ScoreLog(path, max_records=32)) == totals(fill(fresh(), 32)))
+
+    path = fresh()
+    log = fill(path, 32, max_records=32, keep_records=8)
+    log._write_summary = reset           # reset before the summary write
+    try:
+        log.add(*record(32))             # compacts, then appends
+    except Reset:
+        pass
+    log = ScoreLog(path, max_records=32)
+    check("reset mid-add after compaction: totals kept",
+          totals(log) == totals(fill(fresh(), 33)) and log.summary.covered == 33)
+
+    # --- a real session ----------------------------------------
+    import run_headless
+    game, hw, wall = run_headless.run(3)
+    log = game.score_log
+    print("  headless: " + " | ".join(log.stats_lines(
+        [c["name"] for c in game.char_manager.list],
+        [d["name"] for d in game.game_manager.difficulties])))
+    check("headless games logged", log.summary.games == 3 and log.records == 3)
+
+    if failures:
+        print("%d FAILED" % len(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# ============================================================
+#   Host check: ScoreManager on broken files + flash writes
+#   run:  python tools/check_scores.py
+# ============================================================
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from score_manager import ScoreManager
+
+failures = []
+
+
+def check(name, ok):
+    print("%-44s %s" % (name, "ok" if ok else "FAIL"))
+    if not ok:
+        failures.append(name)
+
+
+def write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def main():
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "scores.txt")
+
+    # --- loading ---------------------------------------------
+    sm = ScoreManager(path)
+    check("missing file: empty board, nothing written",
+          sm.board == [] and sm.writes == 0 and not os.path.exists(path))
+
+    write(path, b"Madoka,200\nHomura,0\nSayaka,0")
+    sm = ScoreManager(path)
+    check("old format (no trailing newline)",
+          sm.board == [("Madoka", 200), ("Homura", 0), ("Sayaka", 0)]
+          and sm.best("Madoka") == 200)
+
+    write(path, b"\n\nMadoka,200\n  \ngarbage\nMami,abc\n,50\nKyouko,90\nSaya")
+    sm = ScoreManager(path)
+    check("blank / broken / truncated lines skipped",
+          sm.board == [("Madoka", 200), ("Kyouko", 90)] and sm.skipped == 4)
+
+    write(path, b"\xff\xfe\x00\x01Mad\x00oka,\xff\n")
+    sm = ScoreManager(path)
+    check("binary garbage: empty board, no crash", sm.board == [])
+
+    write(path, b"")
+    sm = ScoreManager(path)
+    check("empty file", sm.board == [] and sm.get_highscore_display() == ["-----"])
+
+    os.remove(path)
+    write(path + ".tmp", b"Mami,300\n*Mami,300\n")
+    sm = ScoreManager(path)
+    check("reset mid-save: recovered from .tmp", sm.board == [("Mami", 300)])
+
+    # --- board -----------------------------------------------
+    os.remove(path + ".tmp")
+    sm = ScoreManager(path, top=5)
+    for name, score in [("A", 10), ("B", 50), ("C", 30), ("D", 50), ("E", 5), ("F", 40)]:
+        sm.add_score(name, score)
+    check("top 5 kept high -> low, ties keep order",
+          sm.board == [("B", 50), ("D", 50), ("F", 40), ("C", 30), ("A", 10)])
+    check("not on the board -> False", sm.add_score("G", 1) is False)
+    check("per-character best even off the board", sm.best("G") == 1)
+
+    writes = sm.writes
+    sm.add_score("G", 0)
+    check("no change -> no flash write", sm.writes == writes)
+
+    sm2 = ScoreManager(path, top=5)
+    check("reload: board and bests survive",
+          sm2.board == sm.board and sm2.bests == sm.bests)
+    check("no .tmp left behind", not os.path.exists(path + ".tmp"))
+    check("display lines",
+          sm2.get_highscore_display()[:2] == ["1 B 50", "2 D 50"])
+
+    # --- flash writes per game (headless, virtual clock) ---------
+    import run_headless
+    games = 3
+    game, hw, wall = run_headless.run(games)
+    sm = game.score_manager
+    print("headless: %d games, %d flash writes, board %s" % (games, sm.writes, sm.board))
+    check("at most one flash write per game", sm.writes <= games)
+
+    if failures:
+        print("%d FAILED" % len(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# ============================================================
+#   Host check: the asyncio task runtime
+#   run:  python tools/check_tasks.py [games]
+#
+#   full games on the virtual clock (hal.run -> fakes.run_virtual):
+#     - they finish: a deadlock (every task waiting, no timer)
+#       stops run_virtual with an error instead of hanging
+#     - moves / screens / leds never drop an item; a dropped
+#       ("play",) or ("hp", n) would be a lost screen / LED state.
+#       knob_q may drop: the fake knob turns during play too,
+#       the menus clear it when they start
+#     - an error in a background task comes out of main()
+# ============================================================
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import run_headless
+import hal
+
+LOSSLESS = ("moves", "screens", "leds")
+
+
+def check(name, ok):
+    print("%-44s %s" % (name, "ok" if ok else "FAILED"))
+    return ok
+
+
+def queues(games):
+    game, hw, wall = run_headless.run(games)
+    print("games %d  levels %d  virtual %.1f s  wall %.2f s"
+          % (games, game.game_manager.level_count, hw.clock(), wall))
+    for name in ("knob_q",) + LOSSLESS:
+        q = getattr(game, name)
+        print("  %-8s size %2d  dropped %d" % (name, q.size, q.dropped))
+    return [getattr(game, name).dropped for name in LOSSLESS]
+
+
+def task_error():
+    game = run_headless.load_game()
+
+    def broken(*args):
+        raise ValueError("led task broke")
+
+    game.HP_show = broken
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        game.main(hal.load(), games=1)
+    except ValueError:
+        return True
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    return False
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    ok = check("games finish, nothing lost between tasks", not any(queues(games)))
+    ok = check("background task error reaches main()", task_error()) and ok
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# ============================================================
+#   Profile the game loop headless (real CPU time per span)
+#   run:  python tools/profile_game.py [games]
+#
+#   the game runs on the virtual clock, spans are timed with
+#   the host's monotonic_ns, so they show what each phase
+#   costs in CPython, not on the board
+# ============================================================
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import run_headless
+import profiler
+
+reports = []
+
+
+def keep(self, title=None):
+    reports.append((title, self.report()))
+
+
+if __name__ == "__main__":
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+
+    _, _, off = run_headless.run(games, settings={"PROFILE": False})
+
+    # level-end dumps go to the list instead of the (muted) console
+    profiler.Profiler.dump = keep
+    game, hw, on = run_headless.run(games, settings={"PROFILE": True})
+
+    for title, lines in reports[-3:]:
+        print("--- profile:", title, "---")
+        for line in lines:
+            print("  " + line)
+    print("levels profiled: %d" % len(reports))
+    print("wall: profiler off %.3f s, on %.3f s" % (off, on))
@@ -0,0 +1,70 @@
+# ============================================================
+#   Record / replay a session headless
+#   python tools/replay.py record out.bin [seed]   scripted player
+#   python tools/replay.py play out.bin            as fast as possible
+# ============================================================
+
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import run_headless
+from replay import InputLog, Recorder, Replayer
+
+REST = (0.0, 0.0, 9.8)
+
+
+def scripted_samples(seed, n=20000):
+    """accelerometer stream with random tilts and shakes (10 Hz)"""
+    rnd = random.Random(seed)
+    samples = [REST] * 30                # calibration
+    while len(samples) < n:
+        roll = rnd.random()
+        if roll < 0.08:
+            x = 6.0 if rnd.random() < 0.5 else -6.0
+            samples += [(x, 0.0, 9.8)] * 4 + [REST] * 6
+        elif roll < 0.10:
+            samples += [(0.0, 0.0, 25.0), (0.0, 0.0, -6.0)] * 3
+        else:
+            samples.append(REST)
+    return samples
+
+
+def summary(game, hw, wall):
+    gm = game.game_manager
+    ticks = game.sched.ticks
+    print("seed %d  score %d  levels %d  virtual %.1f s  wall %.3f s"
+          % (gm.seed, gm.get_score(), gm.level_count, hw.clock(), wall))
+    return gm.get_score(), gm.level_count, hw.clock()
+
+
+def record(path, seed):
+    log = InputLog(seed)
+    game, hw, wall = run_headless.run(1, input_tape=Recorder(log),
+                                      accel_samples=scripted_samples(seed))
+    log.save(path)
+    print("recorded %d ticks, %d knob events -> %s (%d bytes)"
+          % (len(log.ticks), len(log.knob), path, os.path.getsize(path)))
+    return summary(game, hw, wall)
+
+
+def play(path):
+    log = InputLog.load(path)
+    tape = Replayer(log)
+    game, hw, wall = run_headless.run(1, input_tape=tape)
+    print("replayed %d ticks in %.3f s wall (%.0f ticks/s)"
+          % (len(log.ticks), wall, len(log.ticks) / wall))
+    return summary(game, hw, wall)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] not in ("record", "play"):
+        print(__doc__ or "usage: replay.py record|play FILE [seed]")
+        sys.exit(1)
+    path = os.path.abspath(sys.argv[2])
+    if sys.argv[1] == "record":
+        record(path, int(sys.argv[3]) if len(sys.argv) > 3 else 1)
+    else:
+        play(path)
@@ -0,0 +1,65 @@
+# ============================================================
+#   Run the whole game on a PC with the hal.py stand-ins
+#   run:  python tools/run_headless.py [games]
+# ============================================================
+
+import os
+import sys
+import time
+import tempfile
+import importlib.util
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import hal
+
+
+def load_game():
+    # code.py clashes with the stdlib `code` module, load it by path
+    hal.init(headless=True)
+    spec = importlib.util.spec_from_file_location("game_main", os.path.join(ROOT, "code.py"))
+    game = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(game)
+    return game
+
+
+def run(games=1, quiet=True, input_tape=None, settings=None, **host_options):
+    """
+    play `games` full runs on a virtual clock
+    settings: code.py constants to override, e.g. {"PROFILE": True}
+    return: (game module, hardware, wall seconds)
+    """
+    game = load_game()
+    for name, value in (settings or {}).items():
+        setattr(game, name, value)
+    hw = hal.load(**host_options)
+
+    # keep scores.txt of the repo untouched
+    cwd = os.getcwd()
+    tmp = tempfile.mkdtemp()
+    os.chdir(tmp)
+
+    stdout = sys.stdout
+    if quiet:
+        sys.stdout = open(os.devnull, "w")
+    t0 = time.perf_counter()
+    try:
+        game.main(hw, games=games, input_tape=input_tape)
+    finally:
+        wall = time.perf_counter() - t0
+        if quiet:
+            sys.stdout.close()
+            sys.stdout = stdout
+        os.chdir(cwd)
+    return game, hw, wall
+
+
+if __name__ == "__main__":
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    game, hw, wall = run(games)
+    print("games: %d  virtual time: %.1f s  wall time: %.2f s" % (games, hw.clock(), wall))
+    # FifoADXL345 counts bus transactions, FakeAccelerometer reads
+    accel_io = getattr(hw.accel, "transactions", getattr(hw.accel, "reads", 0))
+    print("display refreshes: %d  neopixel writes: %d  buzzer changes: %d  accel I2C: %d"
+          % (hw.display.refreshes, hw.pixels.transmissions, len(hw.buzzer.log), accel_io))
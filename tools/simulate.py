@@ -0,0 +1,287 @@
+# ============================================================
+#   Offline difficulty simulator (host only, needs NumPy)
+#
+#   generates the exact maps MapStream would produce for many
+#   level seeds at once, then steps every level in lock-step:
+#   one array op per row for the whole batch
+#
+#   python tools/simulate.py                       all difficulties x skills
+#   python tools/simulate.py --levels 200000 --policy random
+#   python tools/simulate.py --difficulty Hard --sweep-prob 0.2:0.4:0.05
+#   python tools/simulate.py --check               compare maps with lane_map.py
+# ============================================================
+
+import os
+import sys
+import time
+import argparse
+
+try:
+    import numpy as np
+except ImportError:
+    print("tools/simulate.py needs NumPy: pip install numpy")
+    sys.exit(1)
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from game_manager import GameManager
+from character import characters, make_skill, LANE_MASKS
+from lane_map import LANES, FULL
+
+MASK30 = np.uint32(0x3FFFFFFF)
+GOLDEN30 = np.uint32(0x278DDE6D)
+MUL15 = np.uint32(0x5BD1)
+
+# same numbers as code.py / input_manager.py
+LANE_CD = 1.0             # Accelerator.lane_cd, one lane change per second
+START_COL = 2
+
+
+# ------------------------------------------------------------
+#   maps (bit-exact with lane_map.MapStream)
+# ------------------------------------------------------------
+
+def mix30(x):
+    x = np.asarray(x, dtype=np.uint32) & MASK30
+    x[x == 0] = GOLDEN30
+    for _ in range(2):
+        x ^= (x << np.uint32(13)) & MASK30
+        x ^= x >> np.uint32(17)
+        x ^= (x << np.uint32(5)) & MASK30
+        x = ((x & np.uint32(0x7FFF)) * MUL15) ^ (x >> np.uint32(15))
+    return x
+
+
+def generate_maps(seeds, rows, prob):
+    """return: (len(seeds), rows) uint8 lane masks"""
+    r = np.arange(rows, dtype=np.uint32)
+    h = mix30((seeds[:, None] & MASK30) ^ r[None, :])
+    h2 = mix30(h ^ GOLDEN30)
+
+    threshold = int(prob * 256)
+    masks = np.zeros(h.shape, dtype=np.uint8)
+    for c in range(LANES):
+        if c < 3:
+            byte = (h >> np.uint32(8 * c)) & np.uint32(0xFF)
+        else:
+            byte = (h2 >> np.uint32(8 * (c - 3))) & np.uint32(0xFF)
+        masks |= (byte < threshold).astype(np.uint8) << np.uint8(c)
+
+    # 1 space (easier)
+    full = masks == FULL
+    free = ((h2 >> np.uint32(16)) % np.uint32(LANES)).astype(np.uint8)
+    masks[full] ^= (np.uint8(1) << free[full])
+    return masks
+
+
+def level_seeds(run_seed, n):
+    # GameManager: mix30(seed ^ level_count), level_count from 1
+    return mix30(np.uint32(run_seed) ^ np.arange(1, n + 1, dtype=np.uint32))
+
+
+# ------------------------------------------------------------
+#   player policies: pick a lane for the row under the player
+# ------------------------------------------------------------
+
+def policy_idle(col, row_mask, reach, rng):
+    return col
+
+
+def policy_random(col, row_mask, reach, rng):
+    move = rng.integers(-1, 2, size=col.shape) * (rng.random(col.shape) < 0.3)
+    return np.clip(col + move, 0, LANES - 1)
+
+
+def policy_dodge(col, row_mask, reach, rng):
+    # stay if free, else nearest free lane within reach (left first)
+    chosen = col.copy()
+    done = ((row_mask >> col) & 1) == 0
+    for d in range(1, int(reach.max()) + 1):
+        for sign in (-1, 1):
+            cand = col + sign * d
+            ok = (~done) & (d <= reach) & (cand >= 0) & (cand < LANES)
+            ok &= ((row_mask >> np.clip(cand, 0, LANES - 1)) & 1) == 0
+            chosen[ok] = cand[ok]
+            done |= ok
+    return chosen
+
+
+POLICIES = {"idle": policy_idle, "random": policy_random, "dodge": policy_dodge}
+
+
+# ------------------------------------------------------------
+#   batch level simulation (one step = one row, like tick())
+# ------------------------------------------------------------
+
+def simulate(maps, step_time, skill, policy, rng, start_charge=0):
+    """skill: character.make_skill()[2] or None"""
+    n, rows = maps.shape
+    grid = maps.copy()
+    idx = np.arange(n)
+
+    offset = np.full(n, rows, dtype=np.int64)
+    col = np.full(n, START_COL, dtype=np.int64)
+    score = np.zeros(n, dtype=np.int64)
+    charge = np.full(n, start_charge, dtype=np.int64)
+    cooldown = np.zeros(n, dtype=np.int64)
+    active = np.zeros(n, dtype=np.int64)
+    hits = np.zeros(n, dtype=np.int64)
+    seconds = np.zeros(n)
+    step = np.full(n, step_time)
+    alive = offset > 0
+    rate = skill["charge"] if skill else 5
+    if skill and skill["effect"] == "clear":
+        lane_masks = np.array(LANE_MASKS[skill["lanes"]], dtype=np.int64)
+
+    def row_under(off):
+        pr = off + 4
+        inside = pr < rows
+        masks = np.zeros(n, dtype=np.int64)
+        masks[inside] = grid[idx[inside], pr[inside]]
+        return pr, inside, masks
+
+    def clear_rows(sel, start, count, lanes):
+        # grid[level, start..start+count-1] &= ~lanes for selected levels
+        if not sel.any():
+            return
+        lv = idx[sel]
+        rr = start[sel][:, None] + np.arange(count)[None, :]
+        ok = (rr >= 0) & (rr < rows)
+        lv = np.broadcast_to(lv[:, None], rr.shape)[ok]
+        keep = (FULL ^ np.broadcast_to(lanes[sel][:, None], rr.shape)[ok]).astype(np.uint8)
+        grid[lv, rr[ok]] &= keep
+
+    while alive.any():
+        # map moves forward 1 row
+        offset[alive] -= 1
+        score[alive] += 10
+        # CharacterManager.step(): timed effect, cooldown, charge
+        ending = alive & (active == 1)
+        step[ending] = step_time
+        active[alive & (active > 0)] -= 1
+        charging = alive & (cooldown == 0)
+        cooldown[alive & (cooldown > 0)] -= 1
+        charge[charging] = np.minimum(100, charge[charging] + rate)
+        seconds[alive] += step[alive]
+
+        # lane choice for the new row (one lane change per LANE_CD)
+        reach = np.maximum(1, (step / LANE_CD).astype(np.int64))
+        _, _, masks = row_under(offset)
+        new_col = policy(col, masks, reach, rng)
+        col = np.where(alive, new_col, col)
+
+        # skill as soon as it is charged (character.EFFECTS)
+        use = alive & (charge >= 100) & (skill is not None)
+        if use.any():
+            charge[use] = 0
+            cooldown[use] = skill["cooldown"]
+            effect = skill["effect"]
+            if effect == "slow":
+                step[use] = skill["step_time"]
+                active[use] = skill["duration"]
+            elif effect == "clear":
+                clear_rows(use, offset, skill["rows"], lane_masks[col])
+            elif effect == "score":
+                score[use] += skill["amount"]
+            elif effect == "dash":
+                offset[use] -= skill["rows"]
+
+        # collision, the cell is cleared after a hit
+        pr, inside, masks = row_under(offset)
+        hit = alive & inside & (pr >= 0) & (((masks >> col) & 1) == 1)
+        score[hit] -= 50
+        hits[hit] += 1
+        grid[idx[hit], pr[hit]] &= (FULL ^ (1 << col[hit])).astype(np.uint8)
+
+        alive &= offset > 0
+
+    return score, hits, seconds
+
+
+# what each skill does, from character.py
+SKILLS = dict((c["name"], make_skill(c)[2]) for c in characters)
+
+
+def report(name, score, hits, seconds):
+    p10, p50, p90 = np.percentile(score, [10, 50, 90])
+    print("  %-8s survive %5.1f%%  score mean %6.1f  p10/p50/p90 %5d/%5d/%5d  hits %.2f  level %.0f s"
+          % (name, 100.0 * (score >= 0).mean(), score.mean(), p10, p50, p90, hits.mean(), seconds.mean()))
+
+
+def run(difficulty, levels, policy_name, seed, start_charge, skills):
+    rng = np.random.default_rng(seed)
+    maps = generate_maps(level_seeds(seed, levels), difficulty["rows"], difficulty["prob"])
+    print("%s: rows %d  prob %.2f  step %.1f s  policy %s  levels %d"
+          % (difficulty["name"], difficulty["rows"], difficulty["prob"],
+             difficulty["step_time"], policy_name, levels))
+    for name in skills:
+        skill = SKILLS.get(name)
+        result = simulate(maps, difficulty["step_time"], skill, POLICIES[policy_name], rng, start_charge)
+        report(name, *result)
+
+
+def check(n=200):
+    """maps here must match lane_map.MapStream row for row"""
+    from lane_map import MapStream
+    gm = GameManager()
+    for d in gm.difficulties:
+        seeds = level_seeds(gm.seed, n)
+        maps = generate_maps(seeds, d["rows"], d["prob"])
+        for i in range(n):
+            stream = MapStream(int(seeds[i]), d["prob"], d["rows"])
+            expect = [stream.row_mask(r) for r in range(d["rows"])]
+            if list(maps[i]) != expect:
+                print("MISMATCH", d["name"], "level", i)
+                return False
+    print("maps match lane_map.MapStream (%d levels per difficulty)" % n)
+    return True
+
+
+def main():
+    gm = GameManager()
+    names = [d["name"] for d in gm.difficulties]
+
+    ap = argparse.ArgumentParser(description="batch difficulty simulator")
+    ap.add_argument("--levels", type=int, default=100000)
+    ap.add_argument("--policy", choices=sorted(POLICIES), default="dodge")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--charge", type=int, default=0, help="charge carried into the level")
+    ap.add_argument("--difficulty", choices=names)
+    ap.add_argument("--rows", type=int)
+    ap.add_argument("--prob", type=float)
+    ap.add_argument("--step-time", type=float)
+    ap.add_argument("--sweep-prob", metavar="A:B:STEP")
+    ap.add_argument("--check", action="store_true")
+    args = ap.parse_args()
+
+    if args.check:
+        sys.exit(0 if check() else 1)
+
+    skills = ["none"] + [c["name"] for c in characters]
+    chosen = [d for d in gm.difficulties if args.difficulty in (None, d["name"])]
+
+    t0 = time.perf_counter()
+    simulated = 0
+    for d in chosen:
+        d = dict(d)
+        for key in ("rows", "prob", "step_time"):
+            value = getattr(args, key)
+            if value is not None:
+                d[key] = value
+
+        probs = [d["prob"]]
+        if args.sweep_prob:
+            a, b, s = (float(v) for v in args.sweep_prob.split(":"))
+            probs = list(np.arange(a, b + s / 2, s))
+
+        for p in probs:
+            d["prob"] = float(p)
+            run(d, args.levels, args.policy, args.seed, args.charge, skills)
+            simulated += args.levels * len(skills)
+
+    dt = time.perf_counter() - t0
+    print("simulated %d levels in %.1f s (%.0f levels/min)" % (simulated, dt, simulated / dt * 60))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,3 @@
-import board
-import pwmio
-import time
-import math
-
 open_melody = [
     (0,     0.50),   
     (392,   0.25),  
@@ -72,27 +67,8 @@ hurt_sound = [(370, 0.5)]
 pass_sound = [(370, 0.5), (0, 0.1),(220, 0.25), (294, 0.5), (330, 0.5), (220, 0.5),(277, 0.5), (0, 0.1)]
 skill_sound = [(294, 0.25), (370, 0.25), (440, 0.5)]
 
-def tone(pin, freq, duration):
-    if freq == 0:
-        time.sleep(duration)
-        return
-    b = pwmio.PWMOut(pin, frequency=freq, duty_cycle=32768)
-    time.sleep(duration)
-    b.deinit()
-
-def play_melody(melody):
-    for freq, dur in melody:
-        tone(board.D7, freq, dur)
-        time.sleep(0.02)
-
-def breathing_color(base_color, t):
-    breathe = 0.1 + 0.5 * (0.5 + 0.5*math.sin(t/3))
-    r = int(base_color[0] * breathe)
-    g = int(base_color[1] * breathe)
-    b = int(base_color[2] * breathe)
-    return (r, g, b)
-
 def HP_show(HP,pixels):
+    # pixels: a pixel_fx.PixelFX, unchanged HP sends nothing
     for i in range(HP):
         pixels[i+1]=(150,150,150)
     for i in range(HP,3):